@@ -0,0 +1,24 @@
+# backend/core/asgi_urls.py
+"""
+URLs del proceso ASGI (ROOT_URLCONF cuando ASYNC_READ_VIEWS está activo, ver
+core/settings.py): las mismas rutas y nombres que core/urls.py, pero los GET más
+usados los sirven las vistas asíncronas de core/async_views.py. Las rutas de
+esta lista se resuelven antes que las de core/urls.py; el resto de métodos
+de esas rutas los atiende la vista síncrona original.
+"""
+from django.urls import path
+from properties.views import (
+    PropertyListCreateAsyncView, PropertyRetrieveAsyncView, BillingCycleListCreateAsyncView,
+    BillingCycleRetrieveAsyncView, ExpenseListCreateAsyncView
+)
+from tenants.views import TenancyListCreateAsyncView
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path('api/properties/', PropertyListCreateAsyncView.as_view(), name='property-list-create'),
+    path('api/properties/<int:pk>/', PropertyRetrieveAsyncView.as_view(), name='property-detail'),
+    path('api/properties/<int:property_id>/billing-cycles/', BillingCycleListCreateAsyncView.as_view(), name='billing-cycle-list-create'),
+    path('api/billing-cycles/<int:pk>/', BillingCycleRetrieveAsyncView.as_view(), name='billing-cycle-detail'),
+    path('api/billing-cycles/<int:cycle_id>/expenses/', ExpenseListCreateAsyncView.as_view(), name='expense-list-create'),
+    path('api/units/<int:unit_id>/tenancies/', TenancyListCreateAsyncView.as_view(), name='tenancy-list-create'),
+] + sync_urlpatterns
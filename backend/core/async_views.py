@@ -0,0 +1,197 @@
+# backend/core/async_views.py
+"""
+Camino de lectura asíncrono (ASGI) para los GET más usados.
+
+Cada AsyncReadView sustituye en core/asgi_urls.py a una vista DRF síncrona
+(sync_view) con la misma ruta y el mismo nombre. Los GET autenticados con
+JWT se resuelven con el ORM asíncrono (aget, aaggregate, aiterator), de modo
+que una consulta lenta no ocupa un hilo del servidor mientras espera; la
+serialización trabaja sobre objetos ya cargados con select_related o
+prefetch_related y nunca consulta la base de datos (si lo intentara, Django
+lanzaría SynchronousOnlyOperation).
+
+La respuesta se construye con la propia vista síncrona (negociación de
+contenido, permisos, cabeceras y renderizado), se guarda en la misma caché
+de respuestas, bajo la misma clave, y lleva el mismo ETag, así que es
+idéntica byte a byte a la del camino WSGI. Todo lo demás -otros métodos,
+peticiones sin credenciales o con errores (401, 404, cursor inválido), la API
+navegable- se delega en la vista síncrona, que responde exactamente igual
+que bajo WSGI.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from .authentication import validated_token
+from .conditional import ConditionalGetMixin, aaggregate_state, set_validators, validators
+from .ownership import OwnedObjectMixin
+from .response_cache import CachedResponseMixin, ResponseCache
+
+# Filas por lectura de los listados completos con aiterator().
+ITERATOR_CHUNK_SIZE = 500
+
+
+async def aauthenticate(request):
+    """
+    Usuario del token JWT de la petición, con las mismas comprobaciones que
+    JWTAuthentication, o None si no hay credenciales válidas (la vista
+    síncrona responde entonces el 401 correspondiente).
+    """
+    # APIClient.force_authenticate en las pruebas, igual que en rest_framework.request.Request.
+    force_user = getattr(request, '_force_auth_user', None)
+    if force_user is not None:
+        return force_user
+
+    token = validated_token(request)
+    user_id = None if token is None else token.get(jwt_settings.USER_ID_CLAIM)
+    if user_id is None:
+        return None
+
+    user = await get_user_model().objects.filter(**{jwt_settings.USER_ID_FIELD: user_id}).afirst()
+    if user is None or (jwt_settings.CHECK_USER_IS_ACTIVE and not user.is_active):
+        return None
+    if (jwt_settings.CHECK_REVOKE_TOKEN
+            and token.get(jwt_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password)):
+        return None
+    return user
+
+
+class AsyncReadView(OwnedObjectMixin, View):
+    """
+    Versión asíncrona de los GET de sync_view.
+
+    Las subclases implementan get_data(), que devuelve los datos serializados
+    (o lanza Http404), y, si sync_view usa la caché de respuestas,
+    get_response_cache_scope() como corrutina. El GET condicional y la caché
+    se aplican si sync_view los aplica, con su consulta de estado y su nombre.
+    """
+    sync_view = None
+    sync_handler = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # La vista DRF ya está exenta de CSRF; esta la envuelve.
+        return csrf_exempt(super().as_view(sync_handler=cls.sync_view.as_view(), **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD'):
+            response = await self.get(request, *args, **kwargs)
+            if response is not None:
+                return response
+        return await sync_to_async(self.sync_handler)(request, *args, **kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        """Responde el GET, o devuelve None para que lo haga la vista síncrona."""
+        user = await aauthenticate(request)
+        if user is None:
+            return None
+
+        # Los mismos pasos que as_view() y APIView.dispatch hasta llegar al handler.
+        self.view = view = self.sync_view()
+        view.setup(request, *args, **kwargs)
+        self.drf_request = view.request = view.initialize_request(request, *args, **kwargs)
+        view.headers = view.default_response_headers
+        self.drf_request.user = user
+        try:
+            view.initial(self.drf_request, *args, **kwargs)
+        except APIException:
+            return None
+        if not isinstance(self.drf_request.accepted_renderer, JSONRenderer):
+            return None
+
+        try:
+            response = await self.conditional_response(request)
+        except (Http404, APIException):
+            return None
+        return response if response is None else view.finalize_response(self.drf_request, response)
+
+    async def conditional_response(self, request):
+        """ConditionalGetMixin.conditional_get sobre cached_response()."""
+        if not issubclass(self.sync_view, ConditionalGetMixin):
+            return await self.cached_response(request)
+
+        state = await self.load_conditional_state()
+        if state is None:
+            return None
+        etag, last_modified = validators(request, state)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = await self.cached_response(request)
+        return set_validators(response, etag, last_modified)
+
+    async def load_conditional_state(self):
+        """ConditionalGetMixin.load_conditional_state, con la misma clave de caché."""
+        queryset, aggregates = self.view.get_conditional_query()
+        scope = await self.get_cache_scope()
+        if scope is None:
+            return await aaggregate_state(queryset, **aggregates)
+
+        key = await self.response_key(f'{self.sync_view.__name__}:state', scope)
+        backend = ResponseCache.backend()
+        state = await backend.aget(key)
+        if state is None:
+            state = await aaggregate_state(queryset, **aggregates)
+            if state is not None:
+                await backend.aset(key, state)
+        return state
+
+    async def cached_response(self, request):
+        """CachedResponseMixin.cached_get, con la misma clave de caché."""
+        scope = await self.get_cache_scope()
+        if scope is None:
+            return Response(await self.get_data())
+
+        key = await self.response_key(self.sync_view.__name__, scope)
+        backend = ResponseCache.backend()
+        data = await backend.aget(key)
+        if data is None:
+            data = await self.get_data()
+            await backend.aset(key, data)
+        return Response(data)
+
+    async def get_cache_scope(self):
+        """Ámbito de caché de la petición, resuelto una vez (lo usan el estado y la respuesta)."""
+        if not issubclass(self.sync_view, CachedResponseMixin):
+            return None
+        if '_cache_scope' not in self.__dict__:
+            scope = await self.get_response_cache_scope()
+            self._cache_scope = None if scope is None or scope[1] is None else scope
+        return self._cache_scope
+
+    async def response_key(self, view_name, scope):
+        """La clave de ResponseCache.response_key, leyendo la versión del ámbito una vez por petición."""
+        if '_cache_version' not in self.__dict__:
+            self._cache_version = await ResponseCache.aget_version(*scope)
+        return ResponseCache.versioned_key(self.request, view_name, self._cache_version)
+
+    async def get_response_cache_scope(self):
+        raise NotImplementedError
+
+    async def get_data(self):
+        raise NotImplementedError
+
+    def get_serializer_context(self):
+        return {'request': self.drf_request, 'format': self.view.format_kwarg, 'view': self.view}
+
+    def serialize(self, instance, serializer_class, many=False):
+        return serializer_class(instance, many=many, context=self.get_serializer_context()).data
+
+    async def list_data(self, queryset, serializer_class):
+        """
+        Datos de un listado con la paginación de sync_view: la página pedida o,
+        sin paginación, todas las filas leídas por bloques con aiterator().
+        """
+        paginator = self.view.paginator
+        page = await paginator.apaginate_queryset(queryset, self.drf_request, self.view) if paginator else None
+        if page is not None:
+            return paginator.get_paginated_response(self.serialize(page, serializer_class, many=True)).data
+
+        rows = [obj async for obj in queryset.aiterator(chunk_size=ITERATOR_CHUNK_SIZE)]
+        return self.serialize(rows, serializer_class, many=True)
@@ -0,0 +1,35 @@
+# backend/core/authentication.py
+"""
+Lectura del token JWT de una petición sin consultar la base de datos, para lo
+que necesita conocer al usuario antes de que la vista DRF lo autentique (el
+camino de lectura asíncrono y el reparto de lecturas entre réplicas).
+"""
+from rest_framework.exceptions import APIException
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+
+def validated_token(request):
+    """Token JWT válido de la cabecera Authorization, o None."""
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header is not None else None
+    if raw_token is None:
+        return None
+    try:
+        return authentication.get_validated_token(raw_token)
+    except (TokenError, APIException):
+        return None
+
+
+def token_user_id(request):
+    """
+    Id del usuario según el token de la petición, o None. Respeta
+    APIClient.force_authenticate en las pruebas, igual que DRF.
+    """
+    force_user = getattr(request, '_force_auth_user', None)
+    if force_user is not None:
+        return force_user.pk
+    token = validated_token(request)
+    return None if token is None else token.get(jwt_settings.USER_ID_CLAIM)
@@ -0,0 +1,77 @@
+# backend/core/benchmark.py
+"""
+Utilidades comunes de los comandos de benchmark: percentiles, resumen de
+muestras y escritura de informes JSON comparables entre ejecuciones.
+"""
+import json
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+import django
+from django.conf import settings
+from django.db import connection
+
+
+def percentile(values, fraction):
+    """Percentil con interpolación lineal (fraction entre 0 y 1)."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies, query_counts=None):
+    """
+    Resume las latencias (en segundos) de una serie de muestras en milisegundos
+    y, si se indican, sus conteos de consultas.
+    """
+    summary = {
+        'samples': len(latencies),
+        'latency_ms': {
+            name: round(percentile(latencies, fraction) * 1000, 3)
+            for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p95', 0.95), ('p99', 0.99), ('max', 1.0))
+        } if latencies else {},
+    }
+    if latencies:
+        summary['latency_ms']['mean'] = round(sum(latencies) / len(latencies) * 1000, 3)
+    if query_counts:
+        summary['queries'] = {
+            'min': min(query_counts),
+            'max': max(query_counts),
+            'mean': round(sum(query_counts) / len(query_counts), 2),
+        }
+    return summary
+
+
+def allowed_host():
+    """Un host aceptado por ALLOWED_HOSTS para las peticiones del cliente de pruebas."""
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*':
+            return host.lstrip('.')
+    return 'localhost'
+
+
+def write_report(path, benchmark, parameters, results):
+    """
+    Escribe el informe de un benchmark con los datos del entorno, para poder
+    comparar ejecuciones.
+    """
+    report = {
+        'benchmark': benchmark,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'debug': settings.DEBUG,
+        },
+        'parameters': parameters,
+        'results': results,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True, default=str))
+    return report
@@ -0,0 +1,169 @@
+# backend/core/compression.py
+"""
+Compresión de las respuestas con Brotli o gzip.
+
+CompressionMiddleware elige la codificación con Accept-Encoding del cliente
+(br si acepta las dos con la misma preferencia) y comprime solo los tipos de
+COMPRESSION_LEVELS, con el nivel que fija para cada uno: las respuestas
+dinámicas de la API se comprimen en cada petición, así que compensa un nivel
+medio, que comprime casi como el máximo en una fracción del tiempo. Las
+respuestas de menos de COMPRESSION_MIN_SIZE bytes salen tal cual.
+
+Las respuestas en streaming se comprimen por trozos, a medida que se generan:
+cada trozo se envía comprimido en cuanto llega, sin esperar al resto.
+
+Como GZipMiddleware de Django, añade Vary: Accept-Encoding, debilita los
+ETag fuertes (el 304 sigue funcionando, If-None-Match compara en débil) y
+respeta Cache-Control: no-transform y las respuestas ya codificadas. Sin el
+paquete brotli solo se usa gzip.
+"""
+import gzip
+import zlib
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# En orden de preferencia cuando el cliente acepta varias por igual.
+ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+
+def negotiate(accept_encoding):
+    """
+    La codificación preferida por el cliente según Accept-Encoding, o None.
+    Respeta los valores q, q=0 incluido, y el comodín '*'.
+    """
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, *params = item.split(';')
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition('=')
+            if name.lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    default = qualities.get('*', 0.0)
+    preferred = max(ENCODINGS, key=lambda encoding: qualities.get(encoding, default))
+    return preferred if qualities.get(preferred, default) > 0 else None
+
+
+def compression_levels(response):
+    """Niveles de COMPRESSION_LEVELS para el Content-Type de la respuesta, o None."""
+    content_type = response.get('Content-Type', '').partition(';')[0].strip().lower()
+    return settings.COMPRESSION_LEVELS.get(content_type)
+
+
+def compress(content, encoding, level):
+    if encoding == 'br':
+        return brotli.compress(content, quality=level)
+    return gzip.compress(content, compresslevel=level, mtime=0)
+
+
+class StreamCompressor:
+    """
+    Compresor incremental: cada trozo sale completo (flush) para que el
+    cliente pueda leerlo sin esperar al siguiente.
+    """
+
+    def __init__(self, encoding, level):
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=level)
+            self._compress, self._flush, self._finish = compressor.process, compressor.flush, compressor.finish
+        else:
+            # wbits 16 + MAX_WBITS: formato gzip, con cabecera y CRC.
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._finish = compressor.compress, compressor.flush
+            self._flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def compress(self, chunk):
+        return self._compress(chunk) + self._flush() if chunk else b''
+
+    def finish(self):
+        return self._finish()
+
+    def stream(self, chunks):
+        for chunk in chunks:
+            data = self.compress(chunk)
+            if data:
+                yield data
+        yield self.finish()
+
+    async def astream(self, chunks):
+        async for chunk in chunks:
+            data = self.compress(chunk)
+            if data:
+                yield data
+        yield self.finish()
+
+
+class CompressionMiddleware:
+    """
+    Comprime con br o gzip las respuestas de los tipos configurados.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        levels = compression_levels(response)
+        if levels is None or not self.is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None or encoding not in levels:
+            return response
+
+        if response.streaming:
+            compressor = StreamCompressor(encoding, levels[encoding])
+            content = response.streaming_content
+            response.streaming_content = (
+                compressor.astream(content) if response.is_async else compressor.stream(content)
+            )
+            # El tamaño comprimido no se conoce hasta terminar.
+            del response.headers['Content-Length']
+        else:
+            compressed = compress(response.content, encoding, levels[encoding])
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    @staticmethod
+    def is_compressible(response):
+        """Sin codificar, transformable y, si se conoce su tamaño, no demasiado pequeña."""
+        if response.has_header('Content-Encoding') or response.has_header('Content-Range'):
+            return False
+        if 'no-transform' in response.get('Cache-Control', '').lower():
+            return False
+        if response.streaming:
+            # Solo se conoce el tamaño de los archivos (FileResponse).
+            length = response.get('Content-Length')
+            return length is None or not length.isdigit() or int(length) >= settings.COMPRESSION_MIN_SIZE
+        return len(response.content) >= settings.COMPRESSION_MIN_SIZE
@@ -0,0 +1,112 @@
+# backend/core/conditional.py
+"""
+GET condicional (ETag / Last-Modified) para las vistas de lectura.
+
+Cada vista resume el estado de su árbol de recursos con una consulta
+agregada barata (Max('updated_at') y Count de cada nivel). El ETag es un
+hash de ese estado y de la URL pedida; Last-Modified es la fecha más reciente
+del estado. Si el cliente ya tiene esa versión se responde 304 sin consultar
+los datos ni serializarlos.
+
+Los Count detectan los borrados, que no cambian ningún updated_at; por eso
+If-None-Match es más fiable que If-Modified-Since, y cuando llegan los dos
+manda el primero.
+
+En las vistas con caché de respuestas el estado se guarda junto a ellas,
+bajo la versión de su ámbito, así que un 304 no llega a la base de datos.
+"""
+import hashlib
+from datetime import datetime
+from django.db.models import Count
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from .response_cache import CachedResponseMixin, ResponseCache
+
+
+def aggregate_state(queryset, **aggregates):
+    """
+    Resume con una sola consulta el objeto filtrado por queryset.
+    Devuelve None si no existe o no pertenece al usuario.
+    """
+    state = queryset.aggregate(found=Count('pk', distinct=True), **aggregates)
+    return state if state['found'] else None
+
+
+async def aaggregate_state(queryset, **aggregates):
+    """Versión asíncrona de aggregate_state."""
+    state = await queryset.aaggregate(found=Count('pk', distinct=True), **aggregates)
+    return state if state['found'] else None
+
+
+def validators(request, state):
+    """ETag y Last-Modified (timestamp o None) de un estado para la URL pedida."""
+    fingerprint = repr((sorted(state.items()), request.build_absolute_uri()))
+    etag = quote_etag(hashlib.sha1(fingerprint.encode()).hexdigest())
+    timestamps = [value for value in state.values() if isinstance(value, datetime)]
+    last_modified = int(max(timestamps).timestamp()) if timestamps else None
+    return etag, last_modified
+
+
+def set_validators(response, etag, last_modified):
+    response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Añade ETag y Last-Modified a los GET de una vista y responde 304 cuando
+    el recurso no ha cambiado.
+
+    Las vistas implementan get_conditional_query(), que devuelve el queryset
+    del recurso ya filtrado por usuario y los agregados que resumen su estado
+    (las vistas asíncronas de core/async_views.py ejecutan la misma consulta).
+    Si el recurso no existe o no es del usuario el estado es None y la vista
+    responde como siempre, normalmente con 404.
+
+    Las vistas que definen su propio get() deben delegar en conditional_get().
+    """
+
+    def get_conditional_query(self):
+        raise NotImplementedError
+
+    def get_conditional_state(self):
+        queryset, aggregates = self.get_conditional_query()
+        return aggregate_state(queryset, **aggregates)
+
+    def load_conditional_state(self):
+        """
+        Obtiene el estado, desde la caché de respuestas si la vista la usa. Se
+        guarda con la caducidad de las respuestas (TIMEOUT del alias): el estado
+        cambia y una escritura de otro proceso puede no cambiar la versión que
+        ve este, así que no puede guardarse para siempre.
+        """
+        scope = self.get_response_cache_scope() if isinstance(self, CachedResponseMixin) else None
+        if scope is None or scope[1] is None:
+            return self.get_conditional_state()
+
+        key = ResponseCache.response_key(self.request, f'{type(self).__name__}:state', *scope)
+        backend = ResponseCache.backend()
+        state = backend.get(key)
+        if state is None:
+            state = self.get_conditional_state()
+            if state is not None:
+                backend.set(key, state)
+        return state
+
+    def get(self, request, *args, **kwargs):
+        return self.conditional_get(request, super().get, *args, **kwargs)
+
+    def conditional_get(self, request, handler, *args, **kwargs):
+        state = self.load_conditional_state()
+        if state is None:
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = validators(request, state)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        return set_validators(response, etag, last_modified)
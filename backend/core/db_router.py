@@ -0,0 +1,125 @@
+# backend/core/db_router.py
+"""
+Reparto de lecturas entre la base de datos principal y sus réplicas.
+
+Las escrituras y todo lo que no es una petición HTTP (comandos, migraciones,
+tareas) usan siempre 'default'. ReplicaRoutingMiddleware elige al principio
+de cada petición de dónde lee: las de lectura (GET, HEAD, OPTIONS), de una
+réplica de DATABASE_REPLICAS elegida al azar; las de escritura, de la
+principal.
+
+La réplica puede ir unos instantes por detrás. Para que quien escribe vea su
+propio cambio, cada escritura fija a su usuario en la principal durante
+REPLICA_PIN_SECONDS segundos (read-your-writes). La marca vive en la caché
+compartida de respuestas, así que vale para todos los procesos; y como las
+respuestas cacheadas son de su dueño, tampoco se guarda en ellas una lectura
+anterior al cambio mientras dura la marca.
+"""
+import random
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from .authentication import token_user_id
+from .response_cache import RESPONSE_CACHE_ALIAS
+
+READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_read_alias = ContextVar('read_alias', default=None)
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def pin_key(user_id):
+    return f'replica-pin:{user_id}'
+
+
+class ReplicaRouter:
+    """
+    Lecturas al alias elegido para la petición en curso (fuera de una
+    petición, 'default'); escrituras y migraciones, a 'default'.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Principal y réplicas tienen los mismos datos.
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Las réplicas reciben el esquema por replicación.
+        return False if db in replica_aliases() else None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Fija el alias de lectura de cada petición y marca a los usuarios que
+    escriben. Sin réplicas configuradas no hace nada.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not replica_aliases():
+            return self.get_response(request)
+
+        user_id = token_user_id(request)
+        pinned = request.method in READ_METHODS and user_id is not None and self.backend().get(pin_key(user_id))
+        token = _read_alias.set(self.read_alias(request, pinned))
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+        if self.should_pin(request, response, user_id):
+            self.backend().set(pin_key(user_id), True, settings.REPLICA_PIN_SECONDS)
+        return response
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        user_id = token_user_id(request)
+        pinned = request.method in READ_METHODS and user_id is not None and await self.backend().aget(pin_key(user_id))
+        token = _read_alias.set(self.read_alias(request, pinned))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+        if self.should_pin(request, response, user_id):
+            await self.backend().aset(pin_key(user_id), True, settings.REPLICA_PIN_SECONDS)
+        return response
+
+    @staticmethod
+    def backend():
+        return caches[RESPONSE_CACHE_ALIAS]
+
+    @staticmethod
+    def read_alias(request, pinned):
+        if request.method not in READ_METHODS or pinned:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replica_aliases())
+
+    @staticmethod
+    def should_pin(request, response, user_id):
+        """Las escrituras con éxito de un usuario identificado."""
+        return (
+            request.method not in READ_METHODS and user_id is not None
+            and response.status_code < 400 and settings.REPLICA_PIN_SECONDS > 0
+        )
@@ -0,0 +1,263 @@
+# backend/core/metrics.py
+"""
+Métricas por vista: consultas SQL, tiempo en base de datos, tiempo de
+serialización y latencia total de cada petición.
+
+MetricsMiddleware mide cada petición y acumula los valores en histogramas en
+memoria, uno por vista (nombre de la URL) y método. metrics_view los publica
+en el formato de texto de Prometheus. Los histogramas son del proceso: con
+varios workers cada uno publica los suyos.
+
+Con METRICS_RESPONSE_HEADERS las mismas cifras viajan en cada respuesta
+(X-Query-Count y Server-Timing), útil para fijar regresiones en pruebas o
+desde el navegador sin esperar a la agregación.
+
+El tiempo de serialización es el que pasa dentro de serializer.data e incluye
+las consultas que dispare la propia serialización, que es justo donde aparece
+un N+1.
+"""
+import hmac
+import threading
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from bisect import bisect_left
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.http import HttpResponse
+from rest_framework import serializers
+
+METRICS_PREFIX = 'clarity'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+
+# Nombre -> (descripción, límites de los buckets, atributo de RequestMetrics).
+METRICS = {
+    'http_request_duration_seconds': ('Latencia total de la petición.', LATENCY_BUCKETS, 'total_time'),
+    'db_queries_per_request': ('Consultas SQL por petición.', QUERY_BUCKETS, 'queries'),
+    'db_duration_seconds': ('Tiempo en base de datos por petición.', LATENCY_BUCKETS, 'db_time'),
+    'serializer_duration_seconds': ('Tiempo de serialización por petición.', LATENCY_BUCKETS, 'serializer_time'),
+}
+
+_current_metrics = ContextVar('request_metrics', default=None)
+
+
+class Histogram:
+    """
+    Histograma acumulativo al estilo de Prometheus.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self):
+        """Pares (límite, observaciones <= límite), terminando en +Inf."""
+        total = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            yield bound, total
+
+
+class MetricsRegistry:
+    """
+    Histogramas de todas las vistas del proceso.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def observe(self, view, method, request_metrics):
+        with self._lock:
+            for name, (_, buckets, attribute) in METRICS.items():
+                histogram = self._histograms.get((name, view, method))
+                if histogram is None:
+                    histogram = self._histograms[(name, view, method)] = Histogram(buckets)
+                histogram.observe(getattr(request_metrics, attribute))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def render(self):
+        """Exporta los histogramas en el formato de texto de Prometheus."""
+        lines = []
+        with self._lock:
+            for name, (description, _, _) in METRICS.items():
+                metric = f'{METRICS_PREFIX}_{name}'
+                lines.append(f'# HELP {metric} {description}')
+                lines.append(f'# TYPE {metric} histogram')
+                for (histogram_name, view, method), histogram in sorted(self._histograms.items()):
+                    if histogram_name != name:
+                        continue
+                    labels = f'view="{view}",method="{method}"'
+                    for bound, count in histogram.cumulative_counts():
+                        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum:g}')
+                    lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+class RequestMetrics:
+    """
+    Cifras de una petición en curso.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.total_time = 0.0
+        self.serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        """Envoltorio de ejecución de consultas (connection.execute_wrapper)."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+
+def _count_query(execute, sql, params, many, context):
+    """Envoltorio permanente: cuenta la consulta en la petición en curso, si la hay."""
+    request_metrics = _current_metrics.get()
+    if request_metrics is None:
+        return execute(sql, params, many, context)
+    return request_metrics(execute, sql, params, many, context)
+
+
+def install_query_counter(**kwargs):
+    """
+    Añade _count_query a las conexiones del hilo actual que aún no lo tienen.
+    Se llama al empezar cada petición (señal request_started), que Django
+    ejecuta en el hilo de la petición también bajo ASGI.
+    """
+    for connection in connections.all():
+        if _count_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(_count_query)
+
+
+def _timed_data(data_property):
+    """Mide serializer.data; los serializadores anidados no se cuentan dos veces."""
+    def data(self):
+        request_metrics = _current_metrics.get()
+        if request_metrics is None or request_metrics.serializing:
+            return data_property.fget(self)
+
+        request_metrics.serializing = True
+        start = time.perf_counter()
+        try:
+            return data_property.fget(self)
+        finally:
+            request_metrics.serializer_time += time.perf_counter() - start
+            request_metrics.serializing = False
+    return property(data)
+
+
+_serializers_instrumented = False
+
+
+def instrument_serializers():
+    """Instala la medición de serializer.data en los serializadores de DRF (una vez)."""
+    global _serializers_instrumented
+    if not _serializers_instrumented:
+        serializers.Serializer.data = _timed_data(serializers.Serializer.data)
+        serializers.ListSerializer.data = _timed_data(serializers.ListSerializer.data)
+        _serializers_instrumented = True
+
+
+class MetricsMiddleware:
+    """
+    Mide consultas, tiempo en base de datos, serialización y latencia de cada
+    petición y los registra bajo el nombre de la URL resuelta.
+
+    Funciona en los dos modos: bajo ASGI no obliga a Django a pasar la
+    petición a un hilo. Las conexiones son propias de cada hilo y el ORM
+    asíncrono consulta desde el hilo síncrono de la petición, así que el
+    contador se instala en ese hilo con request_started y encuentra las
+    cifras de la petición en una ContextVar, que asgiref copia al hilo.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        instrument_serializers()
+        request_started.connect(install_query_counter, dispatch_uid='metrics_install_query_counter')
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request_metrics = RequestMetrics()
+        token = _current_metrics.set(request_metrics)
+        start = time.perf_counter()
+        try:
+            install_query_counter()
+            response = self.get_response(request)
+        finally:
+            request_metrics.total_time = time.perf_counter() - start
+            _current_metrics.reset(token)
+        return self.record(request, response, request_metrics)
+
+    async def __acall__(self, request):
+        request_metrics = RequestMetrics()
+        token = _current_metrics.set(request_metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_metrics.total_time = time.perf_counter() - start
+            _current_metrics.reset(token)
+        return self.record(request, response, request_metrics)
+
+    def record(self, request, response, request_metrics):
+        """Registra las métricas de la petición y añade las cabeceras si están activadas."""
+        resolver_match = getattr(request, 'resolver_match', None)
+        view = resolver_match.url_name if resolver_match and resolver_match.url_name else 'unmatched'
+        if view != 'metrics':
+            registry.observe(view, request.method, request_metrics)
+
+        if getattr(settings, 'METRICS_RESPONSE_HEADERS', False):
+            response.headers['X-Query-Count'] = str(request_metrics.queries)
+            response.headers['Server-Timing'] = ', '.join(
+                f'{name};dur={seconds * 1000:.2f}'
+                for name, seconds in (
+                    ('db', request_metrics.db_time),
+                    ('serializer', request_metrics.serializer_time),
+                    ('total', request_metrics.total_time),
+                )
+            )
+        return response
+
+
+def metrics_view(request):
+    """
+    GET /metrics
+
+    Publica los histogramas en formato Prometheus. Exige la cabecera
+    Authorization: Bearer <METRICS_TOKEN>; sin token configurado solo responde
+    con DEBUG activo y, si no, siempre 403.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return HttpResponse(status=403)
+    elif not settings.DEBUG:
+        return HttpResponse(status=403)
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
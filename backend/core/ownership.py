@@ -0,0 +1,47 @@
+# backend/core/ownership.py
+"""
+Resolución de los recursos padre de una petición (la propiedad, la unidad o
+el ciclo de la URL) comprobando que pertenecen al usuario.
+
+Las vistas llaman a sus ayudantes get_property/get_unit/get_billing_cycle
+desde get_queryset, get_serializer_context y create; sin memoria, cada
+llamada repetía la misma consulta. DRF crea una instancia de la vista por
+petición, así que guardar el objeto en la instancia lo resuelve una sola vez
+por petición sin que se comparta entre usuarios.
+"""
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+
+class OwnedObjectMixin:
+    """
+    Memoriza por petición los objetos resueltos con get_owned_object() y el
+    de get_object() en las vistas genéricas.
+    """
+
+    def get_owned_object(self, queryset, **lookup):
+        """
+        get_object_or_404(queryset, **lookup), resuelto una vez por petición.
+        El filtro de pertenencia al usuario va en lookup.
+        """
+        resolved = self.__dict__.setdefault('_owned_objects', {})
+        key = (queryset.model, tuple(sorted(lookup.items())))
+        if key not in resolved:
+            resolved[key] = get_object_or_404(queryset, **lookup)
+        return resolved[key]
+
+    async def aget_owned_object(self, queryset, **lookup):
+        """Versión asíncrona de get_owned_object para las vistas de lectura ASGI."""
+        resolved = self.__dict__.setdefault('_owned_objects', {})
+        key = (queryset.model, tuple(sorted(lookup.items())))
+        if key not in resolved:
+            try:
+                resolved[key] = await queryset.aget(**lookup)
+            except queryset.model.DoesNotExist:
+                raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+        return resolved[key]
+
+    def get_object(self):
+        if '_object' not in self.__dict__:
+            self._object = super().get_object()
+        return self._object
@@ -0,0 +1,185 @@
+# backend/core/pagination.py
+"""
+Paginación por cursor (keyset) para los listados de la API.
+
+El cursor guarda los valores de todos los campos de ordenación del último
+elemento devuelto, de modo que la página siguiente se obtiene con un filtro
+"después de esta posición" que aprovecha los índices compuestos, en lugar de
+un OFFSET que recorre todas las filas anteriores. La clave primaria cierra
+siempre la ordenación para que los empates no se repitan ni se pierdan.
+"""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from decimal import Decimal
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_value(value):
+    """
+    Convierte los valores de posición a JSON sin perder precisión
+    (DjangoJSONEncoder recorta los microsegundos de las fechas).
+    """
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Valor de cursor no serializable: {value!r}")
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación keyset: sin `cursor` ni `page_size` la petición recibe la
+    primera página de page_size filas. Con UNPAGINATED_LISTS, solo para
+    clientes antiguos, esas peticiones reciben el listado completo.
+
+    Cada vista declara su orden en `cursor_ordering`; los campos deben ser no
+    nulos y el último debe ser único (normalmente '-pk' o 'pk').
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+    ordering = ('-pk',)
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = self.page_queryset(queryset, request, view)
+        if page is None:
+            return None
+        return self.set_page(list(page))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Versión asíncrona de paginate_queryset para las vistas de lectura ASGI."""
+        page = self.page_queryset(queryset, request, view)
+        if page is None:
+            return None
+        return self.set_page([obj async for obj in page])
+
+    def page_queryset(self, queryset, request, view=None):
+        """
+        Consulta de la página pedida (con una fila de más para saber si hay
+        otra), o None si, con UNPAGINATED_LISTS, la petición no pide paginación.
+        """
+        if (getattr(settings, 'UNPAGINATED_LISTS', False)
+                and self.cursor_query_param not in request.query_params
+                and self.page_size_query_param not in request.query_params):
+            return None
+
+        self.request = request
+        self.ordering = tuple(getattr(view, 'cursor_ordering', self.ordering))
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+        self.position, self.reverse = position, reverse
+
+        ordering = self.reversed_ordering() if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.after_position(ordering, position))
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, results):
+        """Recorta las filas leídas de page_queryset y calcula los enlaces."""
+        position, reverse = self.position, self.reverse
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        # En sentido inverso, "hay más" significa que existe una página anterior.
+        self.has_next = has_more if not reverse else position is not None
+        self.has_previous = position is not None if not reverse else has_more
+        self.first = self.position_of(results[0]) if results else None
+        self.last = self.position_of(results[-1]) if results else None
+        if not results and position is not None:
+            # Página vacía: los enlaces se anclan en la posición pedida.
+            self.first = self.last = position
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def reversed_ordering(self):
+        return tuple(field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering)
+
+    def after_position(self, ordering, position):
+        """
+        Filtro de las filas que van después de `position` en `ordering`:
+        (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def position_of(self, obj):
+        return [getattr(obj, field.lstrip('-')) for field in self.ordering]
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'p': position, 'r': reverse}, default=_encode_value)
+        cursor = urlsafe_b64encode(payload.encode()).decode()
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode()).decode())
+            position, reverse = payload['p'], bool(payload['r'])
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if (not isinstance(position, list) or len(position) != len(self.ordering)
+                or not all(isinstance(value, (str, int)) for value in position)):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_next_link(self):
+        if not self.has_next or self.last is None:
+            return None
+        return self.encode_cursor(self.last, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.first is None:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.encode_cursor(self.first, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,34 @@
+# backend/core/parsers.py
+"""
+Lectura de los cuerpos JSON con orjson (ver core/renderers.py).
+
+orjson lee los mismos valores que json y es más estricto, así que todo lo
+que rechaza -cuerpos inválidos, pero también enteros de más de 64 bits o
+escapes de surrogates sueltos- se vuelve a leer con JSONParser de DRF: el
+resultado, o el mensaje de error, es el mismo que antes.
+"""
+import codecs
+from io import BytesIO
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from .renderers import ORJSONRenderer, orjson
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser con el mismo resultado, leído con orjson.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        # orjson solo lee UTF-8 y, como JSONParser estricto, rechaza NaN e Infinity.
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(BytesIO(body), media_type, parser_context)
@@ -0,0 +1,249 @@
+# backend/core/query_budgets.py
+"""
+Presupuesto de consultas SQL por endpoint.
+
+QUERY_BUDGETS asigna a cada nombre de URL del proyecto el máximo de consultas
+que puede ejecutar una petición, junto con cómo construirla a partir de los
+datos de prueba de seed_budget_fixture(). La prueba core/tests/
+test_query_budgets.py ejecuta cada endpoint con N=1 y con N=100 filas y
+falla si alguna petición supera su presupuesto o si el número de consultas
+crece con N, que es como se manifiesta un N+1 en un serializador.
+
+Las vistas de lectura se miden sin caché (las cachés se vacían antes de cada
+petición); los presupuestos corresponden al camino que llega a la base de
+datos. Cada endpoint nuevo necesita una entrada: la prueba también falla si
+hay nombres de URL sin presupuesto.
+
+Los procesos por lotes que recorren todas las propiedades del usuario (el
+cierre de mes) declaran con per_row cuántas consultas añade cada fila; en
+ellos el presupuesto crece con N de forma explícita y acotada.
+"""
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+from properties.models import Property, Unit, BillingCycle, Expense, MeterReading
+from properties.services.allocation_service import AllocationService
+from properties.services.portfolio_service import PortfolioSeedService
+from rules.models import Rule, ServiceRule
+from tenants.models import Tenancy
+from .response_cache import RESPONSE_CACHE_ALIAS
+
+# Espacios de nombres de URL que no son de la API.
+IGNORED_NAMESPACES = {'admin'}
+
+# Mes del ciclo abierto de los datos de prueba.
+FIXTURE_YEAR, FIXTURE_MONTH = 2025, 12
+
+
+class QueryBudget:
+    """
+    Presupuesto de un endpoint y cómo llamarlo.
+
+    Args:
+        max_queries: Máximo de consultas de una petición.
+        method: Método HTTP de la petición.
+        kwargs: Argumentos de la URL, como {argumento: clave de los datos de prueba}.
+        data: Cuerpo de la petición, o función que lo construye a partir de los datos de prueba.
+        format: Formato del cuerpo ('json' o 'multipart').
+        status: Código de estado esperado.
+        authenticated: Si la petición se hace con el usuario de los datos de prueba.
+        per_row: Consultas permitidas por cada una de las N filas (0 salvo en procesos por lotes).
+    """
+
+    def __init__(self, max_queries, method='get', kwargs=None, data=None, format='json',
+                 status=200, authenticated=True, per_row=0):
+        self.max_queries = max_queries
+        self.per_row = per_row
+        self.method = method
+        self.kwargs = kwargs or {}
+        self.data = data
+        self.format = format
+        self.status = status
+        self.authenticated = authenticated
+
+    def limit(self, n):
+        """Máximo de consultas con N filas."""
+        return self.max_queries + self.per_row * n
+
+    def build(self, fixture):
+        """Devuelve la URL y el cuerpo de la petición para unos datos de prueba."""
+        url_kwargs = {name: fixture[key] for name, key in self.kwargs.items()}
+        data = self.data(fixture) if callable(self.data) else self.data
+        return url_kwargs, data
+
+
+def _import_file(fixture):
+    """CSV con un arrendamiento mensual por fila para la segunda unidad libre."""
+    lines = ["unit,tenant_email,tenant_name,number_of_occupants,start_date,end_date"]
+    for month in range(fixture['n']):
+        start = date(2030 + month // 12, month % 12 + 1, 1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        lines.append(f"{fixture['import_unit']},nuevo.{fixture['n']}@test.com,Nuevo,1,{start},{end}")
+    return {'file': SimpleUploadedFile('arrendamientos.csv', "\n".join(lines).encode())}
+
+
+QUERY_BUDGETS = {
+    # Sin METRICS_TOKEN y sin DEBUG, como en las pruebas, /metrics responde 403.
+    'metrics': QueryBudget(0, authenticated=False, status=403),
+    'register-user': QueryBudget(
+        3, method='post', authenticated=False, status=201,
+        data=lambda fixture: {
+            'email': f"registro.{fixture['n']}@test.com",
+            'password': 'ClaveSegura.2025', 'password2': 'ClaveSegura.2025',
+        }
+    ),
+    'token_obtain_pair': QueryBudget(
+        3, method='post', authenticated=False,
+        data=lambda fixture: {'email': fixture['username'], 'password': fixture['username']}
+    ),
+    'logout-user': QueryBudget(
+        7, method='post', status=204, data=lambda fixture: {'refresh': fixture['refresh']}
+    ),
+
+    'property-list-create': QueryBudget(1),
+    'property-detail': QueryBudget(3, kwargs={'pk': 'property'}),
+    'unit-create': QueryBudget(2, kwargs={'property_pk': 'property'}),
+    'rule-create': QueryBudget(2, kwargs={'property_pk': 'property'}),
+    'service-configuration': QueryBudget(3, kwargs={'property_id': 'property'}),
+    'billing-cycle-list-create': QueryBudget(2, kwargs={'property_id': 'property'}),
+    'billing-cycle-detail': QueryBudget(3, kwargs={'pk': 'cycle'}),
+    'billing-cycle-summary': QueryBudget(3, kwargs={'cycle_id': 'cycle'}),
+    'billing-cycle-allocations': QueryBudget(2, kwargs={'cycle_id': 'cycle'}),
+    'expense-list-create': QueryBudget(4, kwargs={'cycle_id': 'cycle'}),
+    'meter-reading-list-create': QueryBudget(2, kwargs={'cycle_id': 'cycle'}),
+    'billing-cycle-bulk-create': QueryBudget(
+        5, method='post', status=201, data={'year': 2026, 'month': 1}
+    ),
+    'billing-cycle-close': QueryBudget(
+        11, method='post', per_row=5, data={'year': FIXTURE_YEAR, 'month': FIXTURE_MONTH, 'status': 'in_review'}
+    ),
+
+    'tenant-assign': QueryBudget(
+        4, method='post', kwargs={'unit_pk': 'vacant_unit'}, status=201,
+        data=lambda fixture: {
+            'name': 'Nuevo', 'email': f"asignado.{fixture['n']}@test.com", 'number_of_occupants': 2,
+        }
+    ),
+    'tenancy-list-create': QueryBudget(3, kwargs={'unit_id': 'unit'}),
+    'available-tenants': QueryBudget(3, kwargs={'unit_id': 'unit'}),
+    'tenancy-detail': QueryBudget(3, kwargs={'pk': 'tenancy'}),
+    'tenancy-end': QueryBudget(
+        31, method='put', kwargs={'pk': 'tenancy'}, data={'end_date': '2026-06-30'}
+    ),
+    'tenancy-import': QueryBudget(15, method='post', format='multipart', status=201, data=_import_file),
+}
+
+
+def url_names():
+    """Nombres de todas las URL del proyecto, salvo las de IGNORED_NAMESPACES."""
+    names = set()
+
+    def collect(patterns):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                if pattern.namespace not in IGNORED_NAMESPACES:
+                    collect(pattern.url_patterns)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                names.add(pattern.name)
+
+    collect(get_resolver().url_patterns)
+    return names
+
+
+def seed_budget_fixture(username, n):
+    """
+    Genera con PortfolioSeedService una cartera donde cada listado tiene n filas:
+    n propiedades, y en la primera n unidades, n arrendamientos en su primera
+    unidad, n ciclos y, en el ciclo abierto, n gastos y n lecturas.
+
+    Returns:
+        dict: n, username y los IDs de la propiedad, unidad, ciclo, arrendamiento,
+        unidades libres y refresh token que usan los presupuestos.
+    """
+    PortfolioSeedService.seed(
+        username, properties=1, units_per_property=n, tenancies_per_unit=1, months=2,
+        end_year=FIXTURE_YEAR, end_month=FIXTURE_MONTH, allocations=False
+    )
+    property_obj = Property.objects.get(user__username=username)
+    # El resto de propiedades, con una unidad cada una y los mismos meses.
+    last_month = FIXTURE_YEAR * 12 + FIXTURE_MONTH - 1
+    PortfolioSeedService.seed_chunk(
+        property_obj.user, random.Random(n), range(1, n), 1, 1, range(last_month - 1, last_month + 1), False
+    )
+    unit = property_obj.units.order_by('pk').first()
+    cycle = property_obj.billing_cycles.get(year=FIXTURE_YEAR, month=FIXTURE_MONTH)
+    tenancy = unit.tenancies.get()
+
+    # Historial de n arrendamientos en la unidad y n ciclos en la propiedad.
+    Tenancy.objects.bulk_create([
+        Tenancy(
+            unit=unit, tenant=tenancy.tenant, number_of_occupants=1,
+            start_date=tenancy.start_date - timedelta(days=index + 1),
+            end_date=tenancy.start_date - timedelta(days=index + 1),
+        )
+        for index in range(n - 1)
+    ])
+    BillingCycle.objects.bulk_create([
+        BillingCycle(property=property_obj, year=(last_month - 2 - index) // 12,
+                     month=(last_month - 2 - index) % 12 + 1, status=BillingCycle.Status.CLOSED)
+        for index in range(max(n - 2, 0))
+    ])
+
+    # n gastos y n lecturas en el ciclo abierto, con su libro de asignaciones.
+    service_types = [service_type for service_type, _ in ServiceRule.ServiceType.choices]
+    Expense.objects.bulk_create([
+        Expense(billing_cycle=cycle, service_type=service_types[index % len(service_types)],
+                total_amount=Decimal('100.00'), invoice_pdf='invoices/budget.pdf')
+        for index in range(max(n - cycle.expenses.count(), 0))
+    ])
+    MeterReading.objects.bulk_create([
+        MeterReading(billing_cycle=cycle, unit=unit_obj, service_type=ServiceRule.ServiceType.WATER,
+                     previous_reading=Decimal('10'), current_reading=Decimal('20'))
+        for unit_obj in property_obj.units.all()
+    ])
+    AllocationService.recompute_cycle(cycle)
+
+    # Una regla menos que tipos, para que el alta tenga uno libre.
+    rule_types = [rule_type for rule_type, _ in Rule.RuleType.choices]
+    Rule.objects.bulk_create([
+        Rule(property=property_obj, type=rule_type) for rule_type in rule_types[:min(n, len(rule_types) - 1)]
+    ])
+
+    vacant_unit, import_unit = Unit.objects.bulk_create([
+        Unit(property=property_obj, name='Libre 1'), Unit(property=property_obj, name='Libre 2')
+    ])
+    return {
+        'n': n,
+        'username': username,
+        'user': property_obj.user,
+        'property': property_obj.pk,
+        'unit': unit.pk,
+        'cycle': cycle.pk,
+        'tenancy': tenancy.pk,
+        'vacant_unit': vacant_unit.pk,
+        'import_unit': import_unit.pk,
+        'refresh': str(RefreshToken.for_user(property_obj.user)),
+    }
+
+
+def measure(client, url_name, budget, fixture):
+    """
+    Ejecuta la petición de un presupuesto sin cachés.
+
+    Returns:
+        tuple: (respuesta, número de consultas)
+    """
+    url_kwargs, data = budget.build(fixture)
+    url = reverse(url_name, kwargs=url_kwargs)
+    client.force_authenticate(user=fixture['user'] if budget.authenticated else None)
+    caches['default'].clear()
+    caches[RESPONSE_CACHE_ALIAS].clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = getattr(client, budget.method)(url, data, format=budget.format)
+    return response, len(queries)
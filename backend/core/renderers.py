@@ -0,0 +1,56 @@
+# backend/core/renderers.py
+"""
+Renderizado JSON de la API con orjson.
+
+La salida es idéntica byte a byte a la de JSONRenderer de DRF con la
+configuración del proyecto (JSON compacto, UTF-8 y estricto): lo que orjson
+no escribe igual que DRF -fechas y horas, Decimal, cadenas traducibles,
+dataclasses- pasa por el mismo JSONEncoder.default de DRF, y U+2028 y U+2029
+se escapan igual. Los Decimal de los modelos llegan ya como cadenas
+(COERCE_DECIMAL_TO_STRING), sin pérdida de precisión, y las fechas en ISO
+8601. Los float se escriben como con json salvo en notación exponencial
+(menores que 1e-4 o desde 1e16) y NaN/Infinity, que JSONRenderer rechaza y
+orjson escribe como null; la API no produce ninguno de los dos.
+
+Lo que orjson no puede escribir igual se delega en JSONRenderer: respuestas
+indentadas (API navegable, 'application/json; indent=4'), claves que no son
+cadenas, enteros de más de 64 bits o cualquier error. Sin orjson instalado
+todo pasa por JSONRenderer.
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fechas y dataclasses por JSONEncoder.default, como en DRF.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer con la misma salida, escrita con orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.uses_orjson(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Como JSONRenderer, para que la salida sea también JavaScript válido. Buscar
+        # antes el primer byte de U+2028/U+2029 (0xE2, de U+2000 a U+2FFF) es mucho
+        # más rápido que buscar las secuencias de tres bytes en cada respuesta.
+        if b'\xe2' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+    def uses_orjson(self, accepted_media_type, renderer_context):
+        """orjson solo escribe JSON compacto, en UTF-8 y sin indentar."""
+        return (
+            orjson is not None and self.compact and not self.ensure_ascii and self.strict
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
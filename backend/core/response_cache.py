@@ -0,0 +1,156 @@
+# backend/core/response_cache.py
+"""
+Caché de las respuestas de lectura por usuario.
+
+Cada respuesta se guarda bajo (usuario, vista, URL completa, versión). La
+versión pertenece a un ámbito -la propiedad de la que dependen los datos o,
+en el listado de propiedades, el propio usuario- y cambia cada vez que algo
+de ese ámbito se modifica, de modo que las entradas anteriores quedan
+obsoletas sin tener que buscarlas ni borrarlas.
+
+El almacenamiento es el alias de caché RESPONSE_CACHE_ALIAS de Django: en
+memoria del proceso por defecto (LRU con MAX_ENTRIES y caducidad TIMEOUT) y
+un backend compartido en producción, para que todos los procesos vean las
+mismas versiones.
+"""
+import hashlib
+from uuid import uuid4
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+RESPONSE_CACHE_ALIAS = getattr(settings, 'RESPONSE_CACHE_ALIAS', 'responses')
+
+
+class ResponseCache:
+    """
+    Acceso a las versiones y entradas de la caché de respuestas.
+    """
+
+    @staticmethod
+    def backend():
+        return caches[RESPONSE_CACHE_ALIAS]
+
+    @staticmethod
+    def version_key(scope, scope_id):
+        return f'response:version:{scope}:{scope_id}'
+
+    @staticmethod
+    def get_version(scope, scope_id):
+        """Obtiene la versión actual de un ámbito, creándola si no existe."""
+        backend = ResponseCache.backend()
+        key = ResponseCache.version_key(scope, scope_id)
+        version = backend.get(key)
+        if version is None:
+            backend.add(key, uuid4().hex, None)
+            version = backend.get(key)
+        return version
+
+    @staticmethod
+    async def aget_version(scope, scope_id):
+        """Versión asíncrona de get_version para las vistas de lectura ASGI."""
+        backend = ResponseCache.backend()
+        key = ResponseCache.version_key(scope, scope_id)
+        version = await backend.aget(key)
+        if version is None:
+            await backend.aadd(key, uuid4().hex, None)
+            version = await backend.aget(key)
+        return version
+
+    @staticmethod
+    def bump(scope, *scope_ids):
+        """
+        Invalida las respuestas de los ámbitos indicados.
+
+        La versión cambia en el momento, para que la propia transacción no lea
+        respuestas anteriores, y otra vez al confirmarse, para descartar lo que
+        una lectura concurrente haya guardado con los datos previos al commit.
+        """
+        def bump():
+            ResponseCache.backend().set_many({
+                ResponseCache.version_key(scope, scope_id): uuid4().hex
+                for scope_id in scope_ids
+            }, None)
+
+        scope_ids = [scope_id for scope_id in scope_ids if scope_id is not None]
+        if scope_ids:
+            bump()
+            transaction.on_commit(bump)
+
+    @staticmethod
+    def bump_properties(*property_ids):
+        ResponseCache.bump('property', *property_ids)
+
+    @staticmethod
+    def remember(key, compute):
+        """
+        Devuelve un valor que nunca cambia (p. ej. la propiedad de un ciclo),
+        calculándolo solo la primera vez. Los valores nulos no se guardan.
+        """
+        backend = ResponseCache.backend()
+        value = backend.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                backend.set(key, value, None)
+        return value
+
+    @staticmethod
+    async def aremember(key, compute):
+        """Versión asíncrona de remember; compute es una corrutina."""
+        backend = ResponseCache.backend()
+        value = await backend.aget(key)
+        if value is None:
+            value = await compute()
+            if value is not None:
+                await backend.aset(key, value, None)
+        return value
+
+    @staticmethod
+    def response_key(request, view_name, scope, scope_id):
+        """Clave de una respuesta: usuario, vista, URL completa y versión del ámbito."""
+        version = ResponseCache.get_version(scope, scope_id)
+        return ResponseCache.versioned_key(request, view_name, version)
+
+    @staticmethod
+    def versioned_key(request, view_name, version):
+        url = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+        return f'response:{request.user.pk}:{view_name}:{url}:{version}'
+
+
+class CachedResponseMixin:
+    """
+    Sirve los GET de una vista desde la caché de respuestas.
+
+    Cada vista indica en get_response_cache_scope() de qué ámbito dependen sus
+    datos: ('property', id) o ('user', id). Si devuelve None la petición no se
+    cachea. Solo se guardan las respuestas 200, y siempre bajo el usuario que
+    las obtuvo, así que nunca se sirve una respuesta a quien no pasó la
+    comprobación de propiedad de la vista.
+
+    Las vistas que definen su propio get() deben delegar en cached_get().
+    """
+
+    def get_response_cache_scope(self):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        return self.cached_get(request, super().get, *args, **kwargs)
+
+    def cached_get(self, request, handler, *args, **kwargs):
+        """Devuelve la respuesta guardada o ejecuta handler y guarda su resultado."""
+        scope = self.get_response_cache_scope()
+        if scope is None or scope[1] is None:
+            return handler(request, *args, **kwargs)
+
+        key = ResponseCache.response_key(request, type(self).__name__, *scope)
+        backend = ResponseCache.backend()
+        data = backend.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            backend.set(key, response.data)
+        return response
@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # 3rd Party Apps
     'rest_framework',
@@ -65,8 +66,24 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # JSON con orjson, idéntico byte a byte al de DRF (core/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
+# Los listados se paginan por cursor (core/pagination.py): 50 filas por página
+# por defecto y como mucho 200 con page_size. UNPAGINATED_LISTS=true devuelve
+# la lista completa, sin paginar, a las peticiones sin cursor ni page_size;
+# solo como compatibilidad temporal para clientes que aún esperan una lista.
+UNPAGINATED_LISTS = os.environ.get('UNPAGINATED_LISTS', 'false').lower() in ('1', 'true', 'yes')
+
 # ----------------------------------------------------------------------
 # Simple JWT configuration
 # ----------------------------------------------------------------------
@@ -97,6 +114,11 @@ SIMPLE_JWT = {
 }
 
 MIDDLEWARE = [
+    # Primero, para que la latencia medida incluya al resto de middlewares.
+    'core.metrics.MetricsMiddleware',
+    # Antes que los demás para comprimir la respuesta ya terminada.
+    'core.compression.CompressionMiddleware',
+    'core.db_router.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -107,7 +129,14 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'core.urls'
+# Vistas de lectura asíncronas (core/async_views.py), opcionales: con
+# ASYNC_READ_VIEWS=true, en un despliegue ASGI, los GET más usados se sirven
+# desde core/asgi_urls.py, que cambia esas rutas por vistas asíncronas. Solo
+# compensan cuando domina la latencia de la base de datos o de la red (ver
+# manage.py benchmark_concurrency); por defecto se usan las vistas síncronas.
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS', 'false').lower() in ('1', 'true', 'yes')
+
+ROOT_URLCONF = 'core.asgi_urls' if ASYNC_READ_VIEWS else 'core.urls'
 
 TEMPLATES = [
     {
@@ -129,6 +158,24 @@ WSGI_APPLICATION = 'core.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+#
+# Conexiones persistentes: cada hilo conserva su conexión DB_CONN_MAX_AGE
+# segundos en lugar de abrir una (TCP y autenticación) en cada petición, y
+# DB_CONN_HEALTH_CHECKS comprueba que sigue viva antes de reutilizarla. Con
+# ASYNC_READ_VIEWS cada petición corre en un hilo nuevo y su conexión no se
+# reutiliza, así que por defecto se cierra al terminar.
+#
+# DB_POOL=true usa en su lugar el pool de psycopg 3 (requiere
+# psycopg[binary,pool], que Django prefiere a psycopg2 si está instalado):
+# entre DB_POOL_MIN_SIZE y DB_POOL_MAX_SIZE conexiones compartidas por los
+# hilos del proceso, esperando como mucho DB_POOL_TIMEOUT segundos por una
+# libre. Con el pool los parámetros viajan aparte de la consulta (server-side
+# binding) y psycopg prepara en el servidor las sentencias que se repiten
+# DB_PREPARE_THRESHOLD veces; detrás de PgBouncer en modo transacción hay que
+# desactivarlo con DB_PREPARE_THRESHOLD=off.
+
+DB_POOL = os.environ.get('DB_POOL', 'false').lower() in ('1', 'true', 'yes')
+DB_PREPARE_THRESHOLD = os.environ.get('DB_PREPARE_THRESHOLD', '5').lower()
 
 DATABASES = {
     'default': {
@@ -138,7 +185,103 @@ DATABASES = {
         'PASSWORD': 'password',
         'HOST': 'localhost', 
         'PORT': '5432',
+        # El pool no admite conexiones persistentes: sus conexiones ya se reutilizan.
+        'CONN_MAX_AGE': 0 if DB_POOL else int(
+            os.environ.get('DB_CONN_MAX_AGE', 0 if ASYNC_READ_VIEWS else 60)
+        ),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() in ('1', 'true', 'yes'),
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+                'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+                'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+            },
+            'server_side_binding': True,
+            'prepare_threshold': (
+                None if DB_PREPARE_THRESHOLD in ('off', 'none') else int(DB_PREPARE_THRESHOLD)
+            ),
+        } if DB_POOL else {},
+    }
+}
+
+# Réplicas de lectura (core/db_router.py)
+# DB_REPLICA_HOSTS=host1,host2 añade un alias replica_<n> por host, con la misma
+# configuración que 'default'. Las peticiones de lectura leen de una réplica,
+# salvo las de un usuario que ha escrito en los últimos REPLICA_PIN_SECONDS
+# segundos, que siguen en la principal para ver sus propios cambios. En las
+# pruebas las réplicas son espejos de 'default'.
+
+DATABASE_REPLICAS = []
+for index, host in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': host.strip(),
+        'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+        'TEST': {'MIRROR': 'default'},
     }
+    DATABASE_REPLICAS.append(f'replica_{index}')
+
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 10))
+
+
+# Cache
+# 'responses' guarda las respuestas de lectura por usuario (core/response_cache.py)
+# y los resúmenes de ciclo, con sus versiones. Por defecto vive en la memoria
+# del proceso, como la caché por defecto; con varios procesos debe apuntar
+# a un backend compartido, p. ej. RESPONSE_CACHE_BACKEND=
+# django.core.cache.backends.redis.RedisCache y RESPONSE_CACHE_LOCATION=
+# redis://127.0.0.1:6379/1 (requiere el paquete redis).
+
+RESPONSE_CACHE_ALIAS = 'responses'
+RESPONSE_CACHE_BACKEND = os.environ.get(
+    'RESPONSE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    RESPONSE_CACHE_ALIAS: {
+        'BACKEND': RESPONSE_CACHE_BACKEND,
+        'LOCATION': os.environ.get('RESPONSE_CACHE_LOCATION', 'responses'),
+        # TTL de cada respuesta en segundos; las versiones no caducan.
+        'TIMEOUT': int(os.environ.get('RESPONSE_CACHE_TTL', 300)),
+        'OPTIONS': (
+            # Memoria o archivo: al llegar al máximo se descarta una parte de las
+            # entradas (en memoria, las usadas hace más tiempo).
+            {'MAX_ENTRIES': int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 5000))}
+            if RESPONSE_CACHE_BACKEND.endswith(('LocMemCache', 'FileBasedCache')) else {}
+        ),
+    },
+}
+
+
+# Métricas (core/metrics.py)
+# /metrics publica los histogramas por vista en formato Prometheus a quien
+# presente Authorization: Bearer <METRICS_TOKEN>; sin token solo responde con
+# DEBUG activo. METRICS_RESPONSE_HEADERS
+# añade X-Query-Count y Server-Timing a cada respuesta.
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_RESPONSE_HEADERS = os.environ.get(
+    'METRICS_RESPONSE_HEADERS', 'true' if DEBUG else 'false'
+).lower() in ('1', 'true', 'yes')
+
+
+# Compresión de respuestas (core/compression.py)
+# Las respuestas de los tipos de COMPRESSION_LEVELS desde COMPRESSION_MIN_SIZE
+# bytes se comprimen con br (calidad 0-11) o gzip (nivel 1-9), según acepte el
+# cliente. En los listados grandes de la API br 4 comprime como gzip 6 o más
+# (12-15x) en la mitad de tiempo, y los niveles altos de br cuestan varias
+# veces más por poco más (manage.py benchmark_compression). El HTML (API
+# navegable) queda fuera: lleva el token CSRF junto a datos de la petición
+# (BREACH).
+
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_LEVELS = {
+    'application/json': {'br': 4, 'gzip': 6},
+    'text/plain': {'br': 4, 'gzip': 6},
 }
 
 
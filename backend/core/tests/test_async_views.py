@@ -0,0 +1,186 @@
+# backend/core/tests/test_async_views.py
+from datetime import date
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from core.async_views import AsyncReadView
+from properties.models import Property, Unit, BillingCycle, Expense
+from properties.views import ExpenseListCreateAPIView, PropertyRetrieveAPIView
+from rules.models import ServiceRule
+from tenants.models import Tenant, Tenancy
+
+ASGI_URLS = override_settings(ROOT_URLCONF='core.asgi_urls')
+
+
+class AsyncReadViewTestCase(TestCase):
+    """
+    Pruebas del camino de lectura asíncrono: mismas respuestas que las vistas
+    síncronas y delegación de todo lo demás.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        Property.objects.create(name="Edificio Norte", address="Calle Norte 1", user=self.user)
+        self.other_property = Property.objects.create(
+            name="Edificio Ajeno", address="Calle Ajena 9", user=self.other_user
+        )
+        self.unit = Unit.objects.create(name="Apto 101", property=self.property, area=50)
+        Unit.objects.create(name="Apto 102", property=self.property, area=70)
+        tenant = Tenant.objects.create(name="Ana", email="ana@test.com", number_of_occupants=2, unit=self.unit)
+        Tenancy.objects.create(unit=self.unit, tenant=tenant, number_of_occupants=2,
+                               start_date=date(2024, 1, 1), end_date=date(2024, 6, 30))
+        Tenancy.objects.create(unit=self.unit, tenant=tenant, number_of_occupants=3, start_date=date(2024, 7, 1))
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        self.billing_cycle = BillingCycle.objects.create(property=self.property, month=7, year=2024)
+        BillingCycle.objects.create(property=self.property, month=8, year=2024)
+        for amount in ('100.00', '250.50'):
+            Expense.objects.create(
+                billing_cycle=self.billing_cycle,
+                service_type=ServiceRule.ServiceType.WATER,
+                total_amount=amount,
+                invoice_pdf='invoices/test_invoice.pdf'
+            )
+        self.urls = [
+            reverse('property-list-create'),
+            reverse('property-detail', kwargs={'pk': self.property.pk}),
+            reverse('billing-cycle-list-create', kwargs={'property_id': self.property.pk}),
+            reverse('billing-cycle-detail', kwargs={'pk': self.billing_cycle.pk}),
+            reverse('expense-list-create', kwargs={'cycle_id': self.billing_cycle.pk}),
+            reverse('tenancy-list-create', kwargs={'unit_id': self.unit.pk}),
+        ]
+
+    def get(self, url, **extra):
+        """GET sin cachés, para comparar los dos caminos hasta la base de datos."""
+        caches['default'].clear()
+        caches['responses'].clear()
+        return self.client.get(url, **extra)
+
+    def assertSameResponse(self, sync_response, async_response):
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.content, sync_response.content)
+        for header in ('Content-Type', 'ETag', 'Last-Modified', 'Allow', 'Vary'):
+            self.assertEqual(async_response.headers.get(header), sync_response.headers.get(header), header)
+
+    def test_async_routes_replace_the_hot_reads(self):
+        """Las rutas asíncronas tienen el mismo nombre y URL que las síncronas."""
+        with ASGI_URLS:
+            for url in self.urls:
+                with self.subTest(url=url):
+                    response = self.get(url, HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                    self.assertTrue(issubclass(response.resolver_match.func.view_class, AsyncReadView))
+
+    def test_async_reads_match_sync_reads_byte_for_byte(self):
+        """Mismo cuerpo y cabeceras, con y sin paginación."""
+        self.client.force_authenticate(user=self.user)
+        for url in self.urls + [f'{url}?page_size=1' for url in self.urls]:
+            with self.subTest(url=url):
+                sync_response = self.get(url)
+                with ASGI_URLS:
+                    async_response = self.get(url)
+                self.assertEqual(sync_response.status_code, status.HTTP_200_OK)
+                self.assertSameResponse(sync_response, async_response)
+
+        # La página siguiente a partir del cursor de la respuesta asíncrona.
+        url = self.urls[2] + '?page_size=1'
+        with ASGI_URLS:
+            next_url = self.get(url).data['next']
+            async_response = self.get(next_url)
+        self.assertSameResponse(self.get(next_url), async_response)
+
+    def test_async_reads_do_not_use_the_sync_handlers(self):
+        """Los GET autenticados no pasan por la vista DRF."""
+        self.client.force_authenticate(user=self.user)
+        with ASGI_URLS, \
+                mock.patch.object(PropertyRetrieveAPIView, 'retrieve', side_effect=AssertionError), \
+                mock.patch.object(ExpenseListCreateAPIView, 'list', side_effect=AssertionError):
+            for url in (self.urls[1], self.urls[4]):
+                with self.subTest(url=url):
+                    self.assertEqual(self.get(url).status_code, status.HTTP_200_OK)
+
+    def test_cache_and_conditional_get_are_shared_with_sync_views(self):
+        """La respuesta guardada por un camino la sirve el otro, y el ETag vale para ambos."""
+        self.client.force_authenticate(user=self.user)
+        url = self.urls[1]
+        caches['responses'].clear()
+        sync_response = self.client.get(url)
+
+        with ASGI_URLS, mock.patch.object(Property.objects, 'prefetch_related', side_effect=AssertionError):
+            cached = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=sync_response.headers['ETag'])
+
+        self.assertSameResponse(sync_response, cached)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.headers['ETag'], sync_response.headers['ETag'])
+
+    def test_errors_are_answered_by_the_sync_views(self):
+        """401, 404 y cursor inválido responden igual que bajo WSGI."""
+        foreign_url = reverse('property-detail', kwargs={'pk': self.other_property.pk})
+        cases = [
+            (None, self.urls[0]),
+            ('invalid', self.urls[0]),
+            (self.user, foreign_url),
+            (self.user, reverse('expense-list-create', kwargs={'cycle_id': 999999})),
+            (self.user, self.urls[5] + '?cursor=roto'),
+        ]
+        for user, url in cases:
+            with self.subTest(user=user, url=url):
+                self.client.force_authenticate(user=None)
+                extra = {}
+                if user == 'invalid':
+                    extra['HTTP_AUTHORIZATION'] = 'Bearer token-invalido'
+                elif user is not None:
+                    self.client.force_authenticate(user=user)
+                sync_response = self.get(url, **extra)
+                with ASGI_URLS:
+                    async_response = self.get(url, **extra)
+                self.assertIn(sync_response.status_code, (401, 404))
+                self.assertSameResponse(sync_response, async_response)
+
+    def test_writes_are_delegated_to_the_sync_views(self):
+        """POST en una ruta asíncrona lo atiende la vista DRF."""
+        self.client.force_authenticate(user=self.user)
+        with ASGI_URLS:
+            response = self.client.post(
+                reverse('property-list-create'), {'name': "Edificio Sur", 'address': "Calle Sur 5"}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Property.objects.filter(name="Edificio Sur", user=self.user).exists())
+
+    @ASGI_URLS
+    @override_settings(METRICS_RESPONSE_HEADERS=True)
+    async def test_asgi_handler_serves_the_async_path(self):
+        """Por el manejador ASGI, con el middleware de métricas contando las consultas asíncronas."""
+        caches['responses'].clear()
+        response = await self.async_client.get(
+            self.urls[4], headers={'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertGreater(int(response.headers['X-Query-Count']), 0)
@@ -0,0 +1,156 @@
+# backend/core/tests/test_compression.py
+import gzip
+import json
+import zlib
+import brotli
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.contrib.auth.models import User
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from core.compression import CompressionMiddleware, negotiate
+from properties.models import Property, Unit
+
+PAYLOAD = {'results': [{'id': index, 'name': f"Arrendatario {index}", 'total_amount': '1835.43'} for index in range(200)]}
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024, COMPRESSION_LEVELS={'application/json': {'br': 4, 'gzip': 6}})
+class CompressionMiddlewareTestCase(SimpleTestCase):
+    """
+    Pruebas del middleware sobre respuestas construidas a mano.
+    """
+
+    def process(self, response, accept_encoding='gzip, deflate, br'):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_negotiates_the_encoding(self):
+        """br ante igual preferencia; respeta q, q=0 y el comodín."""
+        self.assertEqual(negotiate('gzip, deflate, br'), 'br')
+        self.assertEqual(negotiate('gzip;q=1.0, br;q=0.8'), 'gzip')
+        self.assertEqual(negotiate('br;q=0, gzip'), 'gzip')
+        self.assertEqual(negotiate('*'), 'br')
+        self.assertEqual(negotiate('*;q=0.5, br;q=0'), 'gzip')
+        self.assertIsNone(negotiate('identity'))
+        self.assertIsNone(negotiate('gzip;q=0, *;q=0'))
+        self.assertIsNone(negotiate(''))
+
+    def test_compresses_large_json(self):
+        """El contenido se recupera igual y las cabeceras describen la versión comprimida."""
+        response = JsonResponse(PAYLOAD)
+        response.headers['ETag'] = '"abc"'
+        original = response.content
+
+        response = self.process(response)
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), original)
+        self.assertEqual(response.headers['Content-Length'], str(len(response.content)))
+        self.assertLess(len(response.content), len(original) / 5)
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.headers['ETag'], 'W/"abc"')
+
+        response = self.process(JsonResponse(PAYLOAD), 'gzip')
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), original)
+
+    def test_leaves_other_responses_alone(self):
+        """Pequeñas, de otros tipos, ya codificadas, no-transform o sin codificación aceptada."""
+        small = JsonResponse({'id': 1})
+        self.assertNotIn('Content-Encoding', self.process(small))
+        self.assertNotIn('Vary', small)
+
+        html = HttpResponse('<p>' * 1000, content_type='text/html')
+        self.assertNotIn('Content-Encoding', self.process(html))
+
+        encoded = JsonResponse(PAYLOAD)
+        encoded.headers['Content-Encoding'] = 'identity'
+        self.assertEqual(self.process(encoded).headers['Content-Encoding'], 'identity')
+
+        no_transform = JsonResponse(PAYLOAD)
+        no_transform.headers['Cache-Control'] = 'private, no-transform'
+        self.assertNotIn('Content-Encoding', self.process(no_transform))
+
+        identity = self.process(JsonResponse(PAYLOAD), 'identity')
+        self.assertNotIn('Content-Encoding', identity)
+        self.assertEqual(identity.headers['Vary'], 'Accept-Encoding')
+
+    def test_compresses_streaming_responses_incrementally(self):
+        """Cada trozo sale comprimido en cuanto se genera y el total se recupera igual."""
+        chunks = [json.dumps(PAYLOAD).encode()[start:start + 500] for start in range(0, 5000, 500)]
+        for encoding, decompressor in (('br', brotli.Decompressor), ('gzip', lambda: zlib.decompressobj(31))):
+            with self.subTest(encoding=encoding):
+                response = StreamingHttpResponse(iter(chunks), content_type='application/json')
+                response.headers['Content-Length'] = str(sum(map(len, chunks)))
+                response = self.process(response, encoding)
+                self.assertEqual(response.headers['Content-Encoding'], encoding)
+                self.assertNotIn('Content-Length', response)
+
+                decompress = decompressor()
+                decompress = getattr(decompress, 'process', None) or decompress.decompress
+                received = b''
+                for chunk, part in zip(chunks, response.streaming_content):
+                    received += decompress(part)
+                    self.assertTrue(received.endswith(chunk))
+                for part in response.streaming_content:
+                    received += decompress(part)
+                self.assertEqual(received, b''.join(chunks))
+
+    def test_async_streaming_and_middleware(self):
+        """Bajo ASGI el middleware es asíncrono y comprime también los iteradores asíncronos."""
+        async def content():
+            for index in range(10):
+                yield json.dumps(PAYLOAD['results'][index * 20:(index + 1) * 20]).encode()
+
+        async def get_response(request):
+            return StreamingHttpResponse(content(), content_type='application/json')
+
+        async def run():
+            request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='br')
+            response = await CompressionMiddleware(get_response)(request)
+            return response, b''.join([part async for part in response.streaming_content])
+
+        response, body = async_to_sync(run)()
+        self.assertTrue(response.is_async)
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(
+            brotli.decompress(body),
+            b''.join(json.dumps(PAYLOAD['results'][index * 20:(index + 1) * 20]).encode() for index in range(10))
+        )
+
+
+class CompressionApiTestCase(TestCase):
+    """
+    Compresión de las respuestas reales de la API.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(name="Edificio Central", address="Calle 1", user=self.user)
+        for index in range(30):
+            Unit.objects.create(name=f"Apto {101 + index}", property=self.property, area=50)
+        self.url = reverse('property-detail', kwargs={'pk': self.property.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def test_unit_tree_is_compressed_and_revalidates(self):
+        """El árbol de unidades llega comprimido, igual al original, y su ETag débil sigue dando 304."""
+        plain = self.client.get(self.url)
+        compressed = self.client.get(self.url, HTTP_ACCEPT_ENCODING='br, gzip')
+
+        self.assertEqual(compressed.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertEqual(compressed.headers['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(compressed.content), plain.content)
+        self.assertEqual(compressed.headers['ETag'], 'W/' + plain.headers['ETag'])
+
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING='br, gzip', HTTP_IF_NONE_MATCH=compressed.headers['ETag']
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,134 @@
+# backend/core/tests/test_db_router.py
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from core.db_router import ReplicaRouter, _read_alias, pin_key
+from properties.models import Property, Unit
+from tenants.models import Tenancy
+
+REPLICA_ALIAS = 'replica'
+
+
+class ReplicaRouterTestCase(TestCase):
+    """
+    Pruebas del router fuera de una petición.
+    """
+
+    def test_without_a_request_everything_uses_default(self):
+        """Comandos y tareas leen y escriben en la principal."""
+        router = ReplicaRouter()
+        self.assertIsNone(router.db_for_read(Property))
+        self.assertEqual(router.db_for_write(Property), DEFAULT_DB_ALIAS)
+
+        token = _read_alias.set(REPLICA_ALIAS)
+        try:
+            self.assertEqual(router.db_for_read(Property), REPLICA_ALIAS)
+            self.assertEqual(router.db_for_write(Property), DEFAULT_DB_ALIAS)
+        finally:
+            _read_alias.reset(token)
+
+    @override_settings(DATABASE_REPLICAS=[REPLICA_ALIAS])
+    def test_replicas_are_not_migrated(self):
+        router = ReplicaRouter()
+        self.assertFalse(router.allow_migrate(REPLICA_ALIAS, 'properties'))
+        self.assertIsNone(router.allow_migrate(DEFAULT_DB_ALIAS, 'properties'))
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA_ALIAS], REPLICA_PIN_SECONDS=10)
+class ReplicaRoutingTestCase(TransactionTestCase):
+    """
+    Pruebas del reparto de lecturas con dos alias locales: 'default' como
+    principal y 'replica', otra conexión a la misma base de datos, como
+    réplica. Esa conexión no ve lo que no está confirmado, así que los datos
+    se confirman (TransactionTestCase). El alias solo existe mientras corre
+    la clase; como espejo de 'default', Django no lo vacía entre pruebas.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        connections.settings[REPLICA_ALIAS] = {
+            **connections.settings[DEFAULT_DB_ALIAS],
+            'TEST': {'MIRROR': DEFAULT_DB_ALIAS},
+        }
+        cls.databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA_ALIAS].close()
+        del connections[REPLICA_ALIAS]
+        del connections.settings[REPLICA_ALIAS]
+        del cls.databases
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        caches['responses'].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='propietario', email='propietario@test.com', password='x')
+        self.other_user = User.objects.create_user(username='otro', email='otro@test.com', password='x')
+        self.property = Property.objects.create(name="Edificio Central", address="Calle 1", user=self.user)
+        Property.objects.create(name="Edificio Ajeno", address="Calle 2", user=self.other_user)
+        self.unit = Unit.objects.create(name="Apto 101", property=self.property, area=50)
+
+    def request(self, method, url, user, **kwargs):
+        """Petición con JWT; devuelve la respuesta y las consultas de cada alias."""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary, \
+                CaptureQueriesContext(connections[REPLICA_ALIAS]) as replica:
+            response = getattr(self.client, method)(url, **kwargs)
+        return response, len(primary), len(replica)
+
+    def test_reads_go_to_the_replica(self):
+        """Un GET, autenticación incluida, lee de la réplica."""
+        response, primary, replica = self.request('get', reverse('property-list-create'), self.user)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_writes_pin_the_user_to_the_primary(self):
+        """Tras crear un arrendamiento su autor lee de la principal y ve el cambio; los demás, de la réplica."""
+        url = reverse('tenancy-list-create', kwargs={'unit_id': self.unit.pk})
+        response, primary, replica = self.request('post', url, self.user, data={
+            'tenant_name': "Ana", 'tenant_email': 'ana@test.com',
+            'start_date': '2024-07-01', 'number_of_occupants': 2,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+        response, primary, replica = self.request('get', url, self.user)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([tenancy['id'] for tenancy in response.data['results']], list(Tenancy.objects.values_list('pk', flat=True)))
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+        _, primary, replica = self.request('get', reverse('property-list-create'), self.other_user)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_pin_expires(self):
+        """Pasada la ventana el usuario vuelve a leer de la réplica."""
+        self.request('post', reverse('property-list-create'), self.user,
+                     data={'name': "Edificio Sur", 'address': "Calle 3"}, format='json')
+        self.assertTrue(caches['responses'].get(pin_key(self.user.pk)))
+
+        caches['responses'].delete(pin_key(self.user.pk))
+        _, primary, replica = self.request('get', reverse('property-list-create'), self.user)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_failed_writes_do_not_pin(self):
+        """Una escritura rechazada no cambia nada, así que no fija al usuario."""
+        response, _, _ = self.request('post', reverse('property-list-create'), self.user, data={}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(caches['responses'].get(pin_key(self.user.pk)))
@@ -0,0 +1,101 @@
+# backend/core/tests/test_metrics.py
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from core.metrics import registry, Histogram
+from properties.models import Property, Unit
+
+
+class MetricsMiddlewareTestCase(TestCase):
+    """
+    Pruebas del middleware de métricas y del endpoint /metrics.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        registry.reset()
+        caches['responses'].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.unit = Unit.objects.create(name="Apto 101", property=self.property)
+        self.tenancies_url = reverse('tenancy-list-create', kwargs={'unit_id': self.unit.pk})
+        self.client.force_authenticate(user=self.user)
+
+    @override_settings(METRICS_RESPONSE_HEADERS=True)
+    def test_response_headers_report_the_request(self):
+        """X-Query-Count coincide con las consultas ejecutadas y Server-Timing trae los tiempos."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.tenancies_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(int(response.headers['X-Query-Count']), len(queries))
+        self.assertEqual(
+            [part.split(';')[0] for part in response.headers['Server-Timing'].split(', ')],
+            ['db', 'serializer', 'total']
+        )
+
+    @override_settings(METRICS_RESPONSE_HEADERS=False)
+    def test_response_headers_are_optional(self):
+        """Sin el modo cabeceras las respuestas no llevan las cifras."""
+        response = self.client.get(self.tenancies_url)
+        self.assertNotIn('X-Query-Count', response.headers)
+
+    @override_settings(METRICS_TOKEN='secreto')
+    def test_metrics_endpoint_exports_histograms_per_view(self):
+        """/metrics publica un histograma por vista y método en formato Prometheus."""
+        self.client.get(self.tenancies_url)
+        self.client.get(self.tenancies_url)
+        self.client.get('/no-existe/')
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secreto')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('# TYPE clarity_db_queries_per_request histogram', body)
+        self.assertIn(
+            'clarity_http_request_duration_seconds_count{view="tenancy-list-create",method="GET"} 2',
+            body
+        )
+        self.assertIn('clarity_serializer_duration_seconds_count{view="unmatched",method="GET"} 1', body)
+        self.assertNotIn('view="metrics"', body)
+
+    @override_settings(METRICS_TOKEN='secreto')
+    def test_metrics_endpoint_requires_token_when_configured(self):
+        """Con METRICS_TOKEN solo responde a quien presenta el token."""
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer otro').status_code, status.HTTP_403_FORBIDDEN
+        )
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secreto')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_metrics_endpoint_is_closed_without_token(self):
+        """Sin METRICS_TOKEN /metrics solo responde en desarrollo (DEBUG)."""
+        self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_403_FORBIDDEN)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get('/metrics').status_code, status.HTTP_200_OK)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Cada bucket cuenta las observaciones menores o iguales a su límite."""
+        histogram = Histogram((1, 5))
+        for value in (1, 3, 7):
+            histogram.observe(value)
+
+        self.assertEqual(list(histogram.cumulative_counts()), [(1, 1), (5, 2), ('+Inf', 3)])
+        self.assertEqual((histogram.sum, histogram.count), (11, 3))
@@ -0,0 +1,30 @@
+# backend/core/tests/test_query_budgets.py
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.query_budgets import QUERY_BUDGETS, url_names, seed_budget_fixture, measure
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    Pruebas del presupuesto de consultas por endpoint (ver core/query_budgets.py).
+    """
+
+    def test_every_endpoint_has_a_budget(self):
+        """Cada nombre de URL del proyecto tiene presupuesto y no sobran entradas."""
+        self.assertEqual(url_names(), set(QUERY_BUDGETS))
+
+    def test_endpoints_stay_within_budget_at_n_1_and_n_100(self):
+        """Ninguna petición supera su presupuesto ni hace más consultas con 100 filas que con 1."""
+        client = APIClient()
+        fixtures = {n: seed_budget_fixture(f'presupuesto.{n}@test.com', n) for n in (1, 100)}
+
+        for url_name, budget in QUERY_BUDGETS.items():
+            counts = {}
+            for n, fixture in fixtures.items():
+                with self.subTest(url_name=url_name, n=n):
+                    response, counts[n] = measure(client, url_name, budget, fixture)
+                    self.assertEqual(response.status_code, budget.status, getattr(response, 'data', None))
+                    self.assertLessEqual(counts[n], budget.limit(n))
+            if not budget.per_row:
+                with self.subTest(url_name=url_name):
+                    self.assertEqual(counts[1], counts[100], "El número de consultas crece con N (posible N+1).")
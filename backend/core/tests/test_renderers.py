@@ -0,0 +1,113 @@
+# backend/core/tests/test_renderers.py
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from core.parsers import ORJSONParser
+from core.query_budgets import QUERY_BUDGETS, seed_budget_fixture, measure
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    """
+    Pruebas del renderizador y el lector JSON: misma salida que los de DRF.
+    """
+
+    def assertSameRendering(self, data, accepted_media_type='application/json', renderer_context=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, accepted_media_type, renderer_context),
+            JSONRenderer().render(data, accepted_media_type, renderer_context),
+        )
+
+    def test_renders_like_drf(self):
+        """Fechas, Decimal, UUID, textos traducibles, unicode y separadores, byte a byte."""
+        data = ReturnList([
+            ReturnDict({
+                'id': 7,
+                'total_amount': '1835.43',
+                'raw_amount': Decimal('12.50'),
+                'created_at': datetime(2024, 7, 1, 8, 30, 15, 123456, tzinfo=timezone.utc),
+                'updated_at': datetime(2024, 7, 1, 8, 30, tzinfo=timezone(timedelta(hours=-5))),
+                'naive': datetime(2024, 7, 1, 8, 30, 15),
+                'start_date': date(2024, 7, 1),
+                'at': time(23, 59, 59, 500),
+                'duration': timedelta(minutes=3),
+                'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+                'label': gettext_lazy("Mantenimiento"),
+                'name': "Edificio «Ñandú» \"1\" \\ \n\t\x1f 漢字 😀",
+                'separators': "línea\u2028párrafo\u2029fin",
+                'ratio': 12.5,
+                'elapsed': 0.001,
+                'flags': (True, False, None),
+                'tags': {'a'},
+            }, serializer=None)
+        ], serializer=None)
+        self.assertSameRendering(data)
+        self.assertSameRendering({'next': None, 'previous': None, 'results': []})
+        self.assertSameRendering([])
+
+    def test_delegates_what_orjson_cannot_render_alike(self):
+        """Indentación, claves no textuales, enteros grandes y errores, como JSONRenderer."""
+        self.assertSameRendering({'a': [1, 2]}, 'application/json; indent=4')
+        self.assertSameRendering({'a': [1, 2]}, None, {'indent': 2})
+        self.assertSameRendering({1: 'uno', None: 'nada'})
+        self.assertSameRendering({'big': 2 ** 70})
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+        with self.assertRaises(ValueError):
+            ORJSONRenderer().render({'at': time(8, 0, tzinfo=timezone.utc)})
+        with self.assertRaises(TypeError):
+            ORJSONRenderer().render({'unknown': object()})
+
+    def test_parses_like_drf(self):
+        """Mismo resultado y, con cuerpos inválidos, el mismo error."""
+        bodies = [
+            b'{"name": "Ana", "total_amount": "12.50", "ratio": 0.1, "n": [1, -0, 1e400]}',
+            '{"nombre": "Ñandú \\u00e9 \\ud83d\\ude00"}'.encode(),
+            b'{"big": 123456789012345678901234567890, "surrogate": "\\ud800"}',
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                self.assertEqual(ORJSONParser().parse(BytesIO(body)), JSONParser().parse(BytesIO(body)))
+
+        for body in (b'', b'{"a": }', b'{"a": NaN}', b'\xef\xbb\xbf{}', b'{"a": "\xff"}'):
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError) as expected:
+                    JSONParser().parse(BytesIO(body))
+                with self.assertRaises(ParseError) as parsed:
+                    ORJSONParser().parse(BytesIO(body))
+                self.assertEqual(str(parsed.exception.detail), str(expected.exception.detail))
+
+    def test_is_the_default_json_renderer_and_parser(self):
+        self.assertIs(api_settings.DEFAULT_RENDERER_CLASSES[0], ORJSONRenderer)
+        self.assertIs(api_settings.DEFAULT_PARSER_CLASSES[0], ORJSONParser)
+
+
+class ORJSONApiTestCase(TestCase):
+    """
+    Compatibilidad de todas las respuestas de la API con JSONRenderer.
+    """
+
+    def test_every_endpoint_renders_like_drf(self):
+        """Las respuestas de todos los endpoints son las mismas que con el renderizador de DRF."""
+        client = APIClient()
+        fixture = seed_budget_fixture('renderizado@test.com', 3)
+
+        for url_name, budget in QUERY_BUDGETS.items():
+            with self.subTest(url_name=url_name):
+                response, _ = measure(client, url_name, budget, fixture)
+                self.assertEqual(response.status_code, budget.status)
+                if not hasattr(response, 'accepted_renderer'):
+                    continue
+                self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+                self.assertEqual(
+                    response.content,
+                    JSONRenderer().render(response.data, response.accepted_media_type, response.renderer_context)
+                )
@@ -18,16 +18,28 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from properties.views import BillingCycleRetrieveAPIView, ExpenseListCreateAPIView
-from tenants.views import TenancyRetrieveUpdateAPIView, TenancyEndAPIView
+from core.metrics import metrics_view
+from properties.views import (
+    BillingCycleRetrieveAPIView, BillingCycleCloseAPIView, BillingCycleBulkCreateAPIView,
+    BillingCycleSummaryAPIView, ExpenseListCreateAPIView, BillingCycleAllocationListAPIView,
+    MeterReadingListCreateAPIView
+)
+from tenants.views import TenancyImportAPIView, TenancyRetrieveUpdateAPIView, TenancyEndAPIView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('api/auth/', include('users.urls')),
     path('api/properties/', include('properties.urls')),
     path('api/units/', include('tenants.urls')),
+    path('api/billing-cycles/bulk/', BillingCycleBulkCreateAPIView.as_view(), name='billing-cycle-bulk-create'),
+    path('api/billing-cycles/close/', BillingCycleCloseAPIView.as_view(), name='billing-cycle-close'),
     path('api/billing-cycles/<int:pk>/', BillingCycleRetrieveAPIView.as_view(), name='billing-cycle-detail'),
     path('api/billing-cycles/<int:cycle_id>/expenses/', ExpenseListCreateAPIView.as_view(), name='expense-list-create'),
+    path('api/billing-cycles/<int:cycle_id>/summary/', BillingCycleSummaryAPIView.as_view(), name='billing-cycle-summary'),
+    path('api/billing-cycles/<int:cycle_id>/allocations/', BillingCycleAllocationListAPIView.as_view(), name='billing-cycle-allocations'),
+    path('api/billing-cycles/<int:cycle_id>/meter-readings/', MeterReadingListCreateAPIView.as_view(), name='meter-reading-list-create'),
+    path('api/tenancies/import/', TenancyImportAPIView.as_view(), name='tenancy-import'),
     path('api/tenancies/<int:pk>/', TenancyRetrieveUpdateAPIView.as_view(), name='tenancy-detail'),
     path('api/tenancies/<int:pk>/end/', TenancyEndAPIView.as_view(), name='tenancy-end'),
 ]
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class PropertiesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'properties'
+
+    def ready(self):
+        # Registra las señales que mantienen el libro de asignaciones y las
+        # que invalidan la caché de respuestas.
+        from . import signals  # noqa: F401
+        from . import cache_signals  # noqa: F401
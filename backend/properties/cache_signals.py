@@ -0,0 +1,46 @@
+# backend/properties/cache_signals.py
+"""
+Invalida la caché de respuestas de lectura (core/response_cache.py).
+
+Cualquier cambio en una propiedad o en los datos que cuelgan de ella cambia
+la versión de la propiedad; crear, renombrar o borrar una propiedad cambia
+además la versión de su dueño, de la que depende el listado de propiedades.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Property, Unit, BillingCycle, Expense
+from .services.billing_cycle_service import BillingCycleService
+from core.response_cache import ResponseCache
+from rules.models import ServiceRule
+from tenants.models import Tenant, Tenancy
+
+
+def _unit_property_id(instance):
+    """Propiedad de la unidad de un inquilino o arrendamiento."""
+    if instance.__class__.unit.is_cached(instance):
+        return instance.unit.property_id
+    return Unit.objects.filter(pk=instance.unit_id).values_list('property_id', flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=Property)
+def invalidate_property_responses(sender, instance, **kwargs):
+    ResponseCache.bump_properties(instance.pk)
+    ResponseCache.bump('user', instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Unit)
+@receiver([post_save, post_delete], sender=ServiceRule)
+@receiver([post_save, post_delete], sender=BillingCycle)
+def invalidate_responses_for_property_child(sender, instance, **kwargs):
+    ResponseCache.bump_properties(instance.property_id)
+
+
+@receiver([post_save, post_delete], sender=Tenant)
+@receiver([post_save, post_delete], sender=Tenancy)
+def invalidate_responses_for_unit_child(sender, instance, **kwargs):
+    ResponseCache.bump_properties(_unit_property_id(instance))
+
+
+@receiver([post_save, post_delete], sender=Expense)
+def invalidate_responses_for_expense(sender, instance, **kwargs):
+    ResponseCache.bump_properties(BillingCycleService.get_property_id(instance.billing_cycle_id))
@@ -0,0 +1,135 @@
+# backend/properties/management/commands/benchmark_api.py
+import random
+import time
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core.benchmark import allowed_host, summarize, write_report
+from core.response_cache import RESPONSE_CACHE_ALIAS
+from properties.models import BillingCycle
+from properties.services.allocation_service import AllocationService
+
+# Nombre de la URL -> argumento que recibe ('property', 'cycle', 'unit' o None).
+ENDPOINTS = [
+    ('property-list-create', None),
+    ('property-detail', 'property'),
+    ('unit-create', 'property'),
+    ('service-configuration', 'property'),
+    ('billing-cycle-list-create', 'property'),
+    ('billing-cycle-detail', 'cycle'),
+    ('billing-cycle-summary', 'cycle'),
+    ('billing-cycle-allocations', 'cycle'),
+    ('expense-list-create', 'cycle'),
+    ('tenancy-list-create', 'unit'),
+]
+
+URL_KWARGS = {
+    'property-detail': 'pk',
+    'unit-create': 'property_pk',
+    'billing-cycle-detail': 'pk',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Recorre los endpoints principales y el cálculo de asignaciones sobre la cartera "
+        "de un usuario (ver seed_portfolio) y guarda percentiles de latencia y consultas en JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='benchmark', help="Usuario cuya cartera se recorre.")
+        parser.add_argument('--samples', type=int, default=20, help="Propiedades elegidas al azar.")
+        parser.add_argument('--iterations', type=int, default=5, help="Repeticiones de cada petición.")
+        parser.add_argument('--seed', type=int, default=0, help="Semilla para elegir las mismas muestras.")
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help="Conserva las cachés entre peticiones; por defecto se vacían para medir el camino a la base de datos."
+        )
+        parser.add_argument('--output', default='benchmark-api.json', help="Archivo JSON de resultados.")
+
+    def handle(self, *args, **options):
+        if options['samples'] < 1 or options['iterations'] < 1:
+            raise CommandError("--samples y --iterations deben ser mayores que cero.")
+        user = User.objects.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(f"No existe el usuario '{options['username']}'.")
+
+        targets = self._pick_targets(user, options['samples'], options['seed'])
+        if not targets:
+            raise CommandError(f"El usuario '{options['username']}' no tiene propiedades.")
+
+        client = APIClient(HTTP_HOST=allowed_host())
+        client.force_authenticate(user=user)
+
+        results = {}
+        for url_name, argument in ENDPOINTS:
+            urls = [self._url(url_name, argument, target) for target in targets]
+            results[url_name] = self._measure(
+                urls, options['iterations'], options['warm_cache'],
+                lambda url: client.get(url)
+            )
+            self._report(url_name, results[url_name])
+
+        cycles = list(BillingCycle.objects.filter(pk__in=[target['cycle'] for target in targets]))
+        results['allocation.build_rows'] = self._measure(
+            cycles, options['iterations'], options['warm_cache'], AllocationService.build_rows
+        )
+        self._report('allocation.build_rows', results['allocation.build_rows'])
+
+        parameters = {key: options[key] for key in ('username', 'samples', 'iterations', 'seed', 'warm_cache')}
+        write_report(options['output'], 'api', parameters, results)
+        self.stdout.write(self.style.SUCCESS(f"Resultados guardados en {options['output']}."))
+
+    def _pick_targets(self, user, samples, seed):
+        """Elige propiedades al azar y, de cada una, su ciclo más reciente y una unidad."""
+        property_ids = list(user.properties.order_by('pk').values_list('pk', flat=True))
+        rng = random.Random(seed)
+        targets = []
+        for property_id in sorted(rng.sample(property_ids, min(samples, len(property_ids)))):
+            cycle_id = BillingCycle.objects.filter(property_id=property_id).values_list('pk', flat=True).first()
+            unit_ids = list(user.properties.get(pk=property_id).units.order_by('pk').values_list('pk', flat=True))
+            if cycle_id is None or not unit_ids:
+                continue
+            targets.append({'property': property_id, 'cycle': cycle_id, 'unit': rng.choice(unit_ids)})
+        return targets
+
+    def _url(self, url_name, argument, target):
+        if argument is None:
+            return reverse(url_name)
+        kwarg = URL_KWARGS.get(url_name, {'property': 'property_id', 'cycle': 'cycle_id', 'unit': 'unit_id'}[argument])
+        return reverse(url_name, kwargs={kwarg: target[argument]})
+
+    def _measure(self, items, iterations, warm_cache, call):
+        """Ejecuta call sobre cada elemento y resume latencias, consultas y códigos de estado."""
+        latencies = []
+        query_counts = []
+        statuses = {}
+        for _ in range(iterations):
+            for item in items:
+                if not warm_cache:
+                    caches['default'].clear()
+                    caches[RESPONSE_CACHE_ALIAS].clear()
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    result = call(item)
+                    latencies.append(time.perf_counter() - start)
+                query_counts.append(len(queries))
+                status_code = getattr(result, 'status_code', None)
+                if status_code is not None:
+                    statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+
+        summary = summarize(latencies, query_counts)
+        if statuses:
+            summary['status_codes'] = statuses
+        return summary
+
+    def _report(self, name, summary):
+        latency = summary['latency_ms']
+        self.stdout.write(
+            f"{name:<28} p50 {latency['p50']:>8.2f}ms  p95 {latency['p95']:>8.2f}ms  "
+            f"consultas {summary['queries']['mean']:>6.1f}"
+        )
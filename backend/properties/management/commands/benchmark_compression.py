@@ -0,0 +1,92 @@
+# backend/properties/management/commands/benchmark_compression.py
+import time
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Prefetch
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.benchmark import allowed_host, summarize, write_report
+from core.compression import ENCODINGS, compress
+from core.renderers import ORJSONRenderer
+from properties.models import Expense, Property, Unit
+from properties.serializers import ExpenseSerializer, PropertySerializer
+from tenants.models import Tenancy
+from tenants.serializers import TenancySerializer
+
+# Niveles a comparar con los configurados en COMPRESSION_LEVELS.
+CANDIDATE_LEVELS = {'br': (1, 4, 5, 6, 8), 'gzip': (1, 6, 9)}
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide cuánto comprime y cuánto tarda cada codificación y nivel (core/compression.py) "
+        "sobre las respuestas grandes de la cartera de un usuario (ver seed_portfolio): los "
+        "listados de gastos y arrendamientos y el árbol de unidades de su propiedad más grande."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='benchmark', help="Usuario cuya cartera se recorre.")
+        parser.add_argument('--rows', type=int, default=2000, help="Filas de cada listado.")
+        parser.add_argument('--iterations', type=int, default=10, help="Repeticiones de cada medición.")
+        parser.add_argument('--output', default='benchmark-compression.json', help="Archivo JSON de resultados.")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['iterations'] < 1:
+            raise CommandError("--rows y --iterations deben ser mayores que cero.")
+        user = User.objects.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(f"No existe el usuario '{options['username']}'.")
+
+        # Los mismos serializadores y contexto que expense-list-create, tenancy-list-create y property-detail.
+        request = Request(APIRequestFactory().get('/', HTTP_HOST=allowed_host()))
+        largest = (
+            Property.objects.filter(user=user).annotate(unit_count=Count('units')).order_by('-unit_count')
+            .prefetch_related(Prefetch('units', queryset=Unit.objects.select_related('tenant'))).first()
+        )
+        payloads = {
+            'expense-list': ExpenseSerializer(
+                Expense.objects.filter(billing_cycle__property__user=user).order_by('-created_at', '-pk')[:options['rows']],
+                many=True, context={'request': request}
+            ).data,
+            'tenancy-list': TenancySerializer(
+                Tenancy.objects.filter(unit__property__user=user).select_related('unit', 'tenant')
+                .order_by('-start_date', '-pk')[:options['rows']],
+                many=True, context={'request': request}
+            ).data,
+            'property-detail': PropertySerializer(largest, context={'request': request}).data if largest else None,
+        }
+        bodies = {name: ORJSONRenderer().render(data, 'application/json') for name, data in payloads.items() if data}
+        if not bodies:
+            raise CommandError(f"El usuario '{options['username']}' no tiene cartera.")
+
+        configured = settings.COMPRESSION_LEVELS.get('application/json', {})
+        results = {}
+        for name, body in bodies.items():
+            results[name] = {'bytes': len(body), 'encodings': {}}
+            for encoding in ENCODINGS:
+                for level in sorted({*CANDIDATE_LEVELS[encoding], *([configured[encoding]] if encoding in configured else [])}):
+                    label = f'{encoding}-{level}'
+                    results[name]['encodings'][label] = measured = self._measure(body, encoding, level, options['iterations'])
+                    self.stdout.write(
+                        f"{name:<16} {len(body):>8} B  {label:<7} x{measured['ratio']:>5.1f}  "
+                        f"{measured['latency_ms']['p50']:>8.2f}ms"
+                        + ("  (configurado)" if configured.get(encoding) == level else "")
+                    )
+
+        parameters = {key: options[key] for key in ('username', 'rows', 'iterations')}
+        parameters['configured'] = configured
+        write_report(options['output'], 'compression', parameters, results)
+        self.stdout.write(self.style.SUCCESS(f"Resultados guardados en {options['output']}."))
+
+    def _measure(self, body, encoding, level, iterations):
+        """Latencias de comprimir `body` y relación entre tamaño original y comprimido."""
+        latencies = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            compressed = compress(body, encoding, level)
+            latencies.append(time.perf_counter() - start)
+        result = summarize(latencies)
+        result['bytes'] = len(compressed)
+        result['ratio'] = round(len(body) / len(compressed), 1)
+        return result
@@ -0,0 +1,218 @@
+# backend/properties/management/commands/benchmark_concurrency.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from django.contrib.auth.models import User
+from django.core.asgi import get_asgi_application
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from core.benchmark import allowed_host, summarize, write_report
+from core.response_cache import RESPONSE_CACHE_ALIAS
+from core.wsgi import application as wsgi_application
+from .benchmark_api import Command as ApiBenchmarkCommand, ENDPOINTS
+
+# Endpoints con vista asíncrona en core/asgi_urls.py.
+ASYNC_ENDPOINTS = [
+    'property-list-create',
+    'property-detail',
+    'billing-cycle-list-create',
+    'billing-cycle-detail',
+    'expense-list-create',
+    'tenancy-list-create',
+]
+
+DUMMY_CACHE = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+
+DATABASE_KEYS = ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS', 'OPTIONS')
+
+
+class Command(ApiBenchmarkCommand):
+    help = (
+        "Compara el rendimiento con peticiones concurrentes de los GET con vista asíncrona "
+        "servidos por la aplicación WSGI (core/wsgi.py, vistas síncronas en un grupo de hilos) "
+        "y por la ASGI (core/asgi.py, vistas asíncronas de core/asgi_urls.py en un bucle de eventos), "
+        "sobre la cartera de un usuario (ver seed_portfolio). Guarda peticiones por segundo "
+        "y percentiles de latencia en JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='benchmark', help="Usuario cuya cartera se recorre.")
+        parser.add_argument('--samples', type=int, default=20, help="Propiedades elegidas al azar.")
+        parser.add_argument('--seed', type=int, default=0, help="Semilla para elegir las mismas muestras.")
+        parser.add_argument('--requests', type=int, default=200, help="Peticiones por endpoint y modo.")
+        parser.add_argument('--concurrency', type=int, default=32, help="Peticiones en curso a la vez.")
+        parser.add_argument(
+            '--wsgi-threads', type=int, default=4,
+            help="Hilos del servidor WSGI simulado; las peticiones que no caben esperan turno."
+        )
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help="Usa las cachés configuradas; por defecto se desactivan para medir el camino a la base de datos."
+        )
+        parser.add_argument('--output', default='benchmark-concurrency.json', help="Archivo JSON de resultados.")
+
+    def handle(self, *args, **options):
+        if min(options['samples'], options['requests'], options['concurrency'], options['wsgi_threads']) < 1:
+            raise CommandError("--samples, --requests, --concurrency y --wsgi-threads deben ser mayores que cero.")
+        user = User.objects.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(f"No existe el usuario '{options['username']}'.")
+
+        targets = self._pick_targets(user, options['samples'], options['seed'])
+        if not targets:
+            raise CommandError(f"El usuario '{options['username']}' no tiene propiedades.")
+
+        headers = {'host': allowed_host(), 'authorization': f'Bearer {AccessToken.for_user(user)}'}
+        caches = {} if options['warm_cache'] else {'CACHES': {'default': DUMMY_CACHE, RESPONSE_CACHE_ALIAS: DUMMY_CACHE}}
+
+        results = {}
+        with override_settings(**caches):
+            for url_name, argument in ENDPOINTS:
+                if url_name not in ASYNC_ENDPOINTS:
+                    continue
+                urls = [self._url(url_name, argument, target) for target in targets]
+                urls = [urls[index % len(urls)] for index in range(options['requests'])]
+
+                wsgi = self._run_wsgi(urls, headers, options['wsgi_threads'], options['concurrency'])
+                # Como con ASYNC_READ_VIEWS: cada petición ASGI usa un hilo nuevo y no reutiliza conexiones.
+                with override_settings(ROOT_URLCONF='core.asgi_urls'), self._database_settings({'CONN_MAX_AGE': 0}):
+                    asgi = asyncio.run(self._run_asgi(get_asgi_application(), urls, headers, options['concurrency']))
+                results[url_name] = {
+                    'wsgi': wsgi,
+                    'asgi': asgi,
+                    'speedup': round(asgi['requests_per_second'] / wsgi['requests_per_second'], 2),
+                }
+                self._report_modes(url_name, results[url_name])
+
+        parameters = {
+            key: options[key]
+            for key in ('username', 'samples', 'seed', 'requests', 'concurrency', 'wsgi_threads', 'warm_cache')
+        }
+        write_report(options['output'], 'concurrency', parameters, results)
+        self.stdout.write(self.style.SUCCESS(f"Resultados guardados en {options['output']}."))
+
+    def _run_wsgi(self, urls, headers, threads, concurrency):
+        """
+        Envía las peticiones a la aplicación WSGI desde `threads` hilos, como un
+        servidor con ese número de hilos por proceso; la latencia incluye la
+        espera de las peticiones que no caben.
+        """
+        factory = RequestFactory()
+        extra = {f"HTTP_{name.upper()}": value for name, value in headers.items()}
+
+        def call(url, submitted):
+            status_code = self._wsgi_request(factory, url, extra)
+            return time.perf_counter() - submitted, status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            # Como mucho `concurrency` peticiones enviadas sin respuesta.
+            results = []
+            for index in range(0, len(urls), concurrency):
+                batch = [executor.submit(call, url, time.perf_counter()) for url in urls[index:index + concurrency]]
+                results.extend(future.result() for future in batch)
+            self._close_thread_connections(executor, threads)
+        return self._summarize_run(results, time.perf_counter() - start, threads)
+
+    def _close_thread_connections(self, executor, threads):
+        """
+        Cierra las conexiones que conservan los hilos de `executor`: la
+        barrera obliga a que cada tarea ocupe un hilo distinto.
+        """
+        barrier = threading.Barrier(threads)
+
+        def close():
+            barrier.wait()
+            connections.close_all()
+
+        for future in [executor.submit(close) for _ in range(threads)]:
+            future.result()
+
+    @contextmanager
+    def _database_settings(self, values):
+        """
+        Aplica `values` a la configuración de la conexión por defecto. Cada hilo
+        crea su conexión a partir de este mismo diccionario, así que vale para
+        los hilos que conecten dentro del bloque.
+        """
+        settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+        previous = {key: settings_dict[key] for key in DATABASE_KEYS}
+        settings_dict.update(values)
+        try:
+            yield
+        finally:
+            settings_dict.update(previous)
+
+    def _wsgi_request(self, factory, url, extra):
+        """Atiende un GET con la aplicación WSGI, leyendo la respuesta entera; devuelve el estado."""
+        statuses = []
+        response = wsgi_application(
+            factory.get(url, **extra).environ,
+            lambda status, response_headers, exc_info=None: statuses.append(int(status.split()[0]))
+        )
+        try:
+            b''.join(response)
+        finally:
+            response.close()
+        return statuses[0]
+
+    async def _run_asgi(self, application, urls, headers, concurrency):
+        """Envía las peticiones a la aplicación ASGI, con `concurrency` en curso a la vez."""
+        raw_headers = [(name.encode(), value.encode()) for name, value in headers.items()]
+
+        async def call(url):
+            path, _, query = url.partition('?')
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+                'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': query.encode(),
+                'root_path': '', 'headers': raw_headers, 'client': ('127.0.0.1', 0),
+                'server': (headers['host'], 80),
+            }
+            body_sent = False
+            statuses = []
+
+            async def receive():
+                nonlocal body_sent
+                if not body_sent:
+                    body_sent = True
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                # Django escucha una posible desconexión hasta que termina la respuesta.
+                await asyncio.Event().wait()
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    statuses.append(message['status'])
+
+            submitted = time.perf_counter()
+            await application(scope, receive, send)
+            return time.perf_counter() - submitted, statuses[0]
+
+        start = time.perf_counter()
+        results = []
+        for index in range(0, len(urls), concurrency):
+            results.extend(await asyncio.gather(*(call(url) for url in urls[index:index + concurrency])))
+        return self._summarize_run(results, time.perf_counter() - start, concurrency)
+
+    def _summarize_run(self, results, elapsed, workers):
+        summary = summarize([latency for latency, _ in results])
+        statuses = {}
+        for _, status_code in results:
+            statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+        summary['status_codes'] = statuses
+        summary['workers'] = workers
+        summary['requests_per_second'] = round(len(results) / elapsed, 2)
+        return summary
+
+    def _report_modes(self, name, result):
+        self.stdout.write(
+            f"{name:<28} "
+            + "  ".join(
+                f"{mode} {result[mode]['requests_per_second']:>8.1f} req/s p95 {result[mode]['latency_ms']['p95']:>8.2f}ms"
+                for mode in ('wsgi', 'asgi')
+            )
+            + f"  x{result['speedup']:.2f}"
+        )
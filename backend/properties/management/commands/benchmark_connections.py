@@ -0,0 +1,156 @@
+# backend/properties/management/commands/benchmark_connections.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.models import User
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from core.benchmark import allowed_host, summarize, write_report
+from core.response_cache import RESPONSE_CACHE_ALIAS
+from .benchmark_api import ENDPOINTS
+from .benchmark_concurrency import Command as ConcurrencyBenchmarkCommand, DATABASE_KEYS, DUMMY_CACHE
+
+
+class Command(ConcurrencyBenchmarkCommand):
+    help = (
+        "Mide el coste de abrir una conexión a la base de datos en cada petición: recorre los "
+        "endpoints principales con la aplicación WSGI abriendo una conexión nueva por petición "
+        "(CONN_MAX_AGE=0, sin pool) y con la configuración de DATABASES (conexiones persistentes "
+        "o pool), y guarda latencias y conexiones abiertas en JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='benchmark', help="Usuario cuya cartera se recorre.")
+        parser.add_argument('--samples', type=int, default=20, help="Propiedades elegidas al azar.")
+        parser.add_argument('--seed', type=int, default=0, help="Semilla para elegir las mismas muestras.")
+        parser.add_argument('--requests', type=int, default=100, help="Peticiones por endpoint y modo.")
+        parser.add_argument('--threads', type=int, default=1, help="Hilos del servidor WSGI simulado.")
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help="Usa las cachés configuradas; por defecto se desactivan para medir el camino a la base de datos."
+        )
+        parser.add_argument('--output', default='benchmark-connections.json', help="Archivo JSON de resultados.")
+
+    def handle(self, *args, **options):
+        if min(options['samples'], options['requests'], options['threads']) < 1:
+            raise CommandError("--samples, --requests y --threads deben ser mayores que cero.")
+        user = User.objects.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(f"No existe el usuario '{options['username']}'.")
+
+        targets = self._pick_targets(user, options['samples'], options['seed'])
+        if not targets:
+            raise CommandError(f"El usuario '{options['username']}' no tiene propiedades.")
+
+        settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+        configured = {key: settings_dict[key] for key in DATABASE_KEYS}
+        pooled = bool(configured['OPTIONS'].get('pool'))
+        if not pooled and not configured['CONN_MAX_AGE']:
+            self.stderr.write(
+                "DATABASES también abre una conexión por petición (CONN_MAX_AGE=0 y sin pool): "
+                "los dos modos deberían medir lo mismo."
+            )
+        # Conexión nueva en cada petición, como antes de las conexiones persistentes.
+        per_request = {
+            'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': False,
+            'OPTIONS': {key: value for key, value in configured['OPTIONS'].items() if key != 'pool'},
+        }
+
+        extra = {
+            'HTTP_HOST': allowed_host(),
+            'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(user)}',
+        }
+        caches = {} if options['warm_cache'] else {'CACHES': {'default': DUMMY_CACHE, RESPONSE_CACHE_ALIAS: DUMMY_CACHE}}
+        # La conexión del hilo principal no cuenta en ningún modo.
+        connections.close_all()
+
+        results = {'connection_setup': self._measure_connect(per_request, options['requests'])}
+        self.stdout.write(f"{'connection_setup':<28} p50 {results['connection_setup']['latency_ms']['p50']:>8.2f}ms")
+        with override_settings(**caches):
+            for url_name, argument in ENDPOINTS:
+                urls = [self._url(url_name, argument, target) for target in targets]
+                urls = [urls[index % len(urls)] for index in range(options['requests'])]
+
+                before = self._run_mode(per_request, urls, extra, options['threads'])
+                after = self._run_mode(configured, urls, extra, options['threads'])
+                results[url_name] = {
+                    'per_request': before,
+                    'configured': after,
+                    'saved_ms': round(before['latency_ms']['mean'] - after['latency_ms']['mean'], 3),
+                }
+                self.stdout.write(
+                    f"{url_name:<28} "
+                    + "  ".join(
+                        f"{mode} p50 {results[url_name][mode]['latency_ms']['p50']:>8.2f}ms "
+                        f"{results[url_name][mode]['connections_per_request']:.2f} conex/pet"
+                        for mode in ('per_request', 'configured')
+                    )
+                    + f"  -{results[url_name]['saved_ms']:.2f}ms"
+                )
+
+        parameters = {
+            key: options[key]
+            for key in ('username', 'samples', 'seed', 'requests', 'threads', 'warm_cache')
+        }
+        parameters['database'] = {key: configured[key] for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS')}
+        parameters['database']['pool'] = configured['OPTIONS'].get('pool') or None
+        write_report(options['output'], 'connections', parameters, results)
+        self.stdout.write(self.style.SUCCESS(f"Resultados guardados en {options['output']}."))
+
+    def _measure_connect(self, per_request, samples):
+        """Latencia de abrir (y cerrar) una conexión nueva: lo que ahorra reutilizarla."""
+        latencies = []
+        with self._database_settings(per_request):
+            connection = connections.create_connection(DEFAULT_DB_ALIAS)
+            for _ in range(samples):
+                start = time.perf_counter()
+                connection.connect()
+                latencies.append(time.perf_counter() - start)
+                connection.close()
+        return summarize(latencies)
+
+    def _run_mode(self, values, urls, extra, threads):
+        """
+        Atiende las peticiones desde `threads` hilos, cada uno con su parte en
+        orden, y cuenta las conexiones que abre Django (con pool, las que se
+        toman de él).
+        """
+        opened = []
+
+        def count(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        def work(chunk):
+            factory = RequestFactory()
+            results = []
+            try:
+                for url in chunk:
+                    start = time.perf_counter()
+                    status_code = self._wsgi_request(factory, url, extra)
+                    results.append((time.perf_counter() - start, status_code))
+            finally:
+                connections.close_all()
+            return results
+
+        connection_created.connect(count)
+        try:
+            with self._database_settings(values):
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    chunks = executor.map(work, [urls[index::threads] for index in range(threads)])
+                    results = [result for chunk in chunks for result in chunk]
+                elapsed = time.perf_counter() - start
+                pool = connections[DEFAULT_DB_ALIAS].pool if values['OPTIONS'].get('pool') else None
+                pool_size = pool.get_stats()['pool_size'] if pool is not None else None
+        finally:
+            connection_created.disconnect(count)
+
+        summary = self._summarize_run(results, elapsed, threads)
+        summary['connections_opened'] = len(opened)
+        summary['connections_per_request'] = round(len(opened) / len(results), 2)
+        if pool_size is not None:
+            summary['pool_size'] = pool_size
+        return summary
@@ -0,0 +1,101 @@
+# backend/properties/management/commands/benchmark_renderers.py
+import time
+from io import BytesIO
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.benchmark import allowed_host, summarize, write_report
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from properties.models import Expense
+from properties.serializers import ExpenseSerializer
+from tenants.models import Tenancy
+from tenants.serializers import TenancySerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el renderizado y la lectura JSON de DRF (JSONRenderer/JSONParser) con los de "
+        "core/renderers.py (orjson) sobre listados grandes de gastos y arrendamientos de la "
+        "cartera de un usuario (ver seed_portfolio), y guarda tiempos y si la salida coincide en JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='benchmark', help="Usuario cuya cartera se recorre.")
+        parser.add_argument('--rows', type=int, default=2000, help="Filas de cada listado.")
+        parser.add_argument('--iterations', type=int, default=20, help="Repeticiones de cada medición.")
+        parser.add_argument('--output', default='benchmark-renderers.json', help="Archivo JSON de resultados.")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['iterations'] < 1:
+            raise CommandError("--rows y --iterations deben ser mayores que cero.")
+        user = User.objects.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(f"No existe el usuario '{options['username']}'.")
+
+        # Los mismos serializadores y contexto que los GET de expense-list-create y tenancy-list-create.
+        request = Request(APIRequestFactory().get('/', HTTP_HOST=allowed_host()))
+        lists = {
+            'expense-list': ExpenseSerializer(
+                Expense.objects.filter(billing_cycle__property__user=user).order_by('-created_at', '-pk')[:options['rows']],
+                many=True, context={'request': request}
+            ).data,
+            'tenancy-list': TenancySerializer(
+                Tenancy.objects.filter(unit__property__user=user).select_related('unit', 'tenant')
+                .order_by('-start_date', '-pk')[:options['rows']],
+                many=True, context={'request': request}
+            ).data,
+        }
+        if not any(lists.values()):
+            raise CommandError(f"El usuario '{options['username']}' no tiene gastos ni arrendamientos.")
+
+        results = {}
+        for name, data in lists.items():
+            drf_body = JSONRenderer().render(data, 'application/json')
+            orjson_body = ORJSONRenderer().render(data, 'application/json')
+            render = self._compare(
+                lambda renderer: renderer.render(data, 'application/json'),
+                JSONRenderer(), ORJSONRenderer(), options['iterations']
+            )
+            parse = self._compare(
+                lambda parser: parser.parse(BytesIO(drf_body)),
+                JSONParser(), ORJSONParser(), options['iterations']
+            )
+            results[name] = {
+                'rows': len(data),
+                'bytes': len(drf_body),
+                'identical': drf_body == orjson_body,
+                'render': render,
+                'parse': parse,
+            }
+            self.stdout.write(
+                f"{name:<14} {len(data):>6} filas  "
+                + "  ".join(
+                    f"{step} drf {results[name][step]['drf']['latency_ms']['p50']:>8.2f}ms "
+                    f"orjson {results[name][step]['orjson']['latency_ms']['p50']:>8.2f}ms "
+                    f"x{results[name][step]['speedup']:.1f}"
+                    for step in ('render', 'parse')
+                )
+                + ("" if results[name]['identical'] else "  ¡SALIDA DISTINTA!")
+            )
+
+        parameters = {key: options[key] for key in ('username', 'rows', 'iterations')}
+        write_report(options['output'], 'renderers', parameters, results)
+        self.stdout.write(self.style.SUCCESS(f"Resultados guardados en {options['output']}."))
+
+    def _compare(self, operation, drf, fast, iterations):
+        """Tiempos de `operation` con la clase de DRF y con la de orjson, alternándolas."""
+        latencies = {'drf': [], 'orjson': []}
+        for _ in range(iterations):
+            for mode, instance in (('drf', drf), ('orjson', fast)):
+                start = time.perf_counter()
+                operation(instance)
+                latencies[mode].append(time.perf_counter() - start)
+        result = {mode: summarize(values) for mode, values in latencies.items()}
+        result['speedup'] = round(
+            result['drf']['latency_ms']['p50'] / max(result['orjson']['latency_ms']['p50'], 0.001), 1
+        )
+        return result
@@ -0,0 +1,52 @@
+# backend/properties/management/commands/close_billing_cycles.py
+import os
+from django.core.management.base import BaseCommand, CommandError
+from properties.models import BillingCycle
+from properties.services.billing_close_service import BillingCloseService, DEFAULT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "Cierre de mes: pasa los ciclos de un año/mes de todas las propiedades a revisión o cerrado."
+
+    def add_arguments(self, parser):
+        parser.add_argument('year', type=int, help="Año de los ciclos a cerrar.")
+        parser.add_argument('month', type=int, help="Mes de los ciclos a cerrar (1-12).")
+        parser.add_argument(
+            '--status', default=BillingCycle.Status.CLOSED,
+            choices=[BillingCycle.Status.IN_REVIEW, BillingCycle.Status.CLOSED],
+            help="Estado final de los ciclos (por defecto, cerrado)."
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help="Procesos en paralelo; 1 procesa todo en este proceso."
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+            help="Propiedades por bloque."
+        )
+
+    def handle(self, *args, **options):
+        if not 1 <= options['month'] <= 12:
+            raise CommandError("El mes debe estar entre 1 y 12.")
+        if options['workers'] < 1 or options['chunk_size'] < 1:
+            raise CommandError("--workers y --chunk-size deben ser mayores que cero.")
+
+        def progress(done, total, totals):
+            self.stdout.write(
+                f"Bloque {done}/{total}: {totals['properties']} propiedades, "
+                f"{totals['cycles']} ciclos, {totals['allocations']} asignaciones."
+            )
+
+        result = BillingCloseService.close_month(
+            options['year'],
+            options['month'],
+            target_status=options['status'],
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+            progress=progress,
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['cycles']} ciclos pasados a '{result['status']}' en "
+            f"{result['elapsed_seconds']:.2f}s ({result['cycles_per_second']:.1f} ciclos/s)."
+        ))
@@ -0,0 +1,26 @@
+# backend/properties/management/commands/recompute_allocations.py
+from django.core.management.base import BaseCommand
+from properties.models import Property
+from properties.services.allocation_service import AllocationService
+
+
+class Command(BaseCommand):
+    help = "Recalcula el libro de asignaciones de los ciclos no cerrados."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--property', type=int, action='append', dest='property_ids',
+            help="ID de propiedad a recalcular (puede repetirse). Por defecto, todas."
+        )
+
+    def handle(self, *args, **options):
+        property_ids = options['property_ids']
+        if not property_ids:
+            property_ids = Property.objects.order_by('pk').values_list('pk', flat=True)
+
+        count = 0
+        for property_id in property_ids:
+            AllocationService.recompute_property(property_id)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Asignaciones recalculadas para {count} propiedades."))
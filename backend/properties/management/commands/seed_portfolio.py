@@ -0,0 +1,67 @@
+# backend/properties/management/commands/seed_portfolio.py
+from django.core.management.base import BaseCommand, CommandError
+from properties.services.portfolio_service import PortfolioSeedService, DEFAULT_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera una cartera sintética y reproducible para pruebas de carga. "
+        "Ejemplo a escala: --properties 10000 --units 50 --tenancies 4 --months 60 "
+        "(500k unidades, 2M arrendamientos, 5 años de ciclos)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='benchmark', help="Dueño de la cartera; se crea si no existe.")
+        parser.add_argument('--properties', type=int, default=10, help="Número de propiedades.")
+        parser.add_argument('--units', type=int, default=50, help="Unidades por propiedad.")
+        parser.add_argument('--tenancies', type=int, default=4, help="Arrendamientos por unidad.")
+        parser.add_argument('--months', type=int, default=60, help="Ciclos de facturación por propiedad.")
+        parser.add_argument(
+            '--end', default='2025-12',
+            help="Último mes con ciclo (AAAA-MM); fija las fechas para que la cartera sea reproducible."
+        )
+        parser.add_argument('--seed', type=int, default=0, help="Semilla para datos reproducibles.")
+        parser.add_argument(
+            '--skip-allocations', action='store_true',
+            help="No calcula el libro de asignaciones (mucho más rápido a gran escala)."
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+            help="Propiedades por bloque; cada bloque se guarda en una transacción."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            end_year, end_month = (int(part) for part in options['end'].split('-'))
+        except ValueError:
+            raise CommandError("--end debe tener el formato AAAA-MM.")
+
+        def progress(done, total, totals):
+            self.stdout.write(
+                f"Bloque {done}/{total}: {totals['properties']} propiedades, "
+                f"{totals['units']} unidades, {totals['tenancies']} arrendamientos."
+            )
+
+        try:
+            result = PortfolioSeedService.seed(
+                options['username'],
+                properties=options['properties'],
+                units_per_property=options['units'],
+                tenancies_per_unit=options['tenancies'],
+                months=options['months'],
+                end_year=end_year,
+                end_month=end_month,
+                seed=options['seed'],
+                allocations=not options['skip_allocations'],
+                chunk_size=options['chunk_size'],
+                progress=progress,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Cartera de '{options['username']}' creada en {result['elapsed_seconds']:.1f}s: "
+            f"{result['properties']} propiedades, {result['units']} unidades, "
+            f"{result['tenancies']} arrendamientos, {result['billing_cycles']} ciclos, "
+            f"{result['expenses']} gastos, {result['allocations']} asignaciones."
+        ))
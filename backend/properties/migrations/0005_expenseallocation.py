@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0004_expense'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExpenseAllocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, help_text='El monto que corresponde a la unidad.', max_digits=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('billing_cycle', models.ForeignKey(help_text='El ciclo de facturación al que pertenece el gasto.', on_delete=django.db.models.deletion.CASCADE, related_name='allocations', to='properties.billingcycle')),
+                ('expense', models.ForeignKey(help_text='El gasto que se reparte.', on_delete=django.db.models.deletion.CASCADE, related_name='allocations', to='properties.expense')),
+                ('unit', models.ForeignKey(help_text='La unidad a la que se asigna la porción.', on_delete=django.db.models.deletion.CASCADE, related_name='allocations', to='properties.unit')),
+            ],
+            options={
+                'verbose_name': 'Expense Allocation',
+                'verbose_name_plural': 'Expense Allocations',
+                'indexes': [models.Index(fields=['billing_cycle', 'unit'], name='properties__billing_9378c3_idx')],
+                'constraints': [models.UniqueConstraint(fields=('expense', 'unit'), name='unique_expense_unit_allocation')],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:54
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0005_expenseallocation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unit',
+            name='area',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='El área de la unidad en m², usada en el ajuste proporcional por área.', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='fixed_fee',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='La cuota fija mensual de la unidad, usada en la regla de cuota fija.', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.CreateModel(
+            name='MeterReading',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('service_type', models.CharField(help_text='El tipo de servicio medido (ej. electricity, water).', max_length=50)),
+                ('previous_reading', models.DecimalField(decimal_places=3, help_text='La lectura del medidor al inicio del ciclo.', max_digits=12)),
+                ('current_reading', models.DecimalField(decimal_places=3, help_text='La lectura del medidor al final del ciclo.', max_digits=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('billing_cycle', models.ForeignKey(help_text='El ciclo de facturación al que corresponde la lectura.', on_delete=django.db.models.deletion.CASCADE, related_name='meter_readings', to='properties.billingcycle')),
+                ('unit', models.ForeignKey(help_text='La unidad cuyo medidor se leyó.', on_delete=django.db.models.deletion.CASCADE, related_name='meter_readings', to='properties.unit')),
+            ],
+            options={
+                'verbose_name': 'Meter Reading',
+                'verbose_name_plural': 'Meter Readings',
+                'constraints': [models.UniqueConstraint(fields=('billing_cycle', 'unit', 'service_type'), name='unique_cycle_unit_service_meter_reading')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0006_unit_area_fixed_fee_meterreading'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='billingcycle',
+            index=models.Index(fields=['property', 'year', 'month', 'id'], name='properties__propert_f4a0c1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['billing_cycle', 'created_at', 'id'], name='properties__billing_7f0532_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['user', 'name', 'id'], name='properties__user_id_8df2d7_idx'),
+        ),
+    ]
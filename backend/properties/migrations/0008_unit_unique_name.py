@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0007_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='unit',
+            constraint=models.UniqueConstraint(fields=('property', 'name'), name='unique_property_unit_name'),
+        ),
+    ]
@@ -3,6 +3,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 
 class Property(models.Model):
     """
@@ -21,6 +22,10 @@ class Property(models.Model):
 
     class Meta:
         verbose_name_plural = "Properties" # Corrige el plural en el admin de Django
+        indexes = [
+            # Listado paginado por cursor: propiedades del usuario por nombre.
+            models.Index(fields=['user', 'name', 'id']),
+        ]
 
     def __str__(self):
         return f'{self.name} ({self.user.username})'
@@ -35,9 +40,37 @@ class Unit(models.Model):
     # related_name='units' nos permite acceder a las unidades desde una instancia de Property (ej. property.units.all())
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='units')
 
+    # Datos usados por las reglas de área y cuota fija.
+    area = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(0)],
+        help_text="El área de la unidad en m², usada en el ajuste proporcional por área."
+    )
+    fixed_fee = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(0)],
+        help_text="La cuota fija mensual de la unidad, usada en la regla de cuota fija."
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # El nombre de una unidad es único dentro de su propiedad; la base de datos
+        # lo garantiza también en las altas masivas y concurrentes.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['property', 'name'],
+                name='unique_property_unit_name'
+            )
+        ]
+
     def __str__(self):
         return f'{self.name} ({self.property.name})'
 
@@ -85,6 +118,10 @@ class BillingCycle(models.Model):
         verbose_name = "Billing Cycle"
         verbose_name_plural = "Billing Cycles"
         ordering = ['-year', '-month']  # Ordenar por más reciente primero
+        indexes = [
+            # Listado paginado por cursor (se recorre en sentido inverso).
+            models.Index(fields=['property', 'year', 'month', 'id']),
+        ]
 
     def clean(self):
         """
@@ -144,6 +181,127 @@ class Expense(models.Model):
         verbose_name = "Expense"
         verbose_name_plural = "Expenses"
         ordering = ['-created_at']  # Ordenar por más reciente primero
+        indexes = [
+            # Listado paginado por cursor (se recorre en sentido inverso).
+            models.Index(fields=['billing_cycle', 'created_at', 'id']),
+        ]
     
     def __str__(self):
-        return f'{self.service_type} - S/ {self.total_amount:.2f} ({self.billing_cycle})'
\ No newline at end of file
+        return f'{self.service_type} - S/ {self.total_amount:.2f} ({self.billing_cycle})'
+
+
+class MeterReading(models.Model):
+    """
+    Representa la lectura del medidor de una unidad para un servicio en un ciclo.
+    El consumo (lectura actual - lectura anterior) se usa en el ajuste por consumo.
+    """
+    unit = models.ForeignKey(
+        Unit,
+        on_delete=models.CASCADE,
+        related_name='meter_readings',
+        help_text="La unidad cuyo medidor se leyó."
+    )
+    billing_cycle = models.ForeignKey(
+        BillingCycle,
+        on_delete=models.CASCADE,
+        related_name='meter_readings',
+        help_text="El ciclo de facturación al que corresponde la lectura."
+    )
+    service_type = models.CharField(
+        max_length=50,
+        help_text="El tipo de servicio medido (ej. electricity, water)."
+    )
+    previous_reading = models.DecimalField(
+        max_digits=12,
+        decimal_places=3,
+        help_text="La lectura del medidor al inicio del ciclo."
+    )
+    current_reading = models.DecimalField(
+        max_digits=12,
+        decimal_places=3,
+        help_text="La lectura del medidor al final del ciclo."
+    )
+
+    # Campos de auditoría
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['billing_cycle', 'unit', 'service_type'],
+                name='unique_cycle_unit_service_meter_reading'
+            )
+        ]
+        verbose_name = "Meter Reading"
+        verbose_name_plural = "Meter Readings"
+
+    def clean(self):
+        """
+        Validación personalizada para el modelo MeterReading.
+        """
+        if self.current_reading < self.previous_reading:
+            raise ValidationError("La lectura actual no puede ser menor que la lectura anterior.")
+
+    def save(self, *args, **kwargs):
+        self.clean()
+        super().save(*args, **kwargs)
+
+    @property
+    def consumption(self):
+        """
+        Retorna el consumo registrado en el ciclo.
+        """
+        return self.current_reading - self.previous_reading
+
+    def __str__(self):
+        return f'{self.unit.name} - {self.service_type}: {self.consumption} ({self.billing_cycle})'
+
+class ExpenseAllocation(models.Model):
+    """
+    Representa la porción de un gasto que corresponde a una unidad.
+    Es un registro materializado: se recalcula cuando cambian sus datos de origen.
+    """
+    expense = models.ForeignKey(
+        Expense,
+        on_delete=models.CASCADE,
+        related_name='allocations',
+        help_text="El gasto que se reparte."
+    )
+    # Desnormalizado desde el gasto para leer el desglose de un ciclo con un solo índice.
+    billing_cycle = models.ForeignKey(
+        BillingCycle,
+        on_delete=models.CASCADE,
+        related_name='allocations',
+        help_text="El ciclo de facturación al que pertenece el gasto."
+    )
+    unit = models.ForeignKey(
+        Unit,
+        on_delete=models.CASCADE,
+        related_name='allocations',
+        help_text="La unidad a la que se asigna la porción."
+    )
+    amount = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        help_text="El monto que corresponde a la unidad."
+    )
+
+    # Campos de auditoría
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['expense', 'unit'],
+                name='unique_expense_unit_allocation'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['billing_cycle', 'unit']),
+        ]
+        verbose_name = "Expense Allocation"
+        verbose_name_plural = "Expense Allocations"
+
+    def __str__(self):
+        return f'{self.unit.name}: S/ {self.amount:.2f} ({self.expense.service_type})'
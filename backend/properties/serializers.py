@@ -1,7 +1,10 @@
 # backend/properties/serializers.py
+from collections import Counter
 from rest_framework import serializers
 from django.utils import timezone
-from .models import Property, Unit, BillingCycle, Expense
+from .models import Property, Unit, BillingCycle, Expense, ExpenseAllocation, MeterReading
+from .services.billing_cycle_service import MAX_BULK_MONTHS
+from .services.unit_service import MAX_BULK_UNITS, UnitService
 from tenants.serializers import TenantSerializer
 from rules.models import ServiceRule
 
@@ -17,7 +20,7 @@ class UnitSerializer(serializers.ModelSerializer):
     tenant = TenantSerializer(read_only=True, allow_null=True)
     class Meta:
         model = Unit
-        fields = ['id', 'name', 'created_at', 'updated_at', 'tenant']
+        fields = ['id', 'name', 'area', 'fixed_fee', 'created_at', 'updated_at', 'tenant']
 
 
 class UnitCreateSerializer(serializers.ModelSerializer):
@@ -26,7 +29,7 @@ class UnitCreateSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Unit
-        fields = ['name']
+        fields = ['name', 'area', 'fixed_fee']
         
     def validate_name(self, value):
         """
@@ -38,13 +41,62 @@ class UnitCreateSerializer(serializers.ModelSerializer):
         return value
 
 
+class UnitBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Serializador de cada unidad de un alta masiva. La unicidad de los nombres
+    se comprueba para todo el lote de una vez en el servicio.
+    """
+    class Meta:
+        model = Unit
+        fields = ['name', 'area', 'fixed_fee']
+
+
+class UnitBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializador para crear varias unidades a la vez.
+    Acepta una lista de unidades (units) o un patrón de nombres (pattern) con
+    un área y una cuota fija comunes.
+    """
+    units = UnitBulkItemSerializer(many=True, required=False, allow_empty=False)
+    pattern = serializers.CharField(max_length=255, required=False)
+    area = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0, required=False, allow_null=True)
+    fixed_fee = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0, required=False, allow_null=True)
+
+    def validate(self, attrs):
+        """
+        Normaliza la petición a una lista de unidades sin nombres repetidos.
+        """
+        if ('units' in attrs) == ('pattern' in attrs):
+            raise serializers.ValidationError("Debe indicar una lista de unidades o un patrón de nombres.")
+
+        if 'pattern' in attrs:
+            attrs['units'] = [
+                {'name': name, 'area': attrs.get('area'), 'fixed_fee': attrs.get('fixed_fee')}
+                for name in UnitService.expand_name_pattern(attrs['pattern'])
+            ]
+
+        units = attrs['units']
+        if len(units) > MAX_BULK_UNITS:
+            raise serializers.ValidationError(
+                f"No se pueden crear más de {MAX_BULK_UNITS} unidades por petición."
+            )
+        duplicated = sorted(
+            name for name, count in Counter(unit['name'] for unit in units).items() if count > 1
+        )
+        if duplicated:
+            raise serializers.ValidationError(
+                f"La petición repite estos nombres: {', '.join(duplicated)}."
+            )
+        return attrs
+
+
 class UnitUpdateSerializer(serializers.ModelSerializer):
     """
     Serializador para actualizar unidades.
     """
     class Meta:
         model = Unit
-        fields = ['name']
+        fields = ['name', 'area', 'fixed_fee']
         
     def validate_name(self, value):
         """
@@ -133,6 +185,102 @@ class BillingCycleCreateSerializer(serializers.ModelSerializer):
             )
 
 
+class ServiceTypeTotalSerializer(serializers.Serializer):
+    """
+    Total de gastos de un tipo de servicio dentro del resumen de un ciclo.
+    """
+    service_type = serializers.CharField()
+    service_type_display = serializers.SerializerMethodField()
+    expense_count = serializers.IntegerField()
+    total_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+    def get_service_type_display(self, obj):
+        service_choices = dict(ServiceRule.ServiceType.choices)
+        return service_choices.get(obj['service_type'], obj['service_type'])
+
+
+class UnitTotalSerializer(serializers.Serializer):
+    """
+    Total asignado a una unidad dentro del resumen de un ciclo.
+    """
+    unit = serializers.IntegerField()
+    unit_name = serializers.CharField()
+    total_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+class BillingCycleSummarySerializer(serializers.Serializer):
+    """
+    Serializer para el resumen agregado de un ciclo de facturación.
+    """
+    billing_cycle = serializers.IntegerField()
+    month = serializers.IntegerField()
+    year = serializers.IntegerField()
+    status = serializers.CharField()
+    expense_count = serializers.IntegerField()
+    total_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    by_service_type = ServiceTypeTotalSerializer(many=True)
+    allocated_amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    by_unit = UnitTotalSerializer(many=True)
+
+
+class BillingCycleBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer para abrir ciclos de facturación en varias propiedades a la vez.
+    Acepta un mes (year/month) o un rango de meses (hasta end_year/end_month).
+    """
+    property_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        help_text="Propiedades en las que abrir ciclos. Por defecto, todas las del usuario."
+    )
+    year = serializers.IntegerField(min_value=2020, max_value=2030)
+    month = serializers.IntegerField(min_value=1, max_value=12)
+    end_year = serializers.IntegerField(min_value=2020, max_value=2030, required=False)
+    end_month = serializers.IntegerField(min_value=1, max_value=12, required=False)
+
+    def validate(self, attrs):
+        """
+        Validaciones del rango de meses.
+        """
+        if ('end_year' in attrs) != ('end_month' in attrs):
+            raise serializers.ValidationError("Debe indicar end_year y end_month juntos.")
+
+        start = (attrs['year'], attrs['month'])
+        end = (attrs.get('end_year', attrs['year']), attrs.get('end_month', attrs['month']))
+        if end < start:
+            raise serializers.ValidationError("El fin del rango no puede ser anterior a su inicio.")
+
+        # Validar que no sea una fecha futura
+        current_date = timezone.now().date()
+        if end > (current_date.year, current_date.month):
+            raise serializers.ValidationError(
+                "No se pueden crear ciclos de facturación para fechas futuras."
+            )
+
+        months = (end[0] - start[0]) * 12 + end[1] - start[1] + 1
+        if months > MAX_BULK_MONTHS:
+            raise serializers.ValidationError(
+                f"No se pueden abrir más de {MAX_BULK_MONTHS} meses por petición."
+            )
+
+        if 'property_ids' in attrs:
+            attrs['property_ids'] = list(dict.fromkeys(attrs['property_ids']))
+        return attrs
+
+
+class BillingCycleCloseSerializer(serializers.Serializer):
+    """
+    Serializer para el cierre de mes de los ciclos de facturación.
+    """
+    year = serializers.IntegerField(min_value=2020, max_value=2030)
+    month = serializers.IntegerField(min_value=1, max_value=12)
+    status = serializers.ChoiceField(
+        choices=[BillingCycle.Status.IN_REVIEW, BillingCycle.Status.CLOSED],
+        default=BillingCycle.Status.CLOSED
+    )
+
+
 class BillingCycleListSerializer(serializers.ModelSerializer):
     """
     Serializer simplificado para listas de ciclos de facturación.
@@ -243,3 +391,61 @@ class ExpenseCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("El monto debe ser mayor a 0.")
         return value
 
+
+class ExpenseAllocationSerializer(serializers.ModelSerializer):
+    """
+    Serializer de solo lectura para el desglose de un gasto por unidad.
+    """
+    service_type = serializers.CharField(source='expense.service_type', read_only=True)
+    unit_name = serializers.CharField(source='unit.name', read_only=True)
+
+    class Meta:
+        model = ExpenseAllocation
+        fields = ['id', 'expense', 'service_type', 'unit', 'unit_name', 'amount']
+        read_only_fields = fields
+
+
+class MeterReadingSerializer(serializers.ModelSerializer):
+    """
+    Serializer para las lecturas de medidores de un ciclo de facturación.
+    """
+    unit_name = serializers.CharField(source='unit.name', read_only=True)
+    consumption = serializers.DecimalField(max_digits=12, decimal_places=3, read_only=True)
+
+    class Meta:
+        model = MeterReading
+        fields = [
+            'id', 'unit', 'unit_name', 'service_type', 'previous_reading',
+            'current_reading', 'consumption', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['created_at', 'updated_at']
+
+    def validate_unit(self, value):
+        """
+        Valida que la unidad pertenezca a la propiedad del ciclo.
+        """
+        billing_cycle = self.context.get('billing_cycle')
+        if billing_cycle and value.property_id != billing_cycle.property_id:
+            raise serializers.ValidationError("La unidad no pertenece a la propiedad de este ciclo.")
+        return value
+
+    def validate_service_type(self, value):
+        """
+        Valida que el service_type sea uno de los tipos válidos.
+        """
+        valid_choices = [choice[0] for choice in ServiceRule.ServiceType.choices]
+        if value not in valid_choices:
+            raise serializers.ValidationError(
+                f"Tipo de servicio inválido. Debe ser uno de: {', '.join(valid_choices)}"
+            )
+        return value
+
+    def validate(self, attrs):
+        """
+        Valida que la lectura actual no sea menor que la anterior.
+        """
+        if attrs['current_reading'] < attrs['previous_reading']:
+            raise serializers.ValidationError(
+                "La lectura actual no puede ser menor que la lectura anterior."
+            )
+        return attrs
@@ -0,0 +1,202 @@
+# backend/properties/services/allocation_service.py
+from django.db import transaction
+from django.db.models import Q
+from ..models import Unit, BillingCycle, Expense, ExpenseAllocation, MeterReading
+from rules.models import ServiceRule
+from tenants.services import OccupancyService
+from .summary_service import BillingCycleSummaryService
+from rules.allocation import (
+    AllocationContext, allocate_expenses, cents_to_decimal, get_allocator
+)
+
+
+class AllocationService:
+    """
+    Servicio que mantiene el libro de asignaciones (ExpenseAllocation).
+
+    Cada fila guarda lo que una unidad debe por un gasto. Las filas solo se
+    recalculan para los ciclos afectados por un cambio; los ciclos cerrados
+    quedan congelados.
+    """
+
+    @staticmethod
+    def get_cycle_breakdown(billing_cycle):
+        """Obtiene el desglose por unidad de todos los gastos de un ciclo."""
+        return (
+            ExpenseAllocation.objects
+            .filter(billing_cycle=billing_cycle)
+            .select_related('expense', 'unit')
+            .order_by('expense_id', 'unit_id')
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def recompute_cycle(billing_cycle, expense_ids=None, service_types=None):
+        """
+        Recalcula las asignaciones de un ciclo.
+
+        Args:
+            billing_cycle: El ciclo a recalcular.
+            expense_ids: Si se indica, solo se recalculan estos gastos.
+            service_types: Si se indica, solo se recalculan gastos de estos servicios.
+
+        Returns:
+            int: Número de filas escritas.
+        """
+        # Sus asignaciones quedan congeladas, pero sus gastos cuentan en el resumen.
+        BillingCycleSummaryService.bump_version(billing_cycle.pk)
+        if billing_cycle.status == BillingCycle.Status.CLOSED:
+            return 0
+
+        stale = ExpenseAllocation.objects.filter(billing_cycle=billing_cycle)
+        if expense_ids is not None:
+            stale = stale.filter(expense_id__in=expense_ids)
+        if service_types is not None:
+            stale = stale.filter(expense__service_type__in=service_types)
+        stale.delete()
+
+        rows = AllocationService.build_rows(billing_cycle, expense_ids, service_types)
+        ExpenseAllocation.objects.bulk_create(rows)
+        return len(rows)
+
+    @staticmethod
+    def build_rows(billing_cycle, expense_ids=None, service_types=None):
+        """
+        Calcula, sin escribirlas, las filas de asignación de los gastos de un ciclo.
+        Admite los mismos filtros que recompute_cycle.
+        """
+        expenses = Expense.objects.filter(billing_cycle=billing_cycle)
+        if expense_ids is not None:
+            expenses = expenses.filter(pk__in=expense_ids)
+        if service_types is not None:
+            expenses = expenses.filter(service_type__in=service_types)
+
+        rules = {
+            service_type: (rule_type, rounding_mode)
+            for service_type, rule_type, rounding_mode in ServiceRule.objects.filter(
+                property_id=billing_cycle.property_id
+            ).values_list('service_type', 'rule_type', 'rounding_mode')
+        }
+
+        # Solo se reparten gastos cuya regla tiene un repartidor registrado.
+        allocated_ids = []
+        pending = []
+        for expense_id, service_type, amount in expenses.values_list(
+            'pk', 'service_type', 'total_amount'
+        ):
+            if service_type not in rules:
+                continue
+            rule_type, rounding_mode = rules[service_type]
+            if get_allocator(rule_type) is None:
+                continue
+            allocated_ids.append(expense_id)
+            pending.append((rule_type, service_type, amount, rounding_mode))
+        if not pending:
+            return []
+
+        context = AllocationService.build_context(
+            billing_cycle, rule_types={rule_type for rule_type, _, _, _ in pending}
+        )
+        shares = allocate_expenses(pending, context)
+
+        return [
+            ExpenseAllocation(
+                expense_id=expense_id,
+                billing_cycle_id=billing_cycle.pk,
+                unit_id=unit_id,
+                amount=cents_to_decimal(cents),
+            )
+            for expense_id, row in zip(allocated_ids, shares)
+            for unit_id, cents in zip(context.unit_ids, row)
+        ]
+
+    @staticmethod
+    def build_context(billing_cycle, rule_types):
+        """
+        Carga en una consulta los datos de las unidades que necesitan las reglas
+        indicadas. Los días-ocupante (del calendario de ocupación o, fuera de él, de
+        los arrendamientos) y las lecturas de medidores solo se cargan si alguna regla los usa.
+        """
+        units = list(
+            Unit.objects.filter(property_id=billing_cycle.property_id)
+            .order_by('pk')
+            .values_list('pk', 'area', 'fixed_fee')
+        )
+        unit_ids = [unit[0] for unit in units]
+
+        occupant_days = None
+        if ServiceRule.RuleType.OCCUPANT_PRORATION in rule_types:
+            days_by_unit = OccupancyService.get_occupant_days(
+                [billing_cycle.property_id], billing_cycle.year, billing_cycle.month
+            )
+            occupant_days = [days_by_unit.get(unit_id, 0) for unit_id in unit_ids]
+
+        consumption = {}
+        if ServiceRule.RuleType.CONSUMPTION_ADJUSTMENT in rule_types:
+            positions = {unit_id: index for index, unit_id in enumerate(unit_ids)}
+            readings = MeterReading.objects.filter(billing_cycle=billing_cycle).values_list(
+                'unit_id', 'service_type', 'previous_reading', 'current_reading'
+            )
+            for unit_id, service_type, previous_reading, current_reading in readings:
+                values = consumption.setdefault(service_type, [None] * len(unit_ids))
+                values[positions[unit_id]] = current_reading - previous_reading
+
+        return AllocationContext(
+            unit_ids,
+            occupant_days=occupant_days,
+            areas=[unit[1] for unit in units],
+            fixed_fees=[unit[2] for unit in units],
+            consumption=consumption,
+        )
+
+    @staticmethod
+    def recompute_property(property_id, service_types=None, start_date=None, end_date=None):
+        """
+        Recalcula los ciclos no cerrados de una propiedad.
+
+        Args:
+            property_id: La propiedad afectada.
+            service_types: Si se indica, solo se recalculan gastos de estos servicios.
+            start_date, end_date: Si se indican, solo los ciclos cuyo mes se cruza
+                con el período (end_date=None significa período abierto).
+        """
+        cycles = BillingCycle.objects.filter(property_id=property_id).exclude(
+            status=BillingCycle.Status.CLOSED
+        )
+        if start_date is not None:
+            cycles = cycles.filter(
+                Q(year__gt=start_date.year) |
+                Q(year=start_date.year, month__gte=start_date.month)
+            )
+        if end_date is not None:
+            cycles = cycles.filter(
+                Q(year__lt=end_date.year) |
+                Q(year=end_date.year, month__lte=end_date.month)
+            )
+
+        for billing_cycle in cycles:
+            AllocationService.recompute_cycle(billing_cycle, service_types=service_types)
+
+    @staticmethod
+    def clear_service(property_id, service_type):
+        """Elimina las asignaciones de un servicio en los ciclos no cerrados de una propiedad."""
+        allocations = ExpenseAllocation.objects.filter(
+            billing_cycle__property_id=property_id,
+            expense__service_type=service_type
+        ).exclude(
+            billing_cycle__status=BillingCycle.Status.CLOSED
+        )
+        BillingCycleSummaryService.bump_version(
+            *set(allocations.values_list('billing_cycle_id', flat=True))
+        )
+        allocations.delete()
+
+    @staticmethod
+    def service_types_for_rules(property_id, rule_types):
+        """Servicios de la propiedad que se reparten con alguna de las reglas indicadas."""
+        return list(
+            ServiceRule.objects.filter(
+                property_id=property_id,
+                rule_type__in=rule_types
+            ).values_list('service_type', flat=True)
+        )
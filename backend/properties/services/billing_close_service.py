@@ -0,0 +1,173 @@
+# backend/properties/services/billing_close_service.py
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.db import connections, transaction
+from django.utils import timezone
+from ..models import BillingCycle, ExpenseAllocation
+from .allocation_service import AllocationService
+from .summary_service import BillingCycleSummaryService
+from core.response_cache import ResponseCache
+
+# Estados desde los que se puede pasar a cada estado de cierre.
+CLOSABLE_FROM = {
+    BillingCycle.Status.IN_REVIEW: [BillingCycle.Status.OPEN],
+    BillingCycle.Status.CLOSED: [BillingCycle.Status.OPEN, BillingCycle.Status.IN_REVIEW],
+}
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+def _init_worker():
+    """
+    Prepara un proceso del pool: configura Django si el proceso no lo heredó
+    y descarta las conexiones copiadas del proceso padre.
+    """
+    import django
+    django.setup()
+    connections.close_all()
+
+
+def _close_chunk_worker(property_ids, year, month, target_status):
+    """Punto de entrada de cada tarea del pool (debe ser serializable)."""
+    return BillingCloseService.close_chunk(property_ids, year, month, target_status)
+
+
+class BillingCloseService:
+    """
+    Servicio de cierre de mes: lleva los ciclos de un año/mes de muchas
+    propiedades a IN_REVIEW o CLOSED.
+
+    Las propiedades se procesan por bloques; cada bloque recalcula el libro de
+    asignaciones de sus ciclos, lo escribe con un solo bulk_create y cambia el
+    estado con un solo UPDATE, todo en una transacción. Con workers > 1 los
+    bloques se reparten en un ProcessPoolExecutor.
+
+    Las cachés se invalidan en el proceso que lanza el cierre, al recibir el
+    resultado de cada bloque: con cachés en memoria, lo que invalidara un
+    proceso del pool se perdería al terminar.
+    """
+
+    @staticmethod
+    def pending_property_ids(year, month, target_status, properties=None):
+        """
+        IDs de las propiedades con un ciclo del año/mes que puede pasar a target_status.
+
+        Args:
+            properties: Si se indica, un queryset de propiedades al que limitar el cierre.
+        """
+        cycles = BillingCycle.objects.filter(
+            year=year,
+            month=month,
+            status__in=CLOSABLE_FROM[target_status]
+        )
+        if properties is not None:
+            cycles = cycles.filter(property__in=properties)
+        return list(cycles.order_by('property_id').values_list('property_id', flat=True))
+
+    @staticmethod
+    def close_chunk(property_ids, year, month, target_status):
+        """
+        Cierra los ciclos del año/mes de un bloque de propiedades.
+
+        No invalida las cachés: eso lo hace invalidate() con los IDs que devuelve.
+
+        Returns:
+            dict: Propiedades del bloque, ciclos cerrados y filas de asignación
+            escritas, y los IDs de los ciclos cerrados y de sus propiedades.
+        """
+        with transaction.atomic():
+            # Bloquear los ciclos evita que dos cierres simultáneos procesen el mismo ciclo.
+            cycles = list(
+                BillingCycle.objects.select_for_update().filter(
+                    property_id__in=property_ids,
+                    year=year,
+                    month=month,
+                    status__in=CLOSABLE_FROM[target_status]
+                ).order_by('pk')
+            )
+            cycle_ids = [cycle.pk for cycle in cycles]
+
+            ExpenseAllocation.objects.filter(billing_cycle_id__in=cycle_ids).delete()
+            rows = []
+            for billing_cycle in cycles:
+                rows.extend(AllocationService.build_rows(billing_cycle))
+            ExpenseAllocation.objects.bulk_create(rows, batch_size=1000)
+
+            # update() no aplica auto_now; updated_at alimenta el GET condicional.
+            BillingCycle.objects.filter(pk__in=cycle_ids).update(
+                status=target_status, updated_at=timezone.now()
+            )
+
+        return {
+            'properties': len(property_ids),
+            'cycles': len(cycle_ids),
+            'allocations': len(rows),
+            'cycle_ids': cycle_ids,
+            'property_ids': sorted({cycle.property_id for cycle in cycles}),
+        }
+
+    @staticmethod
+    def invalidate(cycle_ids, property_ids):
+        """Invalida los resúmenes y las respuestas de los ciclos cerrados de un bloque."""
+        BillingCycleSummaryService.bump_version(*cycle_ids)
+        ResponseCache.bump_properties(*property_ids)
+
+    @staticmethod
+    def close_month(year, month, target_status=BillingCycle.Status.CLOSED, properties=None,
+                    workers=1, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        """
+        Cierra los ciclos de un año/mes de todas las propiedades (o de las indicadas).
+
+        Args:
+            target_status: IN_REVIEW o CLOSED.
+            properties: Queryset opcional de propiedades a cerrar.
+            workers: Número de procesos; con 1 los bloques se procesan en este proceso.
+            chunk_size: Propiedades por bloque.
+            progress: Función opcional que recibe (bloques terminados, total de bloques, totales).
+
+        Returns:
+            dict: Totales del cierre, duración en segundos y ciclos por segundo.
+        """
+        if target_status not in CLOSABLE_FROM:
+            raise ValueError(f"Estado de cierre no válido: {target_status}")
+
+        started = time.perf_counter()
+        property_ids = BillingCloseService.pending_property_ids(
+            year, month, target_status, properties
+        )
+        chunks = [
+            property_ids[index:index + chunk_size]
+            for index in range(0, len(property_ids), chunk_size)
+        ]
+        totals = {'properties': 0, 'cycles': 0, 'allocations': 0}
+
+        def collect(result, done):
+            BillingCloseService.invalidate(result['cycle_ids'], result['property_ids'])
+            for key in totals:
+                totals[key] += result[key]
+            if progress is not None:
+                progress(done, len(chunks), dict(totals))
+
+        if workers > 1 and len(chunks) > 1:
+            # Los procesos hijos no deben heredar las conexiones abiertas del padre.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = [
+                    executor.submit(_close_chunk_worker, chunk, year, month, target_status)
+                    for chunk in chunks
+                ]
+                for done, future in enumerate(as_completed(futures), start=1):
+                    collect(future.result(), done)
+        else:
+            for done, chunk in enumerate(chunks, start=1):
+                collect(BillingCloseService.close_chunk(chunk, year, month, target_status), done)
+
+        elapsed = time.perf_counter() - started
+        totals.update(
+            year=year,
+            month=month,
+            status=target_status,
+            elapsed_seconds=round(elapsed, 3),
+            cycles_per_second=round(totals['cycles'] / elapsed, 1) if elapsed else 0.0,
+        )
+        return totals
@@ -0,0 +1,97 @@
+# backend/properties/services/billing_cycle_service.py
+from django.db import transaction
+from ..models import BillingCycle
+from core.response_cache import ResponseCache
+
+# Máximo de meses que se pueden abrir en una sola petición masiva.
+MAX_BULK_MONTHS = 24
+
+
+class BillingCycleService:
+    """Servicio para encapsular la lógica de negocio de los ciclos de facturación."""
+
+    @staticmethod
+    def get_property_id(billing_cycle_id):
+        """
+        ID de la propiedad de un ciclo, o None si no existe. Un ciclo nunca
+        cambia de propiedad, así que el valor se recuerda en caché.
+        """
+        return ResponseCache.remember(
+            f'billing-cycle:{billing_cycle_id}:property',
+            lambda: BillingCycle.objects.filter(pk=billing_cycle_id).values_list(
+                'property_id', flat=True
+            ).first()
+        )
+
+    @staticmethod
+    async def aget_property_id(billing_cycle_id):
+        """Versión asíncrona de get_property_id, con la misma clave de caché."""
+        return await ResponseCache.aremember(
+            f'billing-cycle:{billing_cycle_id}:property',
+            lambda: BillingCycle.objects.filter(pk=billing_cycle_id).values_list(
+                'property_id', flat=True
+            ).afirst()
+        )
+
+    @staticmethod
+    def month_range(year, month, end_year=None, end_month=None):
+        """
+        Lista de (año, mes) desde year/month hasta end_year/end_month, ambos incluidos.
+        Sin fin, devuelve solo el mes inicial.
+        """
+        if end_year is None or end_month is None:
+            return [(year, month)]
+
+        periods = []
+        current, last = year * 12 + month - 1, end_year * 12 + end_month - 1
+        while current <= last:
+            periods.append((current // 12, current % 12 + 1))
+            current += 1
+        return periods
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_open(property_ids, periods):
+        """
+        Abre los ciclos de varias propiedades y meses con un solo INSERT.
+
+        Los ciclos que ya existen se omiten gracias a ignore_conflicts sobre la
+        restricción unique_property_month_year_billing_cycle.
+
+        Args:
+            property_ids: IDs de propiedades ya verificadas.
+            periods: Lista de (año, mes).
+
+        Returns:
+            dict: {property_id: {'created': [(año, mes)], 'existing': [(año, mes)]}}
+        """
+        years = {year for year, _ in periods}
+        months = {month for _, month in periods}
+        existing = set(
+            BillingCycle.objects.filter(
+                property_id__in=property_ids,
+                year__in=years,
+                month__in=months
+            ).order_by().values_list('property_id', 'year', 'month')
+        )
+
+        results = {}
+        new_cycles = []
+        for property_id in property_ids:
+            result = results.setdefault(property_id, {'created': [], 'existing': []})
+            for year, month in periods:
+                if (property_id, year, month) in existing:
+                    result['existing'].append((year, month))
+                    continue
+                result['created'].append((year, month))
+                new_cycles.append(BillingCycle(
+                    property_id=property_id,
+                    year=year,
+                    month=month,
+                    status=BillingCycle.Status.OPEN
+                ))
+
+        BillingCycle.objects.bulk_create(new_cycles, ignore_conflicts=True)
+        # bulk_create no emite señales: invalidar los listados de ciclos.
+        ResponseCache.bump_properties(*{cycle.property_id for cycle in new_cycles})
+        return results
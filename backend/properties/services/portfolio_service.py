@@ -0,0 +1,212 @@
+# backend/properties/services/portfolio_service.py
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.db import transaction
+from ..models import Property, Unit, BillingCycle, Expense, ExpenseAllocation
+from .allocation_service import AllocationService
+from rules.models import ServiceRule
+from tenants.models import Tenant, Tenancy
+from tenants.services import OccupancyService
+
+DEFAULT_CHUNK_SIZE = 100
+
+# Filas de asignación acumuladas antes de escribirlas, para acotar la memoria.
+ALLOCATION_FLUSH_ROWS = 20000
+
+# Servicios que se configuran en cada propiedad, uno por tipo de regla sin medidores.
+SEED_RULES = [
+    (ServiceRule.ServiceType.WATER, ServiceRule.RuleType.EQUAL_DIVISION),
+    (ServiceRule.ServiceType.ELECTRICITY, ServiceRule.RuleType.PROPORTIONAL_AREA),
+    (ServiceRule.ServiceType.GAS, ServiceRule.RuleType.OCCUPANT_PRORATION),
+    (ServiceRule.ServiceType.MAINTENANCE, ServiceRule.RuleType.FIXED_FEE),
+]
+
+
+def _month_start(index):
+    """Primer día del mes con índice año * 12 + (mes - 1)."""
+    year, month = divmod(index, 12)
+    return date(year, month + 1, 1)
+
+
+class PortfolioSeedService:
+    """
+    Generador de carteras sintéticas para pruebas de carga.
+
+    Crea propiedades, unidades, inquilinos, arrendamientos, reglas, ciclos y
+    gastos con los modelos reales y bulk_create, por bloques de propiedades.
+    Como bulk_create no emite señales, cada bloque deriva después el
+    calendario de ocupación y el libro de asignaciones con los mismos
+    servicios que usa la aplicación.
+
+    Los datos dependen solo de los parámetros: la misma semilla produce la
+    misma cartera. Las fechas se fijan con end_year/end_month, no con la
+    fecha actual.
+    """
+
+    @staticmethod
+    def seed(username, properties=10, units_per_property=50, tenancies_per_unit=4,
+             months=60, end_year=2025, end_month=12, seed=0, allocations=True,
+             chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        """
+        Genera una cartera para el usuario indicado, que se crea si no existe.
+
+        Args:
+            months: Ciclos de facturación por propiedad; todos cerrados salvo el último.
+            tenancies_per_unit: Arrendamientos consecutivos por unidad, el último sin fin.
+            allocations: Si es False no se calcula el libro de asignaciones.
+            progress: Función opcional llamada con (bloques hechos, total, totales).
+
+        Returns:
+            dict: Filas creadas por modelo y segundos empleados.
+
+        Raises:
+            ValueError: Si el usuario ya tiene propiedades o los parámetros no son válidos.
+        """
+        if min(properties, units_per_property, tenancies_per_unit, months, chunk_size) < 1:
+            raise ValueError("Todos los tamaños deben ser mayores que cero.")
+        if not 1 <= end_month <= 12:
+            raise ValueError("El mes final debe estar entre 1 y 12.")
+
+        user, created = User.objects.get_or_create(username=username)
+        if created:
+            user.set_password(username)
+            user.save(update_fields=['password'])
+        elif user.properties.exists():
+            raise ValueError(f"El usuario '{username}' ya tiene propiedades.")
+
+        start = time.perf_counter()
+        rng = random.Random(seed)
+        last_index = end_year * 12 + end_month - 1
+        month_indexes = range(last_index - months + 1, last_index + 1)
+        totals = dict.fromkeys(
+            ('properties', 'units', 'tenants', 'tenancies', 'billing_cycles', 'expenses', 'allocations'), 0
+        )
+
+        chunks = range(0, properties, chunk_size)
+        for done, first in enumerate(chunks, start=1):
+            count = min(chunk_size, properties - first)
+            chunk_totals = PortfolioSeedService.seed_chunk(
+                user, rng, range(first, first + count), units_per_property,
+                tenancies_per_unit, month_indexes, allocations
+            )
+            for key, value in chunk_totals.items():
+                totals[key] += value
+            if progress is not None:
+                progress(done, len(chunks), totals)
+
+        totals['elapsed_seconds'] = time.perf_counter() - start
+        return totals
+
+    @staticmethod
+    @transaction.atomic
+    def seed_chunk(user, rng, property_numbers, units_per_property, tenancies_per_unit,
+                   month_indexes, allocations):
+        """Genera y guarda un bloque de propiedades con todo lo que cuelga de ellas."""
+        property_objs = Property.objects.bulk_create([
+            Property(
+                name=f"Edificio {number + 1:05d}",
+                address=f"Av. Sintética {number + 1}, Lima",
+                user=user,
+            )
+            for number in property_numbers
+        ])
+
+        numbered_units = [
+            (number, index, Unit(
+                property=property_obj,
+                name=f"Apto {index + 1:03d}",
+                area=Decimal(rng.randint(4000, 15000)).scaleb(-2),
+                fixed_fee=Decimal(rng.randint(50, 300)),
+            ))
+            for number, property_obj in zip(property_numbers, property_objs)
+            for index in range(units_per_property)
+        ]
+        units = Unit.objects.bulk_create([unit for _, _, unit in numbered_units], batch_size=1000)
+
+        # Cada unidad tiene un inquilino (el actual) y su historial son renovaciones
+        # consecutivas entre el primer y el último mes: el modelo solo permite un
+        # inquilino por unidad.
+        history_start = _month_start(month_indexes[0])
+        history_days = (_month_start(month_indexes[-1] + 1) - history_start).days
+        tenants = []
+        tenancies = []
+        for number, index, unit in numbered_units:
+            cuts = sorted(rng.sample(range(1, history_days), min(tenancies_per_unit, history_days) - 1))
+            starts = [history_start] + [history_start + timedelta(days=cut) for cut in cuts]
+            occupants = [rng.randint(1, 5) for _ in starts]
+            tenant = Tenant(
+                name=f"Inquilino {number + 1}-{index + 1}",
+                email=f"inquilino.{user.pk}.{number + 1}.{index + 1}@seed.test",
+                number_of_occupants=occupants[-1],
+                unit=unit,
+            )
+            tenants.append(tenant)
+            for position, period_start in enumerate(starts):
+                is_last = position + 1 == len(starts)
+                tenancies.append(Tenancy(
+                    unit=unit,
+                    tenant=tenant,
+                    number_of_occupants=occupants[position],
+                    start_date=period_start,
+                    end_date=None if is_last else starts[position + 1] - timedelta(days=1),
+                ))
+        Tenant.objects.bulk_create(tenants, batch_size=1000)
+        Tenancy.objects.bulk_create(tenancies, batch_size=1000)
+
+        ServiceRule.objects.bulk_create([
+            ServiceRule(property=property_obj, service_type=service_type, rule_type=rule_type)
+            for property_obj in property_objs
+            for service_type, rule_type in SEED_RULES
+        ])
+
+        cycles = BillingCycle.objects.bulk_create([
+            BillingCycle(
+                property=property_obj,
+                year=month_index // 12,
+                month=month_index % 12 + 1,
+                status=(
+                    BillingCycle.Status.OPEN if month_index == month_indexes[-1]
+                    else BillingCycle.Status.CLOSED
+                ),
+            )
+            for property_obj in property_objs
+            for month_index in month_indexes
+        ], batch_size=1000)
+
+        expenses = Expense.objects.bulk_create([
+            Expense(
+                billing_cycle=cycle,
+                service_type=service_type,
+                total_amount=Decimal(rng.randint(5000, 500000)).scaleb(-2),
+                invoice_pdf=f"invoices/seed/{cycle.year}-{cycle.month:02d}-{service_type}.pdf",
+            )
+            for cycle in cycles
+            for service_type, _ in SEED_RULES
+        ], batch_size=1000)
+
+        OccupancyService.refresh_units([unit.pk for unit in units], history_start)
+
+        allocation_count = 0
+        if allocations:
+            rows = []
+            for cycle in cycles:
+                rows.extend(AllocationService.build_rows(cycle))
+                if len(rows) >= ALLOCATION_FLUSH_ROWS:
+                    ExpenseAllocation.objects.bulk_create(rows, batch_size=1000)
+                    allocation_count += len(rows)
+                    rows = []
+            ExpenseAllocation.objects.bulk_create(rows, batch_size=1000)
+            allocation_count += len(rows)
+
+        return {
+            'properties': len(property_objs),
+            'units': len(units),
+            'tenants': len(tenants),
+            'tenancies': len(tenancies),
+            'billing_cycles': len(cycles),
+            'expenses': len(expenses),
+            'allocations': allocation_count,
+        }
@@ -0,0 +1,115 @@
+# backend/properties/services/summary_service.py
+from uuid import uuid4
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, Sum
+from core.response_cache import RESPONSE_CACHE_ALIAS
+from ..models import BillingCycle, Expense, ExpenseAllocation
+
+# Los resúmenes no caducan por tiempo: cambiar la versión del ciclo los invalida.
+SUMMARY_TIMEOUT = 60 * 60 * 24
+
+
+class BillingCycleSummaryService:
+    """
+    Servicio que calcula el resumen de un ciclo de facturación con agregaciones SQL.
+
+    El resumen se guarda en caché bajo la versión actual del ciclo; cualquier
+    cambio en sus gastos, asignaciones, estado o en los nombres de sus unidades
+    cambia la versión y deja obsoleta la entrada anterior sin tener que borrarla.
+
+    Versiones y resúmenes viven en la caché RESPONSE_CACHE_ALIAS, que puede ser
+    compartida: los cambios hechos desde comandos u otros procesos invalidan
+    también los resúmenes que sirve este.
+    """
+
+    @staticmethod
+    def backend():
+        return caches[RESPONSE_CACHE_ALIAS]
+
+    @staticmethod
+    def version_key(billing_cycle_id):
+        return f'billing-cycle:{billing_cycle_id}:version'
+
+    @staticmethod
+    def get_version(billing_cycle_id):
+        """Obtiene la versión actual del ciclo, creándola si no existe."""
+        backend = BillingCycleSummaryService.backend()
+        key = BillingCycleSummaryService.version_key(billing_cycle_id)
+        version = backend.get(key)
+        if version is None:
+            backend.add(key, uuid4().hex, None)
+            version = backend.get(key)
+        return version
+
+    @staticmethod
+    def bump_version(*billing_cycle_ids):
+        """
+        Invalida el resumen de los ciclos indicados cuando la transacción se confirma,
+        para que ninguna lectura concurrente guarde datos previos bajo la nueva versión.
+        """
+        def bump():
+            BillingCycleSummaryService.backend().set_many({
+                BillingCycleSummaryService.version_key(billing_cycle_id): uuid4().hex
+                for billing_cycle_id in billing_cycle_ids
+            }, None)
+
+        if billing_cycle_ids:
+            transaction.on_commit(bump)
+
+    @staticmethod
+    def bump_property(property_id):
+        """Invalida los resúmenes de todos los ciclos de una propiedad, cerrados incluidos."""
+        BillingCycleSummaryService.bump_version(
+            *BillingCycle.objects.filter(property_id=property_id).values_list('pk', flat=True)
+        )
+
+    @staticmethod
+    def get_summary(billing_cycle):
+        """Obtiene el resumen del ciclo desde la caché o lo calcula."""
+        version = BillingCycleSummaryService.get_version(billing_cycle.pk)
+        key = f'billing-cycle:{billing_cycle.pk}:summary:{version}'
+        backend = BillingCycleSummaryService.backend()
+        summary = backend.get(key)
+        if summary is None:
+            summary = BillingCycleSummaryService.compute_summary(billing_cycle)
+            backend.set(key, summary, SUMMARY_TIMEOUT)
+        return summary
+
+    @staticmethod
+    def compute_summary(billing_cycle):
+        """
+        Calcula el resumen con dos consultas agregadas: los gastos agrupados por
+        servicio y las asignaciones agrupadas por unidad.
+        """
+        by_service_type = list(
+            Expense.objects.filter(billing_cycle=billing_cycle)
+            .values('service_type')
+            .annotate(expense_count=Count('pk'), total_amount=Sum('total_amount'))
+            .order_by('service_type')
+        )
+        by_unit = list(
+            ExpenseAllocation.objects.filter(billing_cycle=billing_cycle)
+            .values('unit_id', 'unit__name')
+            .annotate(total_amount=Sum('amount'))
+            .order_by('unit__name', 'unit_id')
+        )
+
+        return {
+            'billing_cycle': billing_cycle.pk,
+            'month': billing_cycle.month,
+            'year': billing_cycle.year,
+            'status': billing_cycle.status,
+            'expense_count': sum(row['expense_count'] for row in by_service_type),
+            'total_amount': sum(row['total_amount'] for row in by_service_type),
+            'by_service_type': by_service_type,
+            'allocated_amount': sum(row['total_amount'] for row in by_unit),
+            'by_unit': [
+                {
+                    'unit': row['unit_id'],
+                    'unit_name': row['unit__name'],
+                    'total_amount': row['total_amount'],
+                }
+                for row in by_unit
+            ],
+        }
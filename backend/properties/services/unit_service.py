@@ -1,8 +1,18 @@
 # backend/properties/services/unit_service.py
+import re
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from ..models import Property, Unit
 from tenants.models import Tenancy
+from .allocation_service import AllocationService
+from core.response_cache import ResponseCache
+
+# Máximo de unidades por alta masiva.
+MAX_BULK_UNITS = 1000
+
+# Patrón de nombres: prefijo, rango numérico inclusivo y sufijo (ej. "Apto 101..420").
+NAME_PATTERN_RE = re.compile(r'^(?P<prefix>.*?)(?P<start>\d+)\.\.(?P<end>\d+)(?P<suffix>.*)$')
 
 
 class UnitService:
@@ -10,25 +20,113 @@ class UnitService:
 
     @staticmethod
     def get_property_units(property_obj):
-        """Obtiene todas las unidades de una propiedad."""
-        return property_obj.units.all().order_by('name')
+        """Obtiene todas las unidades de una propiedad junto con su inquilino."""
+        return property_obj.units.select_related('tenant').order_by('name')
 
     @staticmethod
-    def create_unit(property_obj, name):
+    def create_unit(property_obj, name, area=None, fixed_fee=None):
         """Crea una nueva unidad en la propiedad."""
         # Validar que el nombre sea único en la propiedad
         if Unit.objects.filter(property=property_obj, name=name).exists():
             raise ValidationError(f"Ya existe una unidad con el nombre '{name}' en esta propiedad.")
         
-        unit = Unit.objects.create(
-            property=property_obj,
-            name=name
-        )
+        try:
+            with transaction.atomic():
+                unit = Unit.objects.create(
+                    property=property_obj,
+                    name=name,
+                    area=area,
+                    fixed_fee=fixed_fee
+                )
+        except IntegrityError:
+            # Otra petición creó una unidad con el mismo nombre tras la verificación.
+            raise ValidationError(f"Ya existe una unidad con el nombre '{name}' en esta propiedad.")
         return unit
 
     @staticmethod
-    def update_unit(unit, name):
-        """Actualiza una unidad existente."""
+    def expand_name_pattern(pattern):
+        """
+        Expande un patrón de nombres como "Apto 101..420" en la lista de nombres
+        del rango. Si el inicio tiene ceros a la izquierda ("Local 001..120"),
+        todos los números se rellenan hasta su longitud.
+        """
+        match = NAME_PATTERN_RE.match(pattern)
+        if not match:
+            raise ValidationError(
+                "El patrón debe incluir un rango numérico, por ejemplo 'Apto 101..420'."
+            )
+        start, end = int(match['start']), int(match['end'])
+        if end < start:
+            raise ValidationError("El fin del rango no puede ser menor que su inicio.")
+        if end - start + 1 > MAX_BULK_UNITS:
+            raise ValidationError(f"No se pueden crear más de {MAX_BULK_UNITS} unidades por petición.")
+
+        width = len(match['start']) if match['start'].startswith('0') else 0
+        return [
+            f"{match['prefix']}{number:0{width}d}{match['suffix']}"
+            for number in range(start, end + 1)
+        ]
+
+    @staticmethod
+    def bulk_create_units(property_obj, units):
+        """
+        Crea varias unidades en la propiedad con una sola verificación de nombres
+        y un solo INSERT.
+
+        Args:
+            units: Lista de dicts con 'name' y, opcionalmente, 'area' y 'fixed_fee'.
+                Los nombres deben ser distintos entre sí.
+
+        Returns:
+            list: Las unidades creadas, ordenadas por nombre y con su inquilino precargado.
+
+        Raises:
+            ValidationError: Si algún nombre ya existe en la propiedad.
+        """
+        names = [unit['name'] for unit in units]
+        UnitService._check_existing_names(property_obj, names)
+
+        try:
+            with transaction.atomic():
+                created = Unit.objects.bulk_create([
+                    Unit(
+                        property=property_obj,
+                        name=unit['name'],
+                        area=unit.get('area'),
+                        fixed_fee=unit.get('fixed_fee')
+                    )
+                    for unit in units
+                ])
+        except IntegrityError:
+            # Otra petición creó alguno de los nombres tras la verificación.
+            UnitService._check_existing_names(property_obj, names)
+            raise
+
+        # bulk_create no emite post_save: el reparto de la propiedad se recalcula una vez.
+        AllocationService.recompute_property(property_obj.pk)
+        ResponseCache.bump_properties(property_obj.pk)
+        return list(
+            Unit.objects.filter(pk__in=[unit.pk for unit in created])
+            .select_related('tenant')
+            .order_by('name')
+        )
+
+    @staticmethod
+    def _check_existing_names(property_obj, names):
+        existing = sorted(
+            Unit.objects.filter(property=property_obj, name__in=names).values_list('name', flat=True)
+        )
+        if existing:
+            raise ValidationError(
+                f"Ya existen unidades con estos nombres en esta propiedad: {', '.join(existing)}."
+            )
+
+    @staticmethod
+    def update_unit(unit, name, **fields):
+        """
+        Actualiza una unidad existente.
+        Acepta además 'area' y 'fixed_fee'; los campos omitidos no se modifican.
+        """
         # Validar que el nombre sea único en la propiedad (excluyendo la unidad actual)
         if Unit.objects.filter(
             property=unit.property, 
@@ -37,6 +135,9 @@ class UnitService:
             raise ValidationError(f"Ya existe otra unidad con el nombre '{name}' en esta propiedad.")
         
         unit.name = name
+        for field in ('area', 'fixed_fee'):
+            if field in fields:
+                setattr(unit, field, fields[field])
         unit.save()
         return unit
 
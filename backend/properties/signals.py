@@ -0,0 +1,158 @@
+# backend/properties/signals.py
+"""
+Mantiene el libro de asignaciones (ExpenseAllocation) al día.
+
+Cada cambio en sus datos de origen recalcula solo los ciclos afectados e
+invalida su resumen en caché. Los arrendamientos actualizan antes el
+calendario de ocupación (UnitOccupancy) del que leen las asignaciones.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .models import Unit, BillingCycle, Expense, MeterReading
+from .services.allocation_service import AllocationService
+from .services.summary_service import BillingCycleSummaryService
+from rules.models import ServiceRule
+from tenants.models import Tenancy
+from tenants.services import OccupancyService
+
+
+@receiver(post_save, sender=Expense)
+def recompute_allocations_for_expense(sender, instance, **kwargs):
+    """Un gasto nuevo o modificado solo afecta a sus propias filas; recompute_cycle invalida el resumen."""
+    AllocationService.recompute_cycle(instance.billing_cycle, expense_ids=[instance.pk])
+
+
+@receiver(post_delete, sender=Expense)
+def invalidate_summary_for_deleted_expense(sender, instance, **kwargs):
+    """Sus asignaciones se borran en cascada; solo queda invalidar el resumen."""
+    BillingCycleSummaryService.bump_version(instance.billing_cycle_id)
+
+
+@receiver(post_save, sender=BillingCycle)
+def invalidate_summary_for_billing_cycle(sender, instance, created, **kwargs):
+    """El resumen incluye el estado del ciclo."""
+    if not created:
+        BillingCycleSummaryService.bump_version(instance.pk)
+
+
+@receiver(post_save, sender=Unit)
+def recompute_allocations_for_unit(sender, instance, created, **kwargs):
+    """
+    Añadir una unidad cambia el reparto de toda la propiedad; modificarla solo
+    afecta a los servicios que se reparten por área o cuota fija, y a los
+    resúmenes de todos sus ciclos, que muestran el nombre de cada unidad.
+    """
+    if created:
+        AllocationService.recompute_property(instance.property_id)
+        return
+
+    BillingCycleSummaryService.bump_property(instance.property_id)
+
+    service_types = AllocationService.service_types_for_rules(
+        instance.property_id,
+        [ServiceRule.RuleType.PROPORTIONAL_AREA, ServiceRule.RuleType.FIXED_FEE]
+    )
+    if service_types:
+        AllocationService.recompute_property(instance.property_id, service_types=service_types)
+
+
+@receiver(post_delete, sender=Unit)
+def recompute_allocations_for_deleted_unit(sender, instance, **kwargs):
+    """
+    Eliminar una unidad cambia el reparto de toda la propiedad.
+    Se difiere hasta el commit: si la unidad cae en cascada con su propiedad,
+    ya no queda ningún ciclo que recalcular.
+    """
+    property_id = instance.property_id
+    transaction.on_commit(lambda: AllocationService.recompute_property(property_id))
+
+
+@receiver(post_save, sender=MeterReading)
+def recompute_allocations_for_meter_reading(sender, instance, **kwargs):
+    """Una lectura solo afecta a los gastos de su servicio en su ciclo."""
+    _recompute_meter_reading_service(instance.billing_cycle_id, instance.service_type)
+
+
+@receiver(post_delete, sender=MeterReading)
+def recompute_allocations_for_deleted_meter_reading(sender, instance, **kwargs):
+    """Se difiere hasta el commit por si la lectura cae en cascada con su ciclo."""
+    billing_cycle_id, service_type = instance.billing_cycle_id, instance.service_type
+    transaction.on_commit(
+        lambda: _recompute_meter_reading_service(billing_cycle_id, service_type)
+    )
+
+
+def _recompute_meter_reading_service(billing_cycle_id, service_type):
+    """Recalcula los gastos de un servicio en el ciclo de una lectura."""
+    billing_cycle = BillingCycle.objects.filter(pk=billing_cycle_id).first()
+    if billing_cycle is not None:
+        AllocationService.recompute_cycle(billing_cycle, service_types=[service_type])
+
+
+@receiver(post_save, sender=ServiceRule)
+def recompute_service_rule_allocations(sender, instance, **kwargs):
+    """Cambiar la regla de un servicio solo afecta a los gastos de ese servicio."""
+    AllocationService.recompute_property(
+        instance.property_id, service_types=[instance.service_type]
+    )
+
+
+@receiver(post_delete, sender=ServiceRule)
+def clear_service_rule_allocations(sender, instance, **kwargs):
+    """Sin regla, los gastos del servicio no pueden repartirse."""
+    AllocationService.clear_service(instance.property_id, instance.service_type)
+
+
+@receiver(pre_save, sender=Tenancy)
+def remember_previous_tenancy_period(sender, instance, **kwargs):
+    """Guarda el período anterior para recalcular también los meses que deja de cubrir."""
+    instance._previous_period = None
+    if instance.pk:
+        instance._previous_period = (
+            Tenancy.objects.filter(pk=instance.pk)
+            .values_list('start_date', 'end_date')
+            .first()
+        )
+
+
+@receiver(post_save, sender=Tenancy)
+def recompute_allocations_for_tenancy(sender, instance, **kwargs):
+    """Un arrendamiento solo afecta a los gastos por ocupantes de los meses que cubre."""
+    _recompute_tenancy_period(instance)
+
+
+@receiver(post_delete, sender=Tenancy)
+def recompute_allocations_for_deleted_tenancy(sender, instance, **kwargs):
+    """Se difiere hasta el commit por si el arrendamiento cae en cascada con su unidad."""
+    transaction.on_commit(lambda: _recompute_tenancy_period(instance))
+
+
+def _recompute_tenancy_period(instance):
+    """
+    Actualiza el calendario de ocupación de los meses cubiertos por un
+    arrendamiento y recalcula sus gastos por ocupantes.
+    """
+    property_id = Unit.objects.filter(pk=instance.unit_id).values_list(
+        'property_id', flat=True
+    ).first()
+    if property_id is None:
+        return
+
+    start_date, end_date = instance.start_date, instance.end_date
+    previous = getattr(instance, '_previous_period', None)
+    if previous:
+        start_date = min(start_date, previous[0])
+        end_date = None if end_date is None or previous[1] is None else max(end_date, previous[1])
+
+    OccupancyService.refresh_unit(instance.unit_id, start_date, end_date)
+
+    service_types = AllocationService.service_types_for_rules(
+        property_id, [ServiceRule.RuleType.OCCUPANT_PRORATION]
+    )
+    if not service_types:
+        return
+
+    AllocationService.recompute_property(
+        property_id, service_types=service_types, start_date=start_date, end_date=end_date
+    )
@@ -0,0 +1,148 @@
+# backend/properties/tests/test_billing_close.py
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, Unit, BillingCycle, Expense, ExpenseAllocation
+from properties.services.billing_close_service import BillingCloseService
+from properties.services.summary_service import BillingCycleSummaryService
+from rules.models import ServiceRule
+
+
+class BillingCloseTestCase(TestCase):
+    """
+    Pruebas del cierre de mes de los ciclos de facturación.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.properties = [
+            self.create_property(f"Edificio {index}", self.user) for index in range(3)
+        ]
+        self.other_property = self.create_property("Edificio Ajeno", self.other_user)
+        self.cycles = [
+            BillingCycle.objects.create(property=property_obj, month=7, year=2024)
+            for property_obj in self.properties + [self.other_property]
+        ]
+        for billing_cycle in self.cycles:
+            Expense.objects.create(
+                billing_cycle=billing_cycle,
+                service_type=ServiceRule.ServiceType.WATER,
+                total_amount=Decimal('100.00'),
+                invoice_pdf='invoices/test_invoice.pdf'
+            )
+        self.url = reverse('billing-cycle-close')
+
+    def create_property(self, name, user):
+        property_obj = Property.objects.create(name=name, address="Calle 123", user=user)
+        for number in (101, 102):
+            Unit.objects.create(name=f"Apto {number}", property=property_obj)
+        ServiceRule.objects.create(
+            property=property_obj,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        return property_obj
+
+    def test_close_month_closes_every_cycle_in_chunks(self):
+        """El cierre procesa todas las propiedades por bloques y reescribe el libro."""
+        ExpenseAllocation.objects.all().delete()
+        reports = []
+
+        result = BillingCloseService.close_month(
+            2024, 7, chunk_size=3, progress=lambda done, total, totals: reports.append((done, total))
+        )
+
+        self.assertEqual(result['cycles'], 4)
+        self.assertEqual(result['allocations'], 8)
+        self.assertEqual(reports, [(1, 2), (2, 2)])
+        self.assertFalse(
+            BillingCycle.objects.exclude(status=BillingCycle.Status.CLOSED).exists()
+        )
+        self.assertEqual(ExpenseAllocation.objects.count(), 8)
+
+    def test_close_month_only_moves_allowed_statuses(self):
+        """Los ciclos ya cerrados se ignoran y los de revisión pueden cerrarse."""
+        BillingCycle.objects.filter(pk=self.cycles[0].pk).update(status=BillingCycle.Status.CLOSED)
+        BillingCycle.objects.filter(pk=self.cycles[1].pk).update(status=BillingCycle.Status.IN_REVIEW)
+
+        result = BillingCloseService.close_month(
+            2024, 7, target_status=BillingCycle.Status.IN_REVIEW
+        )
+        self.assertEqual(result['cycles'], 2)
+
+        result = BillingCloseService.close_month(2024, 7)
+        self.assertEqual(result['cycles'], 3)
+
+    def test_caches_are_invalidated_by_the_calling_process(self):
+        """Los bloques no tocan las cachés (con workers > 1 corren en otro proceso); las invalida close_month."""
+        versions = {cycle.pk: BillingCycleSummaryService.get_version(cycle.pk) for cycle in self.cycles}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = BillingCloseService.close_chunk(
+                [self.properties[0].pk], 2024, 7, BillingCycle.Status.IN_REVIEW
+            )
+        self.assertEqual(result['cycle_ids'], [self.cycles[0].pk])
+        self.assertEqual(result['property_ids'], [self.properties[0].pk])
+        self.assertEqual(BillingCycleSummaryService.get_version(self.cycles[0].pk), versions[self.cycles[0].pk])
+
+        with mock.patch.object(BillingCloseService, 'invalidate', wraps=BillingCloseService.invalidate) as invalidate, \
+                self.captureOnCommitCallbacks(execute=True):
+            BillingCloseService.close_month(2024, 7, chunk_size=2)
+
+        self.assertEqual(
+            sorted(cycle_id for call in invalidate.call_args_list for cycle_id in call.args[0]),
+            [cycle.pk for cycle in self.cycles]
+        )
+        for cycle in self.cycles:
+            self.assertNotEqual(BillingCycleSummaryService.get_version(cycle.pk), versions[cycle.pk])
+
+    def test_close_api_only_touches_own_properties(self):
+        """El endpoint cierra solo los ciclos de las propiedades del usuario."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.url, {'year': 2024, 'month': 7, 'status': 'in_review'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['cycles'], 3)
+        self.assertEqual(response.data['status'], 'in_review')
+        self.assertEqual(
+            BillingCycle.objects.filter(status=BillingCycle.Status.IN_REVIEW).count(), 3
+        )
+        self.cycles[3].refresh_from_db()
+        self.assertEqual(self.cycles[3].status, BillingCycle.Status.OPEN)
+
+    def test_close_api_rejects_invalid_status(self):
+        """El endpoint solo acepta los estados de cierre."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.url, {'year': 2024, 'month': 7, 'status': 'open'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('status', response.data)
+
+    def test_close_command_reports_progress(self):
+        """El comando informa el avance por bloque y el rendimiento final."""
+        out = StringIO()
+
+        call_command('close_billing_cycles', '2024', '7', '--workers', '1', '--chunk-size', '2', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Bloque 2/2", output)
+        self.assertIn("4 ciclos pasados a 'closed'", output)
@@ -233,12 +233,12 @@ class BillingCycleAPITestCase(TestCase):
         
         # Verificar respuesta exitosa
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
-        self.assertEqual(len(response.data), 2)
+        self.assertIsInstance(response.data['results'], list)
+        self.assertEqual(len(response.data['results']), 2)
         
         # Verificar orden (más reciente primero)
-        self.assertEqual(response.data[0]['id'], cycle2.id)  # Julio 2024
-        self.assertEqual(response.data[1]['id'], cycle1.id)  # Junio 2024
+        self.assertEqual(response.data['results'][0]['id'], cycle2.id)  # Julio 2024
+        self.assertEqual(response.data['results'][1]['id'], cycle1.id)  # Junio 2024
 
     def test_list_billing_cycles_empty_property(self):
         """
@@ -250,7 +250,7 @@ class BillingCycleAPITestCase(TestCase):
         
         # Verificar respuesta exitosa con lista vacía
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data['results'], [])
 
     def test_list_billing_cycles_unauthorized_property_returns_404(self):
         """
@@ -0,0 +1,120 @@
+# backend/properties/tests/test_billing_cycle_bulk_api.py
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, BillingCycle
+
+
+class BillingCycleBulkCreateAPITestCase(TestCase):
+    """
+    Pruebas de la apertura masiva de ciclos de facturación.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.properties = [
+            Property.objects.create(name=f"Edificio {index}", address="Calle 123", user=self.user)
+            for index in range(3)
+        ]
+        self.other_property = Property.objects.create(
+            name="Edificio Ajeno", address="Calle 456", user=self.other_user
+        )
+        self.url = reverse('billing-cycle-bulk-create')
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_create_opens_cycles_for_all_properties_and_months(self):
+        """Sin property_ids se abren los meses del rango en todas las propiedades del usuario."""
+        BillingCycle.objects.create(property=self.properties[0], month=2, year=2024)
+
+        response = self.client.post(
+            self.url,
+            {'year': 2024, 'month': 1, 'end_year': 2024, 'end_month': 3},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 8)
+        self.assertEqual(response.data['existing'], 1)
+        self.assertEqual(response.data['results'][0]['existing'], [{'year': 2024, 'month': 2}])
+        self.assertEqual(len(response.data['results'][1]['created']), 3)
+        self.assertEqual(BillingCycle.objects.filter(property__user=self.user).count(), 9)
+        self.assertFalse(BillingCycle.objects.filter(property=self.other_property).exists())
+
+    def test_bulk_create_reports_foreign_properties_as_not_found(self):
+        """Las propiedades de otros usuarios no se tocan y se reportan como no encontradas."""
+        response = self.client.post(
+            self.url,
+            {
+                'property_ids': [self.properties[1].pk, self.other_property.pk],
+                'year': 2024,
+                'month': 5
+            },
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['not_found'], [self.other_property.pk])
+        self.assertEqual([result['property'] for result in response.data['results']], [self.properties[1].pk])
+        self.assertFalse(BillingCycle.objects.filter(property=self.other_property).exists())
+
+    def test_bulk_create_is_idempotent(self):
+        """Repetir la petición no crea duplicados y responde 200."""
+        data = {'year': 2024, 'month': 6}
+        self.client.post(self.url, data, format='json')
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created'], 0)
+        self.assertEqual(response.data['existing'], 3)
+        self.assertEqual(BillingCycle.objects.count(), 3)
+
+    def test_bulk_create_query_count_does_not_grow_with_properties(self):
+        """El número de consultas no depende del número de propiedades ni de meses."""
+        data = {'year': 2023, 'month': 1, 'end_year': 2023, 'end_month': 12}
+        with self.assertNumQueries(5):
+            self.client.post(self.url, data, format='json')
+
+        for index in range(3, 10):
+            Property.objects.create(name=f"Edificio {index}", address="Calle 123", user=self.user)
+        data = {'year': 2024, 'month': 1, 'end_year': 2024, 'end_month': 12}
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.data['created'], 120)
+
+    def test_bulk_create_rejects_invalid_ranges(self):
+        """Se rechazan rangos invertidos, futuros o demasiado largos."""
+        next_year = timezone.now().year + 1
+        invalid = [
+            {'year': 2024, 'month': 5, 'end_year': 2024, 'end_month': 4},
+            {'year': 2024, 'month': 5, 'end_year': 2024},
+            {'year': 2020, 'month': 1, 'end_year': 2022, 'end_month': 12},
+            {'year': next_year, 'month': 1},
+        ]
+        for data in invalid:
+            with self.subTest(data=data):
+                response = self.client.post(self.url, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(BillingCycle.objects.count(), 0)
+
+    def test_bulk_create_requires_authentication(self):
+        """Solo usuarios autenticados pueden abrir ciclos."""
+        self.client.force_authenticate(user=None)
+
+        response = self.client.post(self.url, {'year': 2024, 'month': 1}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,150 @@
+# backend/properties/tests/test_billing_cycle_summary.py
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, Unit, BillingCycle, Expense
+from rules.models import ServiceRule
+
+
+class BillingCycleSummaryAPITestCase(TestCase):
+    """
+    Pruebas del resumen agregado de un ciclo de facturación.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        caches['responses'].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.units = [
+            Unit.objects.create(name=f"Apto {number}", property=self.property)
+            for number in (101, 102)
+        ]
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        self.billing_cycle = BillingCycle.objects.create(
+            property=self.property,
+            month=7,
+            year=2024
+        )
+        self.create_expense(ServiceRule.ServiceType.WATER, '100.00')
+        self.create_expense(ServiceRule.ServiceType.WATER, '50.01')
+        self.create_expense(ServiceRule.ServiceType.ELECTRICITY, '80.00')
+        self.url = reverse('billing-cycle-summary', kwargs={'cycle_id': self.billing_cycle.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def create_expense(self, service_type, amount):
+        """Crea un gasto sin subir un archivo real."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return Expense.objects.create(
+                billing_cycle=self.billing_cycle,
+                service_type=service_type,
+                total_amount=Decimal(amount),
+                invoice_pdf='invoices/test_invoice.pdf'
+            )
+
+    def test_summary_aggregates_expenses_and_allocations(self):
+        """El resumen agrupa los gastos por servicio y las asignaciones por unidad."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['expense_count'], 3)
+        self.assertEqual(response.data['total_amount'], '230.01')
+        self.assertEqual(
+            [
+                (row['service_type'], row['expense_count'], row['total_amount'])
+                for row in response.data['by_service_type']
+            ],
+            [('electricity', 1, '80.00'), ('water', 2, '150.01')]
+        )
+        # Solo el agua tiene regla; 25.005 se redondea al par en cada porción.
+        self.assertEqual(response.data['allocated_amount'], '150.00')
+        self.assertEqual(
+            [(row['unit_name'], row['total_amount']) for row in response.data['by_unit']],
+            [('Apto 101', '75.00'), ('Apto 102', '75.00')]
+        )
+
+    def test_summary_is_cached_until_expenses_change(self):
+        """Las lecturas repetidas salen de la caché y un gasto nuevo la invalida."""
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        self.create_expense(ServiceRule.ServiceType.GAS, '19.99')
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['expense_count'], 4)
+        self.assertEqual(response.data['total_amount'], '250.00')
+
+    def test_summary_invalidated_by_deleted_expense_and_status_change(self):
+        """Borrar un gasto o cambiar el estado del ciclo invalida el resumen."""
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Expense.objects.filter(service_type=ServiceRule.ServiceType.ELECTRICITY).get().delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['total_amount'], '150.01')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.billing_cycle.status = BillingCycle.Status.CLOSED
+            self.billing_cycle.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['status'], 'closed')
+
+    def test_summary_invalidated_by_unit_rename_and_closed_cycle_expense(self):
+        """Renombrar una unidad o añadir un gasto a un ciclo cerrado también invalida el resumen."""
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.units[0].name = "Apto 101-A"
+            self.units[0].save()
+        response = self.client.get(self.url)
+        self.assertEqual([row['unit_name'] for row in response.data['by_unit']], ["Apto 101-A", "Apto 102"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.billing_cycle.status = BillingCycle.Status.CLOSED
+            self.billing_cycle.save()
+        self.client.get(self.url)
+        self.create_expense(ServiceRule.ServiceType.GAS, '19.99')
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['total_amount'], '250.00')
+        self.assertEqual(response.data['allocated_amount'], '150.00')
+
+    def test_summary_is_shared_through_the_response_cache(self):
+        """Versiones y resúmenes viven en la caché compartible, no en la del proceso."""
+        self.client.get(self.url)
+        caches['default'].clear()
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_summary_of_foreign_cycle_returns_404(self):
+        """Un usuario no puede ver el resumen de un ciclo ajeno."""
+        self.client.force_authenticate(user=self.other_user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
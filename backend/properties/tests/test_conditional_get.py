@@ -0,0 +1,172 @@
+# backend/properties/tests/test_conditional_get.py
+import time
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, Unit, BillingCycle, Expense
+from rules.models import ServiceRule
+from tenants.models import Tenant, Tenancy
+
+
+class ConditionalGetTestCase(TestCase):
+    """
+    Pruebas de ETag / Last-Modified en las vistas de lectura.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        caches['responses'].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.unit = Unit.objects.create(name="Apto 101", property=self.property)
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        self.billing_cycle = BillingCycle.objects.create(property=self.property, month=7, year=2024)
+        self.detail_url = reverse('property-detail', kwargs={'pk': self.property.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def test_unchanged_resources_return_304(self):
+        """Con el ETag de la respuesta anterior cada vista responde 304 sin cuerpo."""
+        urls = [
+            self.detail_url,
+            reverse('service-configuration', kwargs={'property_id': self.property.pk}),
+            reverse('billing-cycle-detail', kwargs={'pk': self.billing_cycle.pk}),
+            reverse('expense-list-create', kwargs={'cycle_id': self.billing_cycle.pk}),
+            reverse('tenancy-list-create', kwargs={'unit_id': self.unit.pk}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                self.assertEqual(first.status_code, status.HTTP_200_OK)
+                self.assertIn('Last-Modified', first.headers)
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=first.headers['ETag'])
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response.content, b'')
+                self.assertEqual(response.headers['ETag'], first.headers['ETag'])
+
+    def test_304_needs_only_the_state_query(self):
+        """El 304 no carga ni serializa los datos; en vistas cacheadas ni siquiera consulta."""
+        url = reverse('tenancy-list-create', kwargs={'unit_id': self.unit.pk})
+        etag = self.client.get(url).headers['ETag']
+        with self.assertNumQueries(1):
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        etag = self.client.get(self.detail_url).headers['ETag']
+        with self.assertNumQueries(0):
+            self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_changes_and_deletions_change_the_etag(self):
+        """Altas, modificaciones y bajas del árbol producen un ETag nuevo."""
+        etags = [self.client.get(self.detail_url).headers['ETag']]
+
+        unit = Unit.objects.create(name="Apto 102", property=self.property)
+        etags.append(self.client.get(self.detail_url).headers['ETag'])
+
+        Tenant.objects.create(name="Ana", email="ana@test.com", number_of_occupants=1, unit=unit)
+        etags.append(self.client.get(self.detail_url).headers['ETag'])
+
+        self.assertEqual(len(set(etags)), 3)
+
+        # Tras el borrado el árbol vuelve a ser el del principio.
+        unit.delete()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etags[-1])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers['ETag'], etags[0])
+
+    def test_cached_state_expires_like_the_responses(self):
+        """Un cambio que no llega a la versión de este proceso deja de ocultarse al caducar la caché."""
+        etag = self.client.get(self.detail_url).headers['ETag']
+        # bulk_create no envía señales: como una escritura de otro proceso con caché local.
+        Unit.objects.bulk_create([Unit(name="Apto 102", property=self.property)])
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        timeout = caches['responses'].default_timeout
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=time.time() + timeout + 1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['units']), 2)
+
+    def test_if_modified_since(self):
+        """If-Modified-Since responde 304 hasta que algo del árbol cambia."""
+        url = reverse('expense-list-create', kwargs={'cycle_id': self.billing_cycle.pk})
+        Expense.objects.create(
+            billing_cycle=self.billing_cycle,
+            service_type=ServiceRule.ServiceType.WATER,
+            total_amount=Decimal('10.00'),
+            invoice_pdf='invoices/test_invoice.pdf'
+        )
+        last_modified = self.client.get(url).headers['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE='Mon, 01 Jan 2001 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_tenancy_changes_change_the_etag(self):
+        """El historial de arrendamientos cambia con sus arrendamientos y sus inquilinos."""
+        url = reverse('tenancy-list-create', kwargs={'unit_id': self.unit.pk})
+        tenant = Tenant.objects.create(name="Ana", email="ana@test.com", number_of_occupants=1, unit=self.unit)
+        Tenancy.objects.create(
+            unit=self.unit, tenant=tenant, number_of_occupants=1, start_date=date(2024, 1, 1)
+        )
+        etag = self.client.get(url).headers['ETag']
+
+        tenant.name = "Ana Gómez"
+        tenant.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['tenant_name'], "Ana Gómez")
+
+    def test_closing_a_cycle_changes_the_etag(self):
+        """El cierre masivo actualiza updated_at aunque use update()."""
+        url = reverse('billing-cycle-detail', kwargs={'pk': self.billing_cycle.pk})
+        etag = self.client.get(url).headers['ETag']
+
+        self.client.post(
+            reverse('billing-cycle-close'),
+            {'year': 2024, 'month': 7, 'status': 'in_review'},
+            format='json'
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'in_review')
+
+    def test_foreign_resources_return_404(self):
+        """Un ETag válido no sirve para leer recursos de otro usuario."""
+        etag = self.client.get(self.detail_url).headers['ETag']
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn('ETag', response.headers)
@@ -0,0 +1,348 @@
+# backend/properties/tests/test_expense_allocation.py
+from datetime import date
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, Unit, BillingCycle, Expense, ExpenseAllocation
+from properties.services.allocation_service import AllocationService
+from rules.models import ServiceRule
+from tenants.models import Tenant, Tenancy
+
+
+class ExpenseAllocationTestCase(TestCase):
+    """
+    Pruebas del libro de asignaciones materializado y su recálculo incremental.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.units = [
+            Unit.objects.create(name=f"Apto {number}", property=self.property)
+            for number in (101, 102, 103)
+        ]
+        self.tenancies = []
+        for index, (unit, occupants) in enumerate(zip(self.units, (1, 2, 2))):
+            tenant = Tenant.objects.create(
+                name=f"Inquilino {index}",
+                email=f"inquilino{index}@test.com",
+                number_of_occupants=occupants,
+                unit=unit
+            )
+            self.tenancies.append(Tenancy.objects.create(
+                unit=unit,
+                tenant=tenant,
+                number_of_occupants=occupants,
+                start_date=date(2023, 1, 1)
+            ))
+        self.water_rule = ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.GAS,
+            rule_type=ServiceRule.RuleType.OCCUPANT_PRORATION
+        )
+        self.billing_cycle = BillingCycle.objects.create(
+            property=self.property,
+            month=7,
+            year=2024
+        )
+
+    def create_expense(self, service_type, amount, billing_cycle=None):
+        """Crea un gasto sin subir un archivo real."""
+        return Expense.objects.create(
+            billing_cycle=billing_cycle or self.billing_cycle,
+            service_type=service_type,
+            total_amount=Decimal(amount),
+            invoice_pdf='invoices/test_invoice.pdf'
+        )
+
+    def shares(self, expense):
+        """Porciones de un gasto en el orden de las unidades."""
+        return list(
+            ExpenseAllocation.objects.filter(expense=expense)
+            .order_by('unit_id')
+            .values_list('amount', flat=True)
+        )
+
+    def test_expense_creation_materializes_allocations(self):
+        """Crear un gasto escribe una fila por unidad."""
+        water = self.create_expense('water', '100.00')
+        gas = self.create_expense('gas', '100.00')
+
+        self.assertEqual(self.shares(water), [Decimal('33.33')] * 3)
+        self.assertEqual(self.shares(gas), [Decimal('20.00'), Decimal('40.00'), Decimal('40.00')])
+
+    def test_expense_update_only_recomputes_its_rows(self):
+        """Modificar un gasto no toca las filas de los demás gastos."""
+        water = self.create_expense('water', '100.00')
+        gas = self.create_expense('gas', '100.00')
+        gas_row_ids = set(ExpenseAllocation.objects.filter(expense=gas).values_list('pk', flat=True))
+
+        water.total_amount = Decimal('90.00')
+        water.save()
+
+        self.assertEqual(self.shares(water), [Decimal('30.00')] * 3)
+        self.assertEqual(
+            set(ExpenseAllocation.objects.filter(expense=gas).values_list('pk', flat=True)),
+            gas_row_ids
+        )
+
+    def test_service_rule_change_recomputes_service(self):
+        """Cambiar la regla o el redondeo de un servicio recalcula sus gastos."""
+        water = self.create_expense('water', '100.00')
+
+        self.water_rule.rounding_mode = ServiceRule.RoundingMode.LARGEST_REMAINDER
+        self.water_rule.save()
+
+        self.assertEqual(sum(self.shares(water)), Decimal('100.00'))
+
+    def test_service_rule_deletion_clears_service(self):
+        """Sin regla, los gastos del servicio no tienen asignaciones."""
+        water = self.create_expense('water', '100.00')
+
+        self.water_rule.delete()
+
+        self.assertEqual(self.shares(water), [])
+
+    def test_cycles_past_the_occupancy_horizon_are_prorated(self):
+        """Un ciclo abierto más allá del calendario de ocupación se reparte igual."""
+        year = timezone.now().year + 2
+        gas = self.create_expense(
+            'gas', '100.00', billing_cycle=BillingCycle.objects.create(property=self.property, month=1, year=year)
+        )
+
+        self.assertEqual(self.shares(gas), [Decimal('20.00'), Decimal('40.00'), Decimal('40.00')])
+
+    def test_tenancy_change_recomputes_overlapping_cycles(self):
+        """Un arrendamiento recalcula los gastos por ocupantes de los meses que cubre."""
+        gas = self.create_expense('gas', '100.00')
+        other_cycle = BillingCycle.objects.create(property=self.property, month=1, year=2023)
+        old_gas = self.create_expense('gas', '100.00', billing_cycle=other_cycle)
+
+        # Terminar un arrendamiento afecta a todos los meses de su período anterior.
+        self.tenancies[0].end_date = date(2024, 6, 30)
+        self.tenancies[0].save()
+        self.assertEqual(self.shares(gas), [Decimal('0.00'), Decimal('50.00'), Decimal('50.00')])
+        old_row_ids = set(ExpenseAllocation.objects.filter(expense=old_gas).values_list('pk', flat=True))
+
+        # Un arrendamiento que empieza a mitad de julio solo afecta a julio en adelante.
+        Tenancy.objects.create(
+            unit=self.units[0],
+            tenant=self.tenancies[0].tenant,
+            number_of_occupants=6,
+            start_date=date(2024, 7, 16)
+        )
+
+        # Días-ocupante: 16 × 6 = 96, 31 × 2 = 62, 31 × 2 = 62.
+        self.assertEqual(self.shares(gas), [Decimal('43.64'), Decimal('28.18'), Decimal('28.18')])
+        self.assertEqual(
+            self.shares(old_gas), [Decimal('20.00'), Decimal('40.00'), Decimal('40.00')]
+        )
+        self.assertEqual(
+            set(ExpenseAllocation.objects.filter(expense=old_gas).values_list('pk', flat=True)),
+            old_row_ids
+        )
+
+    def test_closed_cycles_are_not_recomputed(self):
+        """Los ciclos cerrados quedan congelados."""
+        water = self.create_expense('water', '100.00')
+        self.billing_cycle.status = BillingCycle.Status.CLOSED
+        self.billing_cycle.save()
+
+        Unit.objects.create(name="Apto 104", property=self.property)
+
+        self.assertEqual(self.shares(water), [Decimal('33.33')] * 3)
+
+    def test_new_unit_recomputes_property(self):
+        """Una unidad nueva entra en el reparto de los ciclos abiertos."""
+        water = self.create_expense('water', '100.00')
+
+        Unit.objects.create(name="Apto 104", property=self.property)
+
+        self.assertEqual(self.shares(water), [Decimal('25.00')] * 4)
+
+    def test_deleted_unit_recomputes_property(self):
+        """Eliminar una unidad redistribuye los gastos de los ciclos abiertos."""
+        water = self.create_expense('water', '90.00')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.units[2].delete()
+
+        self.assertEqual(self.shares(water), [Decimal('45.00')] * 2)
+
+    def test_breakdown_endpoint_reads_ledger(self):
+        """El desglose se lee del libro sin recalcular."""
+        self.create_expense('water', '100.00')
+        self.create_expense('gas', '100.00')
+        self.client.force_authenticate(user=self.user)
+        url = reverse('billing-cycle-allocations', kwargs={'cycle_id': self.billing_cycle.pk})
+
+        # Autenticación forzada: una consulta de propiedad y una de lectura.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(response.data[0]['unit_name'], 'Apto 101')
+
+    def test_breakdown_endpoint_for_foreign_cycle(self):
+        """Un usuario no puede leer el desglose de un ciclo ajeno."""
+        self.client.force_authenticate(user=self.other_user)
+        url = reverse('billing-cycle-allocations', kwargs={'cycle_id': self.billing_cycle.pk})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_recompute_cycle_returns_written_rows(self):
+        """Recalcular un ciclo completo reescribe todas sus filas."""
+        self.create_expense('water', '100.00')
+        self.create_expense('electricity', '50.00')  # Sin regla: no se reparte
+
+        self.assertEqual(AllocationService.recompute_cycle(self.billing_cycle), 3)
+
+
+class RuleTypeAllocationTestCase(TestCase):
+    """
+    Pruebas del libro de asignaciones con reglas de área, consumo y cuota fija.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.unit1 = Unit.objects.create(
+            name="Apto 101", property=self.property, area=Decimal('60.00'), fixed_fee=Decimal('25.00')
+        )
+        self.unit2 = Unit.objects.create(
+            name="Apto 102", property=self.property, area=Decimal('40.00'), fixed_fee=Decimal('15.00')
+        )
+        for service_type, rule_type in (
+            ('arbitrios', ServiceRule.RuleType.PROPORTIONAL_AREA),
+            ('water', ServiceRule.RuleType.CONSUMPTION_ADJUSTMENT),
+            ('maintenance', ServiceRule.RuleType.FIXED_FEE),
+        ):
+            ServiceRule.objects.create(
+                property=self.property, service_type=service_type, rule_type=rule_type
+            )
+        self.billing_cycle = BillingCycle.objects.create(
+            property=self.property,
+            month=7,
+            year=2024
+        )
+        self.readings_url = reverse(
+            'meter-reading-list-create', kwargs={'cycle_id': self.billing_cycle.pk}
+        )
+
+    def create_expense(self, service_type, amount):
+        """Crea un gasto sin subir un archivo real."""
+        return Expense.objects.create(
+            billing_cycle=self.billing_cycle,
+            service_type=service_type,
+            total_amount=Decimal(amount),
+            invoice_pdf='invoices/test_invoice.pdf'
+        )
+
+    def shares(self, expense):
+        """Porciones de un gasto en el orden de las unidades."""
+        return list(
+            ExpenseAllocation.objects.filter(expense=expense)
+            .order_by('unit_id')
+            .values_list('amount', flat=True)
+        )
+
+    def test_proportional_area(self):
+        """El gasto se reparte según el área y se recalcula al cambiarla."""
+        expense = self.create_expense('arbitrios', '200.00')
+        self.assertEqual(self.shares(expense), [Decimal('120.00'), Decimal('80.00')])
+
+        self.unit2.area = Decimal('60.00')
+        self.unit2.save()
+
+        self.assertEqual(self.shares(expense), [Decimal('100.00'), Decimal('100.00')])
+
+    def test_fixed_fee(self):
+        """Cada unidad paga su cuota fija."""
+        expense = self.create_expense('maintenance', '40.00')
+        self.assertEqual(self.shares(expense), [Decimal('25.00'), Decimal('15.00')])
+
+    def test_consumption_adjustment_from_meter_readings_api(self):
+        """Registrar lecturas por la API reparte el gasto según el consumo."""
+        expense = self.create_expense('water', '90.00')
+        self.client.force_authenticate(user=self.user)
+
+        for unit, current in ((self.unit1, '110.000'), (self.unit2, '120.000')):
+            response = self.client.post(self.readings_url, {
+                'unit': unit.pk,
+                'service_type': 'water',
+                'previous_reading': '100.000',
+                'current_reading': current,
+            }, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertEqual(self.shares(expense), [Decimal('30.00'), Decimal('60.00')])
+
+        # Registrar de nuevo la misma lectura la actualiza.
+        response = self.client.post(self.readings_url, {
+            'unit': self.unit2.pk,
+            'service_type': 'water',
+            'previous_reading': '100.000',
+            'current_reading': '105.000',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['consumption'], '5.000')
+        self.assertEqual(self.shares(expense), [Decimal('60.00'), Decimal('30.00')])
+
+    def test_meter_reading_validation(self):
+        """Las lecturas deben ser crecientes y de unidades de la propiedad del ciclo."""
+        other_property = Property.objects.create(name="Otro", address="Calle 2", user=self.user)
+        foreign_unit = Unit.objects.create(name="Apto 1", property=other_property)
+        self.client.force_authenticate(user=self.user)
+
+        decreasing = self.client.post(self.readings_url, {
+            'unit': self.unit1.pk,
+            'service_type': 'water',
+            'previous_reading': '100.000',
+            'current_reading': '90.000',
+        }, format='json')
+        foreign = self.client.post(self.readings_url, {
+            'unit': foreign_unit.pk,
+            'service_type': 'water',
+            'previous_reading': '1.000',
+            'current_reading': '2.000',
+        }, format='json')
+
+        self.assertEqual(decreasing.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(foreign.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,6 +2,8 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -141,6 +143,28 @@ class ExpenseAPITestCase(TestCase):
         self.assertEqual(str(expense.total_amount), '150.50')
         self.assertTrue(expense.invoice_pdf.name.endswith('.pdf'))
 
+    def test_create_expense_resolves_billing_cycle_once(self):
+        """
+        El ciclo (con su propiedad) se busca una sola vez aunque lo usen el
+        queryset, el contexto del serializador y la creación.
+        """
+        self.authenticate_user1()
+        payload = {
+            'service_type': 'electricity',
+            'total_amount': '150.50',
+            'invoice_pdf': self.create_test_pdf()
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url_expenses, data=payload, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        lookups = [
+            query['sql'] for query in queries.captured_queries
+            if 'FROM "properties_billingcycle"' in query['sql'] and '"properties_property"."user_id"' in query['sql']
+        ]
+        self.assertEqual(len(lookups), 1)
+
     def test_create_expense_without_service_rule_returns_409(self):
         """
         [CA-12.2] Prueba que crear un gasto sin regla configurada retorna 409.
@@ -308,12 +332,12 @@ class ExpenseAPITestCase(TestCase):
         
         # Verificar respuesta exitosa
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
-        self.assertEqual(len(response.data), 2)
+        self.assertIsInstance(response.data['results'], list)
+        self.assertEqual(len(response.data['results']), 2)
         
         # Verificar orden (más reciente primero)
-        self.assertEqual(response.data[0]['id'], expense2.id)
-        self.assertEqual(response.data[1]['id'], expense1.id)
+        self.assertEqual(response.data['results'][0]['id'], expense2.id)
+        self.assertEqual(response.data['results'][1]['id'], expense1.id)
 
     def test_list_expenses_empty_cycle(self):
         """
@@ -325,7 +349,7 @@ class ExpenseAPITestCase(TestCase):
         
         # Verificar respuesta exitosa con lista vacía
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data['results'], [])
 
     def test_list_expenses_unauthorized_cycle_returns_404(self):
         """
@@ -437,9 +461,9 @@ class ExpenseAPITestCase(TestCase):
         # Verificar que aparece en el listado
         list_response = self.client.get(self.url_expenses)
         self.assertEqual(list_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(list_response.data), 1)
-        self.assertEqual(list_response.data[0]['service_type_display'], 'Agua')
-        self.assertEqual(list_response.data[0]['total_amount'], '1500.00')
+        self.assertEqual(len(list_response.data['results']), 1)
+        self.assertEqual(list_response.data['results'][0]['service_type_display'], 'Agua')
+        self.assertEqual(list_response.data['results'][0]['total_amount'], '1500.00')
 
     def tearDown(self):
         """Limpiar archivos de prueba."""
@@ -0,0 +1,168 @@
+# backend/properties/tests/test_pagination.py
+from datetime import date
+from unittest import mock
+from decimal import Decimal
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from core.pagination import KeysetPagination
+from properties.models import Property, Unit, BillingCycle, Expense
+from rules.models import Rule
+from tenants.models import Tenant, Tenancy
+
+
+class KeysetPaginationTestCase(TestCase):
+    """
+    Pruebas de la paginación por cursor de los listados.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def collect_pages(self, url, page_size, key='id'):
+        """Recorre todas las páginas hacia delante y devuelve las claves vistas por página."""
+        pages = []
+        response = self.client.get(url, {'page_size': page_size})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([item[key] for item in response.data['results']])
+            if response.data['next'] is None:
+                return pages, response
+            response = self.client.get(response.data['next'])
+
+    def test_list_without_pagination_params_gets_the_first_page(self):
+        """Sin cursor ni page_size se devuelve la primera página de page_size filas."""
+        for index in range(52):
+            Property.objects.create(name=f"Edificio {index:02}", address="Calle 123", user=self.user)
+
+        response = self.client.get(reverse('property-list-create'))
+
+        self.assertEqual(len(response.data['results']), 50)
+        self.assertEqual(response.data['results'][0]['name'], "Edificio 00")
+        self.assertIsNotNone(response.data['next'])
+        self.assertEqual(len(self.client.get(response.data['next']).data['results']), 2)
+
+    def test_page_size_is_capped_by_max_page_size(self):
+        """page_size no pasa de max_page_size, sea cual sea su valor."""
+        for index in range(3):
+            Property.objects.create(name=f"Edificio {index}", address="Calle 123", user=self.user)
+
+        with mock.patch.object(KeysetPagination, 'max_page_size', 2):
+            response = self.client.get(reverse('property-list-create'), {'page_size': 1000})
+
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+
+    @override_settings(UNPAGINATED_LISTS=True)
+    def test_unpaginated_lists_setting_returns_the_whole_list(self):
+        """Con UNPAGINATED_LISTS, sin cursor ni page_size el listado se devuelve completo."""
+        for name in ("B", "A"):
+            Property.objects.create(name=name, address="Calle 123", user=self.user)
+
+        response = self.client.get(reverse('property-list-create'))
+        self.assertEqual([item['name'] for item in response.data], ["A", "B"])
+
+        response = self.client.get(reverse('property-list-create'), {'page_size': 1})
+        self.assertEqual([item['name'] for item in response.data['results']], ["A"])
+
+    def test_properties_paginate_by_name_with_tie_breaker(self):
+        """Las propiedades con el mismo nombre no se repiten ni se pierden entre páginas."""
+        expected = []
+        for name in ("C", "A", "B", "A", "B", "A", "C"):
+            expected.append(Property.objects.create(name=name, address="Calle 123", user=self.user))
+        expected.sort(key=lambda property_obj: (property_obj.name, property_obj.pk))
+
+        pages, last = self.collect_pages(reverse('property-list-create'), page_size=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), [property_obj.pk for property_obj in expected])
+
+        # La página anterior a la última es la segunda.
+        response = self.client.get(last.data['previous'])
+        self.assertEqual([item['id'] for item in response.data['results']], pages[1])
+
+    def test_billing_cycles_paginate_by_most_recent(self):
+        """Los ciclos se paginan por (-year, -month)."""
+        property_obj = Property.objects.create(name="Edificio", address="Calle 123", user=self.user)
+        for year, month in ((2023, 11), (2024, 2), (2023, 12), (2024, 1), (2023, 10)):
+            BillingCycle.objects.create(property=property_obj, month=month, year=year)
+        url = reverse('billing-cycle-list-create', kwargs={'property_id': property_obj.pk})
+
+        pages, _ = self.collect_pages(url, page_size=2, key='month')
+
+        self.assertEqual(pages, [[2, 1], [12, 11], [10]])
+
+    def test_expenses_with_identical_timestamps_paginate_by_pk(self):
+        """Los gastos creados en el mismo instante se desempatan por id."""
+        property_obj = Property.objects.create(name="Edificio", address="Calle 123", user=self.user)
+        billing_cycle = BillingCycle.objects.create(property=property_obj, month=7, year=2024)
+        expenses = [
+            Expense.objects.create(
+                billing_cycle=billing_cycle,
+                service_type=service_type,
+                total_amount=Decimal('10.00'),
+                invoice_pdf='invoices/test_invoice.pdf'
+            )
+            for service_type in ('water', 'electricity', 'gas', 'internet')
+        ]
+        Expense.objects.update(created_at=timezone.now())
+        url = reverse('expense-list-create', kwargs={'cycle_id': billing_cycle.pk})
+
+        pages, _ = self.collect_pages(url, page_size=3)
+
+        self.assertEqual(sum(pages, []), sorted((expense.pk for expense in expenses), reverse=True))
+
+    def test_tenancies_and_rules_are_paginated(self):
+        """Los arrendamientos (-start_date) y las reglas (-created_at) también se paginan."""
+        property_obj = Property.objects.create(name="Edificio", address="Calle 123", user=self.user)
+        unit = Unit.objects.create(name="Apto 101", property=property_obj)
+        tenant = Tenant.objects.create(name="Juan", email="juan@test.com", number_of_occupants=1, unit=unit)
+        for start_month, end_month in ((1, 3), (7, None), (4, 6)):
+            Tenancy.objects.create(
+                unit=unit,
+                tenant=tenant,
+                number_of_occupants=1,
+                start_date=date(2024, start_month, 1),
+                end_date=date(2024, end_month, 28) if end_month else None
+            )
+        for rule_type in (Rule.RuleType.EQUAL_DIVISION, Rule.RuleType.FIXED_FEE):
+            Rule.objects.create(property=property_obj, type=rule_type)
+
+        pages, _ = self.collect_pages(
+            reverse('tenancy-list-create', kwargs={'unit_id': unit.pk}), page_size=2, key='start_date'
+        )
+        self.assertEqual(pages, [['2024-07-01', '2024-04-01'], ['2024-01-01']])
+
+        pages, _ = self.collect_pages(
+            reverse('rule-create', kwargs={'property_pk': property_obj.pk}), page_size=1, key='type'
+        )
+        self.assertEqual(pages, [['fixed_fee'], ['equal_division']])
+
+    def test_page_size_is_capped(self):
+        """page_size no puede superar el máximo configurado."""
+        Property.objects.bulk_create([
+            Property(name=f"Edificio {index:03}", address="Calle 123", user=self.user)
+            for index in range(205)
+        ])
+
+        response = self.client.get(reverse('property-list-create'), {'page_size': 1000})
+
+        self.assertEqual(len(response.data['results']), 200)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_invalid_cursor_returns_404(self):
+        """Un cursor manipulado se rechaza en lugar de provocar un error del servidor."""
+        for cursor in ('no-es-base64', 'eyJwIjogWzFdLCAiciI6IGZhbHNlfQ==', 'eyJwIjogW3t9LCAxXSwgInIiOiBmYWxzZX0='):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(reverse('property-list-create'), {'cursor': cursor})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,156 @@
+# backend/properties/tests/test_portfolio_seed.py
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from django.test import TestCase, TransactionTestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from properties.models import Property, BillingCycle, Expense, ExpenseAllocation
+from properties.services.portfolio_service import PortfolioSeedService
+from tenants.models import Tenancy, UnitOccupancy
+
+
+class PortfolioSeedTestCase(TestCase):
+    """
+    Pruebas del generador de carteras sintéticas y del benchmark de la API.
+    """
+
+    def seed(self, username, **options):
+        parameters = dict(properties=3, units_per_property=4, tenancies_per_unit=3, months=6, chunk_size=2)
+        parameters.update(options)
+        return PortfolioSeedService.seed(username, **parameters)
+
+    def portfolio(self, username):
+        """Lo que define una cartera, sin claves ni dueño."""
+        return (
+            list(Property.objects.filter(user__username=username).order_by('name').values_list('name', flat=True)),
+            list(Tenancy.objects.filter(unit__property__user__username=username).order_by(
+                'unit__property__name', 'unit__name', 'start_date'
+            ).values_list('unit__name', 'number_of_occupants', 'start_date', 'end_date')),
+            list(Expense.objects.filter(billing_cycle__property__user__username=username).order_by(
+                'billing_cycle__property__name', 'billing_cycle__year', 'billing_cycle__month', 'service_type'
+            ).values_list('service_type', 'total_amount')),
+        )
+
+    def test_seed_creates_a_consistent_portfolio(self):
+        """Crea todo lo pedido, con historial continuo y libro de asignaciones completo."""
+        result = self.seed('cartera', end_year=2025, end_month=2)
+
+        self.assertEqual(
+            {key: result[key] for key in ('properties', 'units', 'tenants', 'tenancies', 'billing_cycles', 'expenses')},
+            {'properties': 3, 'units': 12, 'tenants': 12, 'tenancies': 36, 'billing_cycles': 18, 'expenses': 72}
+        )
+        # Cada gasto se reparte entre las 4 unidades de su propiedad.
+        self.assertEqual(ExpenseAllocation.objects.count(), 72 * 4)
+        self.assertEqual(
+            list(BillingCycle.objects.filter(status=BillingCycle.Status.OPEN).values_list('year', 'month').distinct()),
+            [(2025, 2)]
+        )
+        self.assertEqual(Tenancy.objects.filter(end_date__isnull=True).count(), 12)
+        self.assertEqual(Tenancy.objects.order_by('start_date').first().start_date.isoformat(), '2024-09-01')
+        self.assertTrue(UnitOccupancy.objects.filter(year=2024, month=9).exists())
+
+    def test_same_seed_gives_the_same_portfolio(self):
+        """La misma semilla produce la misma cartera; otra semilla, una distinta."""
+        self.seed('primera', seed=7, allocations=False)
+        self.seed('segunda', seed=7, allocations=False)
+        self.seed('tercera', seed=8, allocations=False)
+
+        self.assertEqual(self.portfolio('primera'), self.portfolio('segunda'))
+        self.assertNotEqual(self.portfolio('primera'), self.portfolio('tercera'))
+
+    def test_existing_portfolio_is_not_mixed(self):
+        """No genera sobre un usuario que ya tiene propiedades."""
+        self.seed('cartera', properties=1, allocations=False)
+
+        with self.assertRaises(CommandError):
+            call_command('seed_portfolio', '--username', 'cartera', '--properties', '1', stdout=StringIO())
+
+    def test_benchmark_writes_json_report(self):
+        """El benchmark recorre los endpoints sobre la cartera y guarda los resultados."""
+        call_command(
+            'seed_portfolio', '--username', 'cartera', '--properties', '2', '--units', '3',
+            '--months', '3', stdout=StringIO()
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / 'resultado.json'
+            call_command(
+                'benchmark_api', '--username', 'cartera', '--samples', '2', '--iterations', '1',
+                '--output', str(output), stdout=StringIO()
+            )
+            report = json.loads(output.read_text())
+
+        self.assertEqual(report['parameters']['samples'], 2)
+        self.assertIn('allocation.build_rows', report['results'])
+        for name, result in report['results'].items():
+            with self.subTest(name=name):
+                self.assertEqual(result['samples'], 2)
+                self.assertIn('p95', result['latency_ms'])
+                self.assertGreater(result['queries']['max'], 0)
+                if name != 'allocation.build_rows':
+                    self.assertEqual(result['status_codes'], {'200': 2})
+
+    def test_benchmark_requires_an_existing_user(self):
+        """Sin usuario o sin propiedades no hay nada que medir."""
+        with self.assertRaises(CommandError):
+            call_command('benchmark_api', '--username', 'nadie', stdout=StringIO())
+        User.objects.create_user(username='vacio')
+        with self.assertRaises(CommandError):
+            call_command('benchmark_api', '--username', 'vacio', stdout=StringIO())
+
+
+class ConcurrencyBenchmarkTestCase(TransactionTestCase):
+    """
+    Pruebas de los benchmarks WSGI/ASGI y de conexiones. Las peticiones se atienden en otros hilos,
+    con otras conexiones, así que los datos tienen que estar confirmados.
+    """
+
+    def test_benchmark_compares_wsgi_and_asgi(self):
+        """Los dos modos atienden todas las peticiones y el informe trae ambos."""
+        PortfolioSeedService.seed('cartera', properties=2, units_per_property=3, tenancies_per_unit=2, months=3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / 'resultado.json'
+            call_command(
+                'benchmark_concurrency', '--username', 'cartera', '--samples', '2', '--requests', '6',
+                '--concurrency', '3', '--wsgi-threads', '2', '--output', str(output), stdout=StringIO()
+            )
+            report = json.loads(output.read_text())
+
+        self.assertEqual(report['benchmark'], 'concurrency')
+        self.assertEqual(len(report['results']), 6)
+        for name, result in report['results'].items():
+            for mode in ('wsgi', 'asgi'):
+                with self.subTest(name=name, mode=mode):
+                    self.assertEqual(result[mode]['status_codes'], {'200': 6})
+                    self.assertGreater(result[mode]['requests_per_second'], 0)
+
+    def test_connection_benchmark_reuses_connections(self):
+        """Sin reutilizar se abre una conexión por petición; con CONN_MAX_AGE, una por hilo."""
+        PortfolioSeedService.seed('cartera', properties=2, units_per_property=3, tenancies_per_unit=2, months=3)
+
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(connections.settings[DEFAULT_DB_ALIAS], {'CONN_MAX_AGE': 60}):
+            output = Path(directory) / 'resultado.json'
+            call_command(
+                'benchmark_connections', '--username', 'cartera', '--samples', '2', '--requests', '4',
+                '--threads', '2', '--output', str(output), stdout=StringIO()
+            )
+            report = json.loads(output.read_text())
+
+        self.assertEqual(report['benchmark'], 'connections')
+        self.assertEqual(report['parameters']['database']['CONN_MAX_AGE'], 60)
+        self.assertEqual(report['results']['connection_setup']['samples'], 4)
+        for name, result in report['results'].items():
+            if name == 'connection_setup':
+                continue
+            with self.subTest(name=name):
+                self.assertEqual(result['per_request']['status_codes'], {'200': 4})
+                self.assertEqual(result['configured']['status_codes'], {'200': 4})
+                self.assertEqual(result['per_request']['connections_opened'], 4)
+                self.assertEqual(result['configured']['connections_opened'], 2)
@@ -2,7 +2,8 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
-from ..models import Property
+from ..models import Property, Unit
+from tenants.models import Tenant
 
 class PropertyAPITest(APITestCase):
     """
@@ -81,10 +82,10 @@ class PropertyAPITest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Debe haber 2 propiedades, solo las del usuario A.
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
         
         # Verificar la estructura del primer objeto: solo campos de resumen.
-        property_data = response.data[0]
+        property_data = response.data['results'][0]
         self.assertEqual(sorted(property_data.keys()), ['address', 'id', 'name'])
         self.assertNotIn('units', property_data)
         self.assertNotIn('user', property_data)
@@ -108,4 +109,35 @@ class PropertyAPITest(APITestCase):
         response = self.client.get(self.list_create_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
\ No newline at end of file
+        self.assertEqual(response.data['results'], [])
+
+    # --- Pruebas del detalle de propiedad ---
+
+    def test_detalle_de_propiedad_usa_consultas_constantes(self):
+        """
+        Verifica que el detalle de una propiedad carga unidades e inquilinos con un
+        número fijo de consultas, sin importar cuántas unidades tenga.
+        """
+        self.client.force_authenticate(user=self.user_a)
+        propiedad = Property.objects.get(name='Propiedad 1 de A')
+        url = reverse('property-detail', kwargs={'pk': propiedad.pk})
+
+        for total in (3, 30):
+            for numero in range(propiedad.units.count(), total):
+                unidad = Unit.objects.create(name=f'Apto {numero}', property=propiedad)
+                if numero % 2 == 0:
+                    Tenant.objects.create(
+                        name=f'Inquilino {numero}', email=f'inquilino{numero}@example.com',
+                        number_of_occupants=1, unit=unidad
+                    )
+
+            # El estado agregado del GET condicional, la propiedad y sus unidades con inquilino.
+            with self.assertNumQueries(3):
+                response = self.client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data['units']), total)
+            self.assertEqual(
+                sum(1 for unidad in response.data['units'] if unidad['tenant'] is not None),
+                (total + 1) // 2
+            )
@@ -0,0 +1,145 @@
+# backend/properties/tests/test_response_cache.py
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, Unit, BillingCycle, Expense
+from rules.models import ServiceRule
+from tenants.models import Tenant
+
+
+class ResponseCacheTestCase(TestCase):
+    """
+    Pruebas de la caché de respuestas de lectura y su invalidación por señales.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        caches['responses'].clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.unit = Unit.objects.create(name="Apto 101", property=self.property)
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        self.billing_cycle = BillingCycle.objects.create(property=self.property, month=7, year=2024)
+        self.detail_url = reverse('property-detail', kwargs={'pk': self.property.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def test_repeated_reads_are_served_without_queries(self):
+        """La segunda lectura de cada vista sale de la caché."""
+        urls = [
+            reverse('property-list-create'),
+            self.detail_url,
+            reverse('service-configuration', kwargs={'property_id': self.property.pk}),
+            reverse('billing-cycle-list-create', kwargs={'property_id': self.property.pk}),
+            reverse('billing-cycle-detail', kwargs={'pk': self.billing_cycle.pk}),
+            reverse('expense-list-create', kwargs={'cycle_id': self.billing_cycle.pk}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                with self.assertNumQueries(0):
+                    second = self.client.get(url)
+                self.assertEqual(second.status_code, status.HTTP_200_OK)
+                self.assertEqual(second.data, first.data)
+
+    def test_query_params_are_part_of_the_key(self):
+        """Cada combinación de parámetros se guarda por separado."""
+        Property.objects.create(name="Edificio Norte", address="Calle 1", user=self.user)
+        url = reverse('property-list-create')
+
+        self.client.get(url)
+        response = self.client.get(url, {'page_size': 1})
+
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_cached_response_is_not_served_to_other_users(self):
+        """Otro usuario no recibe la respuesta guardada del dueño."""
+        self.client.get(self.detail_url)
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_related_changes_invalidate_the_property(self):
+        """Unidades, inquilinos, reglas, ciclos y gastos invalidan las vistas de su propiedad."""
+        expenses_url = reverse('expense-list-create', kwargs={'cycle_id': self.billing_cycle.pk})
+        cycle_url = reverse('billing-cycle-detail', kwargs={'pk': self.billing_cycle.pk})
+        config_url = reverse('service-configuration', kwargs={'property_id': self.property.pk})
+        for url in (self.detail_url, expenses_url, cycle_url, config_url):
+            self.client.get(url)
+
+        Unit.objects.create(name="Apto 102", property=self.property)
+        Tenant.objects.create(name="Ana", email="ana@test.com", number_of_occupants=1, unit=self.unit)
+        response = self.client.get(self.detail_url)
+        self.assertEqual(len(response.data['units']), 2)
+        self.assertEqual(response.data['units'][0]['tenant']['name'], "Ana")
+
+        Expense.objects.create(
+            billing_cycle=self.billing_cycle,
+            service_type=ServiceRule.ServiceType.WATER,
+            total_amount=Decimal('10.00'),
+            invoice_pdf='invoices/test_invoice.pdf'
+        )
+        self.assertEqual(len(self.client.get(expenses_url).data['results']), 1)
+
+        self.billing_cycle.status = BillingCycle.Status.IN_REVIEW
+        self.billing_cycle.save()
+        self.assertEqual(self.client.get(cycle_url).data['status'], 'in_review')
+
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.GAS,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        self.assertEqual(len(self.client.get(config_url).data), 2)
+
+    def test_property_changes_invalidate_the_owner_list(self):
+        """Renombrar una propiedad invalida el listado de su dueño, y solo el de su dueño."""
+        list_url = reverse('property-list-create')
+        self.client.get(list_url)
+        other_property = Property.objects.create(name="Ajeno", address="Calle 2", user=self.other_user)
+        self.client.force_authenticate(user=self.other_user)
+        self.client.get(list_url)
+        self.client.force_authenticate(user=self.user)
+
+        self.property.name = "Edificio Renombrado"
+        self.property.save()
+
+        self.assertEqual(self.client.get(list_url).data['results'][0]['name'], "Edificio Renombrado")
+        self.client.force_authenticate(user=self.other_user)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(list_url).data['results'][0]['id'], other_property.pk)
+
+    def test_bulk_writes_invalidate_without_signals(self):
+        """Las escrituras masivas, que no emiten señales, también invalidan."""
+        self.client.get(self.detail_url)
+
+        self.client.post(
+            reverse('unit-create', kwargs={'property_pk': self.property.pk}),
+            {'pattern': 'Apto 201..203'},
+            format='json'
+        )
+
+        self.assertEqual(len(self.client.get(self.detail_url).data['units']), 4)
@@ -0,0 +1,115 @@
+# backend/properties/tests/test_unit_bulk_api.py
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from ..models import Property, Unit, BillingCycle, Expense, ExpenseAllocation
+from rules.models import ServiceRule
+
+
+class UnitBulkCreateAPITest(APITestCase):
+    """
+    Pruebas del alta masiva de unidades.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='user.a@example.com', password='password123')
+        self.other_user = User.objects.create_user(username='user.b@example.com', password='password123')
+        self.property = Property.objects.create(name='Torre Norte', address='Calle A', user=self.user)
+        self.url = reverse('unit-create', kwargs={'property_pk': self.property.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_create_from_list(self):
+        """Una lista de unidades se crea con sus datos y se devuelve ordenada por nombre."""
+        data = [
+            {'name': 'Apto 102', 'area': '80.50'},
+            {'name': 'Apto 101', 'fixed_fee': '25.00'},
+        ]
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [(unit['name'], unit['area'], unit['fixed_fee'], unit['tenant']) for unit in response.data],
+            [('Apto 101', None, '25.00', None), ('Apto 102', '80.50', None, None)]
+        )
+        self.assertEqual(self.property.units.count(), 2)
+
+    def test_bulk_create_from_pattern(self):
+        """Un patrón se expande a todo el rango, conservando los ceros a la izquierda."""
+        response = self.client.post(
+            self.url, {'pattern': 'Local 008..012 B', 'area': '40.00'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(self.property.units.order_by('name').values_list('name', 'area')),
+            [(f'Local {number:03d} B', Decimal('40.00')) for number in range(8, 13)]
+        )
+
+    def test_query_count_does_not_grow_with_units(self):
+        """El alta usa las mismas consultas para 5 que para 300 unidades."""
+        with self.assertNumQueries(7):
+            self.client.post(self.url, {'pattern': 'Apto 1..5'}, format='json')
+        with self.assertNumQueries(7):
+            response = self.client.post(self.url, {'pattern': 'Apto 101..400'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.property.units.count(), 305)
+
+    def test_existing_or_repeated_names_create_nothing(self):
+        """Si algún nombre ya existe o se repite, no se crea ninguna unidad."""
+        Unit.objects.create(name='Apto 103', property=self.property)
+
+        response = self.client.post(self.url, {'pattern': 'Apto 101..105'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Apto 103', response.data['error'])
+
+        response = self.client.post(self.url, [{'name': 'Apto 1'}, {'name': 'Apto 1'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.property.units.count(), 1)
+
+    def test_invalid_pattern_and_foreign_property_are_rejected(self):
+        """Patrones sin rango o invertidos se rechazan y la propiedad debe ser del usuario."""
+        for pattern in ('Apto 101', 'Apto 420..101', 'Apto 1..5000'):
+            with self.subTest(pattern=pattern):
+                response = self.client.post(self.url, {'pattern': pattern}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.post(self.url, {'pattern': 'Apto 1..3'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Unit.objects.count(), 0)
+
+    def test_bulk_create_recomputes_allocations(self):
+        """Las unidades nuevas entran en el reparto de los gastos existentes."""
+        Unit.objects.create(name='Apto 100', property=self.property)
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.WATER,
+            rule_type=ServiceRule.RuleType.EQUAL_DIVISION
+        )
+        billing_cycle = BillingCycle.objects.create(property=self.property, month=7, year=2024)
+        expense = Expense.objects.create(
+            billing_cycle=billing_cycle,
+            service_type=ServiceRule.ServiceType.WATER,
+            total_amount=Decimal('90.00'),
+            invoice_pdf='invoices/test_invoice.pdf'
+        )
+
+        self.client.post(self.url, {'pattern': 'Apto 101..102'}, format='json')
+
+        self.assertEqual(
+            list(ExpenseAllocation.objects.filter(expense=expense).values_list('amount', flat=True)),
+            [Decimal('30.00')] * 3
+        )
+
+    def test_database_rejects_duplicate_names(self):
+        """La restricción única protege el nombre aunque se salte la verificación."""
+        Unit.objects.create(name='Apto 101', property=self.property)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Unit.objects.bulk_create([Unit(name='Apto 101', property=self.property)])
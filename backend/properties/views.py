@@ -3,22 +3,41 @@ from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from .models import Property, BillingCycle, Expense
+from django.db.models import Count, Max, Prefetch
+from .models import Property, Unit, BillingCycle, Expense, MeterReading
 from .serializers import (
     PropertySerializer, UnitSerializer, PropertySummarySerializer,
-    BillingCycleSerializer, BillingCycleCreateSerializer,
-    ExpenseSerializer, ExpenseCreateSerializer, UnitCreateSerializer, UnitUpdateSerializer
+    BillingCycleSerializer, BillingCycleCreateSerializer, BillingCycleCloseSerializer,
+    BillingCycleBulkCreateSerializer, BillingCycleSummarySerializer,
+    ExpenseSerializer, ExpenseCreateSerializer, UnitCreateSerializer, UnitUpdateSerializer,
+    UnitBulkCreateSerializer,
+    ExpenseAllocationSerializer, MeterReadingSerializer
 )
 from .services.unit_service import UnitService
+from .services.allocation_service import AllocationService
+from .services.billing_close_service import BillingCloseService
+from .services.billing_cycle_service import BillingCycleService
+from .services.summary_service import BillingCycleSummaryService
 from rules.models import ServiceRule
+from core.pagination import KeysetPagination
+from core.response_cache import CachedResponseMixin
+from core.conditional import ConditionalGetMixin
+from core.ownership import OwnedObjectMixin
+from core.async_views import AsyncReadView
 
-class PropertyListCreateAPIView(generics.ListCreateAPIView):
+class PropertyListCreateAPIView(CachedResponseMixin, generics.ListCreateAPIView):
     """
     Vista para listar (GET) y crear (POST) propiedades.
     Utiliza diferentes serializadores para cada acción para optimizar el rendimiento.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('name', 'pk')
+
+    def get_response_cache_scope(self):
+        return ('user', self.request.user.pk)
 
     def get_queryset(self):
         """Asegura que los usuarios solo vean sus propias propiedades."""
@@ -38,17 +57,43 @@ class PropertyListCreateAPIView(generics.ListCreateAPIView):
         """Asigna el usuario autenticado a la nueva propiedad."""
         serializer.save(user=self.request.user)
 
-class PropertyRetrieveAPIView(generics.RetrieveAPIView):
+class PropertyRetrieveAPIView(ConditionalGetMixin, CachedResponseMixin, generics.RetrieveAPIView):
     """Vista para obtener los detalles de una propiedad específica."""
     serializer_class = PropertySerializer
     permission_classes = [IsAuthenticated]
 
+    def get_response_cache_scope(self):
+        return ('property', self.kwargs['pk'])
+
+    def get_conditional_query(self):
+        """La propiedad, sus unidades y los inquilinos de esas unidades."""
+        return (
+            Property.objects.filter(pk=self.kwargs['pk'], user=self.request.user),
+            dict(
+                updated_at=Max('updated_at'),
+                unit_count=Count('units', distinct=True),
+                units_updated_at=Max('units__updated_at'),
+                tenant_count=Count('units__tenant', distinct=True),
+                tenants_updated_at=Max('units__tenant__updated_at'),
+            ),
+        )
+
     def get_queryset(self):
-        """Filtra para asegurar que el usuario solo puede ver sus propiedades."""
-        return Property.objects.filter(user=self.request.user)
+        """
+        Filtra para asegurar que el usuario solo puede ver sus propiedades.
+        Las unidades y sus inquilinos se cargan en una sola consulta adicional.
+        """
+        return Property.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch('units', queryset=Unit.objects.select_related('tenant'))
+        )
 
 class UnitListCreateAPIView(generics.ListCreateAPIView):
-    """Vista para listar (GET) y crear (POST) unidades dentro de una propiedad específica."""
+    """
+    Vista para listar (GET) y crear (POST) unidades dentro de una propiedad específica.
+
+    POST acepta una unidad, una lista de unidades (o {"units": [...]}) o un
+    patrón de nombres ({"pattern": "Apto 101..420", "area": ..., "fixed_fee": ...}).
+    """
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -67,6 +112,9 @@ class UnitListCreateAPIView(generics.ListCreateAPIView):
         """Crea una nueva unidad usando el servicio."""
         property_pk = self.kwargs['property_pk']
         property_obj = UnitService.validate_property_ownership(property_pk, request.user)
+
+        if isinstance(request.data, list) or 'units' in request.data or 'pattern' in request.data:
+            return self.bulk_create(request, property_obj)
         
         serializer = self.get_serializer(data=request.data)
         if not serializer.is_valid():
@@ -75,7 +123,9 @@ class UnitListCreateAPIView(generics.ListCreateAPIView):
         try:
             unit = UnitService.create_unit(
                 property_obj=property_obj,
-                name=serializer.validated_data['name']
+                name=serializer.validated_data['name'],
+                area=serializer.validated_data.get('area'),
+                fixed_fee=serializer.validated_data.get('fixed_fee')
             )
             response_serializer = UnitSerializer(unit)
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -86,6 +136,21 @@ class UnitListCreateAPIView(generics.ListCreateAPIView):
             )
 
 
+    def bulk_create(self, request, property_obj):
+        """Crea varias unidades con una verificación de nombres y un solo INSERT."""
+        data = {'units': request.data} if isinstance(request.data, list) else request.data
+        serializer = UnitBulkCreateSerializer(data=data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            units = UnitService.bulk_create_units(property_obj, serializer.validated_data['units'])
+        except ValidationError as e:
+            return Response({"error": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(UnitSerializer(units, many=True).data, status=status.HTTP_201_CREATED)
+
+
 class UnitRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
     """Vista para obtener, actualizar y eliminar una unidad específica."""
     permission_classes = [IsAuthenticated]
@@ -114,7 +179,7 @@ class UnitRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
         try:
             updated_unit = UnitService.update_unit(
                 unit=unit,
-                name=serializer.validated_data['name']
+                **serializer.validated_data
             )
             response_serializer = UnitSerializer(updated_unit)
             return Response(response_serializer.data)
@@ -138,7 +203,7 @@ class UnitRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
             )
 
 
-class BillingCycleListCreateAPIView(generics.ListCreateAPIView):
+class BillingCycleListCreateAPIView(OwnedObjectMixin, CachedResponseMixin, generics.ListCreateAPIView):
     """
     Vista combinada para listar (GET) y crear (POST) ciclos de facturación.
     
@@ -146,14 +211,19 @@ class BillingCycleListCreateAPIView(generics.ListCreateAPIView):
     POST /api/properties/{property_id}/billing-cycles/ - Crea nuevo ciclo
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-year', '-month', '-pk')
+
+    def get_response_cache_scope(self):
+        return ('property', self.kwargs['property_id'])
 
     def get_property(self):
         """
         Obtiene la propiedad verificando que pertenece al usuario autenticado.
         """
         property_id = self.kwargs['property_id']
-        return get_object_or_404(
-            Property,
+        return self.get_owned_object(
+            Property.objects.all(),
             pk=property_id,
             user=self.request.user
         )
@@ -164,7 +234,7 @@ class BillingCycleListCreateAPIView(generics.ListCreateAPIView):
         Solo devuelve ciclos de propiedades que pertenecen al usuario autenticado.
         """
         property_obj = self.get_property()
-        return BillingCycle.objects.filter(property=property_obj)
+        return BillingCycle.objects.filter(property=property_obj).select_related('property')
 
     def get_serializer_class(self):
         """
@@ -226,7 +296,7 @@ class BillingCycleListCreateAPIView(generics.ListCreateAPIView):
             )
 
 
-class BillingCycleRetrieveAPIView(generics.RetrieveAPIView):
+class BillingCycleRetrieveAPIView(ConditionalGetMixin, CachedResponseMixin, generics.RetrieveAPIView):
     """
     Vista para obtener detalles de un ciclo de facturación específico.
     
@@ -235,14 +305,125 @@ class BillingCycleRetrieveAPIView(generics.RetrieveAPIView):
     serializer_class = BillingCycleSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_response_cache_scope(self):
+        return ('property', BillingCycleService.get_property_id(self.kwargs['pk']))
+
+    def get_conditional_query(self):
+        """El ciclo y su propiedad, de la que se muestra el nombre."""
+        return (
+            BillingCycle.objects.filter(pk=self.kwargs['pk'], property__user=self.request.user),
+            dict(
+                updated_at=Max('updated_at'),
+                property_updated_at=Max('property__updated_at'),
+            ),
+        )
+
     def get_queryset(self):
         """
         Solo permite acceso a ciclos de propiedades del usuario autenticado.
         """
-        return BillingCycle.objects.filter(property__user=self.request.user)
+        return BillingCycle.objects.filter(property__user=self.request.user).select_related('property')
 
 
-class ExpenseListCreateAPIView(generics.ListCreateAPIView):
+class BillingCycleSummaryAPIView(generics.GenericAPIView):
+    """
+    Vista para obtener el resumen agregado de un ciclo de facturación.
+
+    GET /api/billing-cycles/{cycle_id}/summary/ - Totales por servicio, número
+    de gastos, monto total y totales asignados por unidad.
+    """
+    serializer_class = BillingCycleSummarySerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        billing_cycle = get_object_or_404(
+            BillingCycle,
+            pk=self.kwargs['cycle_id'],
+            property__user=request.user
+        )
+        summary = BillingCycleSummaryService.get_summary(billing_cycle)
+        return Response(self.get_serializer(summary).data)
+
+
+class BillingCycleBulkCreateAPIView(generics.GenericAPIView):
+    """
+    Vista para abrir ciclos de facturación en muchas propiedades y meses a la vez.
+
+    POST /api/billing-cycles/bulk/ - Abre los ciclos que falten en una sola
+    transacción y devuelve el resultado por propiedad.
+    """
+    serializer_class = BillingCycleBulkCreateSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        properties = Property.objects.filter(user=request.user).order_by('pk')
+        requested_ids = data.get('property_ids')
+        if requested_ids is not None:
+            properties = properties.filter(pk__in=requested_ids)
+        names = dict(properties.values_list('pk', 'name'))
+        # Las propiedades ajenas o inexistentes se reportan igual, sin revelar cuáles existen.
+        not_found = [pk for pk in requested_ids or [] if pk not in names]
+
+        periods = BillingCycleService.month_range(
+            data['year'], data['month'], data.get('end_year'), data.get('end_month')
+        )
+        results = BillingCycleService.bulk_open(list(names), periods)
+
+        def as_periods(items):
+            return [{'year': year, 'month': month} for year, month in items]
+
+        created = sum(len(result['created']) for result in results.values())
+        return Response(
+            {
+                'created': created,
+                'existing': sum(len(result['existing']) for result in results.values()),
+                'not_found': not_found,
+                'results': [
+                    {
+                        'property': property_id,
+                        'property_name': names[property_id],
+                        'created': as_periods(result['created']),
+                        'existing': as_periods(result['existing']),
+                    }
+                    for property_id, result in results.items()
+                ],
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
+
+
+class BillingCycleCloseAPIView(generics.GenericAPIView):
+    """
+    Vista para el cierre de mes de las propiedades del usuario autenticado.
+
+    POST /api/billing-cycles/close/ - Pasa los ciclos del año/mes indicado a
+    revisión o cerrado y devuelve los totales del cierre.
+    """
+    serializer_class = BillingCycleCloseSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # Dentro de una petición los bloques se procesan en el mismo proceso;
+        # el cierre de todo el portafolio se lanza con el comando close_billing_cycles.
+        result = BillingCloseService.close_month(
+            serializer.validated_data['year'],
+            serializer.validated_data['month'],
+            target_status=serializer.validated_data['status'],
+            properties=Property.objects.filter(user=request.user),
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class ExpenseListCreateAPIView(OwnedObjectMixin, ConditionalGetMixin, CachedResponseMixin, generics.ListCreateAPIView):
     """
     Vista para listar (GET) y crear (POST) gastos para un ciclo de facturación específico.
     
@@ -250,14 +431,30 @@ class ExpenseListCreateAPIView(generics.ListCreateAPIView):
     POST /api/billing-cycles/{cycle_id}/expenses/ - Crea nuevo gasto
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-pk')
+
+    def get_response_cache_scope(self):
+        return ('property', BillingCycleService.get_property_id(self.kwargs['cycle_id']))
+
+    def get_conditional_query(self):
+        """El ciclo y sus gastos."""
+        return (
+            BillingCycle.objects.filter(pk=self.kwargs['cycle_id'], property__user=self.request.user),
+            dict(
+                updated_at=Max('updated_at'),
+                expense_count=Count('expenses', distinct=True),
+                expenses_updated_at=Max('expenses__updated_at'),
+            ),
+        )
 
     def get_billing_cycle(self):
         """
         Obtiene el ciclo de facturación verificando que pertenece al usuario autenticado.
         """
         cycle_id = self.kwargs['cycle_id']
-        return get_object_or_404(
-            BillingCycle,
+        return self.get_owned_object(
+            BillingCycle.objects.select_related('property'),
             pk=cycle_id,
             property__user=self.request.user
         )
@@ -336,3 +533,169 @@ class ExpenseListCreateAPIView(generics.ListCreateAPIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+
+class BillingCycleAllocationListAPIView(generics.ListAPIView):
+    """
+    Vista para obtener el desglose por unidad de los gastos de un ciclo.
+    Lee el libro de asignaciones materializado; no recalcula nada.
+    
+    GET /api/billing-cycles/{cycle_id}/allocations/
+    """
+    serializer_class = ExpenseAllocationSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """
+        Solo permite acceso a ciclos de propiedades del usuario autenticado.
+        """
+        billing_cycle = get_object_or_404(
+            BillingCycle,
+            pk=self.kwargs['cycle_id'],
+            property__user=self.request.user
+        )
+        return AllocationService.get_cycle_breakdown(billing_cycle)
+
+
+class MeterReadingListCreateAPIView(OwnedObjectMixin, generics.ListCreateAPIView):
+    """
+    Vista para listar (GET) y registrar (POST) lecturas de medidores de un ciclo.
+    Registrar una lectura ya existente (misma unidad y servicio) la actualiza.
+    
+    GET /api/billing-cycles/{cycle_id}/meter-readings/ - Lista lecturas del ciclo
+    POST /api/billing-cycles/{cycle_id}/meter-readings/ - Registra una lectura
+    """
+    serializer_class = MeterReadingSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_billing_cycle(self):
+        """
+        Obtiene el ciclo de facturación verificando que pertenece al usuario autenticado.
+        """
+        return self.get_owned_object(
+            BillingCycle.objects.select_related('property'),
+            pk=self.kwargs['cycle_id'],
+            property__user=self.request.user
+        )
+
+    def get_queryset(self):
+        """
+        Filtra las lecturas para el ciclo de facturación especificado.
+        """
+        billing_cycle = self.get_billing_cycle()
+        return MeterReading.objects.filter(billing_cycle=billing_cycle).select_related('unit')
+
+    def create(self, request, *args, **kwargs):
+        """
+        Registra o actualiza una lectura en un ciclo abierto.
+        """
+        billing_cycle = self.get_billing_cycle()
+
+        if billing_cycle.status != BillingCycle.Status.OPEN:
+            return Response(
+                {"error": "No se pueden registrar lecturas en un ciclo que no está abierto."},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        serializer = self.get_serializer(
+            data=request.data,
+            context={**self.get_serializer_context(), 'billing_cycle': billing_cycle}
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        reading, created = MeterReading.objects.update_or_create(
+            billing_cycle=billing_cycle,
+            unit=serializer.validated_data['unit'],
+            service_type=serializer.validated_data['service_type'],
+            defaults={
+                'previous_reading': serializer.validated_data['previous_reading'],
+                'current_reading': serializer.validated_data['current_reading'],
+            }
+        )
+
+        return Response(
+            MeterReadingSerializer(reading).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
+
+
+# ----------------------------------------------------------------------
+# Camino de lectura asíncrono (core/async_views.py, rutas en core/asgi_urls.py)
+# ----------------------------------------------------------------------
+
+class PropertyListCreateAsyncView(AsyncReadView):
+    """GET /api/properties/ bajo ASGI; POST lo atiende PropertyListCreateAPIView."""
+    sync_view = PropertyListCreateAPIView
+
+    async def get_response_cache_scope(self):
+        return ('user', self.request.user.pk)
+
+    async def get_data(self):
+        queryset = Property.objects.filter(user=self.request.user).order_by('name')
+        return await self.list_data(queryset, self.view.get_serializer_class())
+
+
+class PropertyRetrieveAsyncView(AsyncReadView):
+    """GET /api/properties/{id}/ bajo ASGI."""
+    sync_view = PropertyRetrieveAPIView
+
+    async def get_response_cache_scope(self):
+        return ('property', self.kwargs['pk'])
+
+    async def get_data(self):
+        property_obj = await self.aget_owned_object(
+            Property.objects.prefetch_related(Prefetch('units', queryset=Unit.objects.select_related('tenant'))),
+            pk=self.kwargs['pk'],
+            user=self.request.user
+        )
+        return self.serialize(property_obj, self.view.get_serializer_class())
+
+
+class BillingCycleListCreateAsyncView(AsyncReadView):
+    """GET /api/properties/{property_id}/billing-cycles/ bajo ASGI."""
+    sync_view = BillingCycleListCreateAPIView
+
+    async def get_response_cache_scope(self):
+        return ('property', self.kwargs['property_id'])
+
+    async def get_data(self):
+        property_obj = await self.aget_owned_object(
+            Property.objects.all(),
+            pk=self.kwargs['property_id'],
+            user=self.request.user
+        )
+        queryset = BillingCycle.objects.filter(property=property_obj).select_related('property')
+        return await self.list_data(queryset, self.view.get_serializer_class())
+
+
+class BillingCycleRetrieveAsyncView(AsyncReadView):
+    """GET /api/billing-cycles/{cycle_id}/ bajo ASGI."""
+    sync_view = BillingCycleRetrieveAPIView
+
+    async def get_response_cache_scope(self):
+        return ('property', await BillingCycleService.aget_property_id(self.kwargs['pk']))
+
+    async def get_data(self):
+        billing_cycle = await self.aget_owned_object(
+            BillingCycle.objects.select_related('property'),
+            pk=self.kwargs['pk'],
+            property__user=self.request.user
+        )
+        return self.serialize(billing_cycle, self.view.get_serializer_class())
+
+
+class ExpenseListCreateAsyncView(AsyncReadView):
+    """GET /api/billing-cycles/{cycle_id}/expenses/ bajo ASGI; POST lo atiende ExpenseListCreateAPIView."""
+    sync_view = ExpenseListCreateAPIView
+
+    async def get_response_cache_scope(self):
+        return ('property', await BillingCycleService.aget_property_id(self.kwargs['cycle_id']))
+
+    async def get_data(self):
+        billing_cycle = await self.aget_owned_object(
+            BillingCycle.objects.select_related('property'),
+            pk=self.kwargs['cycle_id'],
+            property__user=self.request.user
+        )
+        queryset = Expense.objects.filter(billing_cycle=billing_cycle)
+        return await self.list_data(queryset, self.view.get_serializer_class())
@@ -0,0 +1,17 @@
+# backend/rules/allocation/__init__.py
+
+from .engine import (
+    ROUND_LARGEST_REMAINDER, ROUND_PER_SHARE,
+    allocate_batch, allocate_cycle, allocate_cycles, cents_to_decimal, share_cents
+)
+from .allocators import (
+    AllocationContext, Allocator, WeightedAllocator,
+    allocate_expenses, get_allocator, register
+)
+
+__all__ = [
+    'ROUND_LARGEST_REMAINDER', 'ROUND_PER_SHARE',
+    'allocate_batch', 'allocate_cycle', 'allocate_cycles', 'cents_to_decimal', 'share_cents',
+    'AllocationContext', 'Allocator', 'WeightedAllocator',
+    'allocate_expenses', 'get_allocator', 'register'
+]
@@ -0,0 +1,171 @@
+# backend/rules/allocation/allocators.py
+"""
+Registro de repartidores por tipo de regla.
+
+Todos los repartidores comparten la misma interfaz por lotes: reciben todos los
+gastos de un ciclo que usan su regla junto con los datos del ciclo
+(AllocationContext) y devuelven las porciones en centavos de cada gasto.
+"""
+from decimal import Decimal
+from ..models import ServiceRule
+from .engine import allocate_cycle, share_cents
+
+ALLOCATORS = {}
+
+
+def register(rule_type):
+    """Decorador que registra un repartidor para un tipo de regla."""
+    def decorator(cls):
+        ALLOCATORS[rule_type] = cls()
+        return cls
+    return decorator
+
+
+def get_allocator(rule_type):
+    """Obtiene el repartidor de un tipo de regla, o None si no existe."""
+    return ALLOCATORS.get(rule_type)
+
+
+def _scaled_weights(values, decimal_places):
+    """Convierte valores Decimal en pesos enteros sin perder la proporción."""
+    return [
+        max(int(value.scaleb(decimal_places)), 0) if value is not None else 0
+        for value in values
+    ]
+
+
+class AllocationContext:
+    """
+    Datos de las unidades de un ciclo que necesitan los repartidores.
+    Todas las listas están alineadas con unit_ids.
+    """
+
+    def __init__(self, unit_ids, occupant_days=None, areas=None, fixed_fees=None, consumption=None):
+        self.unit_ids = list(unit_ids)
+        count = len(self.unit_ids)
+        # Ocupantes × días ocupados en el mes del ciclo, según el historial de arrendamientos.
+        self.occupant_days = list(occupant_days) if occupant_days is not None else [0] * count
+        self.areas = list(areas) if areas is not None else [None] * count
+        self.fixed_fees = list(fixed_fees) if fixed_fees is not None else [None] * count
+        # Consumo por tipo de servicio: {service_type: [consumo por unidad]}
+        self.consumption = consumption or {}
+
+
+class Allocator:
+    """
+    Interfaz común de los repartidores.
+    """
+
+    def allocate(self, expenses, context):
+        """
+        Reparte todos los gastos de un ciclo que usan esta regla.
+
+        Args:
+            expenses: Tuplas (service_type, monto, modo de redondeo).
+            context: AllocationContext del ciclo.
+
+        Returns:
+            Por cada gasto, la lista de porciones en centavos (una por unidad).
+        """
+        raise NotImplementedError
+
+
+class WeightedAllocator(Allocator):
+    """
+    Repartidor proporcional a un vector de pesos enteros por unidad.
+    Los gastos que comparten vector se reparten juntos en el motor por lotes.
+    """
+
+    def weight_key(self, service_type):
+        """Clave del vector de pesos; por defecto, el mismo para todos los servicios."""
+        return None
+
+    def weights(self, context, service_type):
+        raise NotImplementedError
+
+    def allocate(self, expenses, context):
+        weight_vectors = {}
+        batch = []
+        for service_type, amount, rounding in expenses:
+            key = self.weight_key(service_type)
+            if key not in weight_vectors:
+                weight_vectors[key] = self.weights(context, service_type)
+            batch.append((key, amount, rounding))
+        return allocate_cycle(batch, weight_vectors)
+
+
+@register(ServiceRule.RuleType.EQUAL_DIVISION)
+class EqualDivisionAllocator(WeightedAllocator):
+    """Todas las unidades pagan lo mismo."""
+
+    def weights(self, context, service_type):
+        return [1] * len(context.unit_ids)
+
+
+@register(ServiceRule.RuleType.OCCUPANT_PRORATION)
+class OccupantProrationAllocator(WeightedAllocator):
+    """Cada unidad paga según sus días-ocupante en el mes del ciclo."""
+
+    def weights(self, context, service_type):
+        return [days or 0 for days in context.occupant_days]
+
+
+@register(ServiceRule.RuleType.PROPORTIONAL_AREA)
+class ProportionalAreaAllocator(WeightedAllocator):
+    """Cada unidad paga según su área (m², dos decimales)."""
+
+    def weights(self, context, service_type):
+        return _scaled_weights(context.areas, 2)
+
+
+@register(ServiceRule.RuleType.CONSUMPTION_ADJUSTMENT)
+class ConsumptionAdjustmentAllocator(WeightedAllocator):
+    """Cada unidad paga según el consumo medido para el servicio (tres decimales)."""
+
+    def weight_key(self, service_type):
+        return service_type
+
+    def weights(self, context, service_type):
+        consumption = context.consumption.get(service_type)
+        if consumption is None:
+            return [0] * len(context.unit_ids)
+        return _scaled_weights(consumption, 3)
+
+
+@register(ServiceRule.RuleType.FIXED_FEE)
+class FixedFeeAllocator(Allocator):
+    """
+    Cada unidad paga su cuota fija, sin importar el monto del gasto.
+    Las unidades sin cuota no pagan; el redondeo no aplica.
+    """
+
+    def allocate(self, expenses, context):
+        fees = [share_cents(fee or Decimal('0'), 1, 1) for fee in context.fixed_fees]
+        return [list(fees) for _ in expenses]
+
+
+def allocate_expenses(expenses, context):
+    """
+    Reparte todos los gastos de un ciclo despachando cada regla a su repartidor.
+
+    Args:
+        expenses: Tuplas (rule_type, service_type, monto, modo de redondeo).
+        context: AllocationContext del ciclo.
+
+    Returns:
+        Las porciones en centavos de cada gasto en el orden de entrada,
+        o None para los gastos cuya regla no tiene repartidor.
+    """
+    groups = {}
+    for index, (rule_type, service_type, amount, rounding) in enumerate(expenses):
+        groups.setdefault(rule_type, []).append((index, (service_type, amount, rounding)))
+
+    results = [None] * len(expenses)
+    for rule_type, items in groups.items():
+        allocator = get_allocator(rule_type)
+        if allocator is None:
+            continue
+        shares = allocator.allocate([item for _, item in items], context)
+        for (index, _), row in zip(items, shares):
+            results[index] = row
+    return results
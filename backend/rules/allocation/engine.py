@@ -0,0 +1,172 @@
+# backend/rules/allocation/engine.py
+"""
+Motor de asignación por lotes.
+
+Todas las porciones se calculan con aritmética entera en centavos: cada monto
+se representa como una fracción exacta (numerador / denominador) y el redondeo
+final replica ``Decimal.quantize(Decimal('0.01'))`` con ROUND_HALF_EVEN, por lo
+que los resultados coinciden con los cálculos Decimal originales.
+
+Modos de redondeo:
+    ROUND_PER_SHARE: cada porción se redondea por separado (comportamiento original);
+        la suma puede diferir del total en algunos centavos.
+    ROUND_LARGEST_REMAINDER: método del resto mayor (Hamilton); reparte los centavos
+        sobrantes a las unidades con mayor resto y garantiza que la suma sea el total.
+"""
+from decimal import Decimal
+from typing import Hashable, List, Mapping, Sequence, Tuple
+
+ROUND_PER_SHARE = 'per_share'
+ROUND_LARGEST_REMAINDER = 'largest_remainder'
+
+
+def _cent_fraction(amount: Decimal) -> Tuple[int, int]:
+    """
+    Representa ``amount * 100`` como una fracción exacta de enteros.
+    """
+    sign, digits, exponent = amount.as_tuple()
+    mantissa = int(''.join(map(str, digits)) or 0)
+    if sign:
+        mantissa = -mantissa
+
+    exponent += 2  # De unidades monetarias a centavos
+    if exponent >= 0:
+        return mantissa * 10 ** exponent, 1
+    return mantissa, 10 ** -exponent
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    """
+    Redondea numerator / denominator al entero más cercano (empates al par).
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """Convierte centavos enteros a un Decimal con dos decimales."""
+    return Decimal(cents).scaleb(-2)
+
+
+def share_cents(amount: Decimal, weight: int, total_weight: int) -> int:
+    """
+    Calcula la porción (en centavos) de un monto para un peso dado.
+    """
+    if total_weight <= 0:
+        return 0
+    numerator, denominator = _cent_fraction(amount)
+    return _round_half_even(numerator * weight, denominator * total_weight)
+
+
+def _largest_remainder(
+    numerator: int, denominator: int, weights: Sequence[int], total_weight: int
+) -> List[int]:
+    """
+    Reparte (numerator / denominator) * total_weight centavos con el método del
+    resto mayor: la cuota exacta de cada unidad es numerator * peso / denominator.
+
+    Cada unidad recibe la parte entera de su cuota y los centavos restantes se
+    asignan, uno por unidad, a las de mayor resto (empates: orden de entrada).
+    Complejidad O(n log n) por el ordenamiento de los restos.
+    """
+    total_cents = _round_half_even(numerator * total_weight, denominator)
+
+    floors = {}
+    remainders = {}
+    for weight in set(weights):
+        floors[weight], remainders[weight] = divmod(numerator * weight, denominator)
+
+    shares = [floors[weight] for weight in weights]
+    leftover = total_cents - sum(shares)
+    if leftover:
+        order = sorted(range(len(weights)), key=lambda index: -remainders[weights[index]])
+        for index in order[:leftover]:
+            shares[index] += 1
+    return shares
+
+
+def allocate_batch(
+    amounts: Sequence[Decimal],
+    weights: Sequence[int],
+    rounding: str = ROUND_PER_SHARE,
+) -> List[List[int]]:
+    """
+    Reparte varios montos entre las mismas unidades en una sola pasada.
+
+    Args:
+        amounts: Montos a repartir (ej. los gastos de un ciclo con la misma regla).
+        weights: Peso entero de cada unidad (ej. 1 por unidad, ocupantes).
+        rounding: ROUND_PER_SHARE o ROUND_LARGEST_REMAINDER.
+
+    Returns:
+        Por cada monto, la lista de porciones en centavos (una por unidad).
+    """
+    if rounding not in (ROUND_PER_SHARE, ROUND_LARGEST_REMAINDER):
+        raise ValueError(f"Modo de redondeo desconocido: {rounding}")
+
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        return [[0] * len(weights) for _ in amounts]
+
+    # Las unidades suelen compartir pocos pesos distintos (ej. 1-6 ocupantes),
+    # así que cada porción se calcula una sola vez por peso y monto.
+    distinct_weights = set(weights)
+    results = []
+    for amount in amounts:
+        numerator, denominator = _cent_fraction(amount)
+        denominator *= total_weight
+        if rounding == ROUND_LARGEST_REMAINDER:
+            results.append(_largest_remainder(numerator, denominator, weights, total_weight))
+            continue
+        by_weight = {
+            weight: _round_half_even(numerator * weight, denominator)
+            for weight in distinct_weights
+        }
+        results.append([by_weight[weight] for weight in weights])
+    return results
+
+
+def allocate_cycle(
+    expenses: Sequence[Tuple[Hashable, Decimal]],
+    weight_vectors: Mapping[Hashable, Sequence[int]],
+) -> List[List[int]]:
+    """
+    Reparte todos los gastos de un ciclo agrupándolos por vector de pesos.
+
+    Args:
+        expenses: Tuplas (clave del vector de pesos, monto) o (clave, monto, modo
+            de redondeo) en el orden deseado. Por defecto se usa ROUND_PER_SHARE.
+        weight_vectors: Vector de pesos por unidad para cada clave.
+
+    Returns:
+        Las porciones en centavos de cada gasto, en el mismo orden de entrada.
+    """
+    groups = {}
+    for index, (key, amount, *options) in enumerate(expenses):
+        rounding = options[0] if options else ROUND_PER_SHARE
+        groups.setdefault((key, rounding), []).append((index, amount))
+
+    results = [None] * len(expenses)
+    for (key, rounding), items in groups.items():
+        shares = allocate_batch(
+            [amount for _, amount in items], weight_vectors[key], rounding
+        )
+        for (index, _), row in zip(items, shares):
+            results[index] = row
+    return results
+
+
+def allocate_cycles(cycles):
+    """
+    Reparte los gastos de varios ciclos.
+
+    Args:
+        cycles: Iterable de pares (expenses, weight_vectors) como en ``allocate_cycle``.
+
+    Returns:
+        Lista con el resultado de ``allocate_cycle`` para cada ciclo.
+    """
+    return [allocate_cycle(expenses, weight_vectors) for expenses, weight_vectors in cycles]
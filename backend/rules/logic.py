@@ -1,5 +1,6 @@
 # backend/rules/logic.py
 from decimal import Decimal
+from .allocation import allocate_batch, cents_to_decimal, share_cents
 
 def calculate_equal_division(total_amount: Decimal, unit_count: int) -> Decimal:
     """
@@ -11,22 +12,21 @@ def calculate_equal_division(total_amount: Decimal, unit_count: int) -> Decimal:
     if unit_count <= 0:
         return Decimal('0.00')
     
-    # Usar el tipo Decimal para precisión monetaria.
-    return (total_amount / Decimal(unit_count)).quantize(Decimal('0.01'))
+    # Aritmética entera en centavos; equivalente a (total / n).quantize(0.01).
+    return cents_to_decimal(share_cents(total_amount, 1, unit_count))
 
-def calculate_occupant_proration(total_amount: Decimal, units: list) -> list[Decimal]:
+def calculate_occupant_proration(total_amount: Decimal, occupant_days: list) -> list[Decimal]:
     """
     Calcula la porción de un gasto bajo una regla de prorrateo por ocupante.
-    """
-    occupant_counts = [unit.tenant.number_of_occupants for unit in units if hasattr(unit, 'tenant')]
-    total_occupants = sum(occupant_counts)
 
-    if total_occupants <= 0:
-        return [Decimal('0.00')] * len(units)
+    Args:
+        occupant_days: Días-ocupante de cada unidad en el mes del ciclo, como los
+            de OccupancyService.get_occupant_days (None o 0 si estuvo vacía).
 
-    portions = []
-    for count in occupant_counts:
-        share = (total_amount * Decimal(count) / Decimal(total_occupants)).quantize(Decimal('0.01'))
-        portions.append(share)
-    
-    return portions
\ No newline at end of file
+    Returns:
+        La cantidad que corresponde a cada unidad, en el mismo orden.
+    """
+    # Mismos pesos que OccupantProrationAllocator.
+    weights = [days or 0 for days in occupant_days]
+    [shares] = allocate_batch([total_amount], weights)
+    return [cents_to_decimal(cents) for cents in shares]
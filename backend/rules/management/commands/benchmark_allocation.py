@@ -0,0 +1,78 @@
+# backend/rules/management/commands/benchmark_allocation.py
+import random
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from rules.allocation import allocate_cycles
+
+
+def _decimal_cycle(expenses, weight_vectors):
+    """Reparto por unidad con Decimal, como en la implementación original."""
+    results = []
+    for key, amount in expenses:
+        weights = weight_vectors[key]
+        total_weight = Decimal(sum(weights))
+        results.append([
+            (amount * Decimal(weight) / total_weight).quantize(Decimal('0.01'))
+            for weight in weights
+        ])
+    return results
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide el rendimiento (ciclos por segundo) del motor de asignación por lotes "
+        "frente al reparto Decimal unidad por unidad."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cycles', type=int, default=200, help="Número de ciclos a repartir.")
+        parser.add_argument('--units', type=int, default=300, help="Unidades por ciclo.")
+        parser.add_argument('--expenses', type=int, default=6, help="Gastos por ciclo.")
+        parser.add_argument('--seed', type=int, default=0, help="Semilla para datos reproducibles.")
+
+    def handle(self, *args, **options):
+        cycles = self._build_cycles(options['cycles'], options['units'], options['expenses'], options['seed'])
+
+        start = time.perf_counter()
+        decimal_results = [_decimal_cycle(expenses, vectors) for expenses, vectors in cycles]
+        decimal_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_results = allocate_cycles(cycles)
+        batch_elapsed = time.perf_counter() - start
+
+        # Verificar que ambos caminos producen exactamente las mismas porciones.
+        for decimal_cycle, batch_cycle in zip(decimal_results, batch_results):
+            for decimal_row, batch_row in zip(decimal_cycle, batch_cycle):
+                if decimal_row != [Decimal(cents).scaleb(-2) for cents in batch_row]:
+                    self.stderr.write(self.style.ERROR("Los resultados no coinciden."))
+                    return
+
+        pairs = options['cycles'] * options['units'] * options['expenses']
+        self.stdout.write(f"Ciclos: {options['cycles']} | pares unidad×gasto: {pairs}")
+        self.stdout.write(
+            f"Decimal por unidad: {decimal_elapsed:.3f}s "
+            f"({options['cycles'] / decimal_elapsed:.1f} ciclos/s)"
+        )
+        self.stdout.write(
+            f"Motor por lotes:    {batch_elapsed:.3f}s "
+            f"({options['cycles'] / batch_elapsed:.1f} ciclos/s)"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Aceleración: {decimal_elapsed / batch_elapsed:.1f}x"))
+
+    def _build_cycles(self, cycle_count, unit_count, expense_count, seed):
+        """Genera ciclos sintéticos deterministas con reglas mixtas."""
+        rng = random.Random(seed)
+        cycles = []
+        for _ in range(cycle_count):
+            weight_vectors = {
+                'equal_division': [1] * unit_count,
+                'occupant_proration': [rng.randint(1, 6) for _ in range(unit_count)],
+            }
+            expenses = [
+                (rng.choice(list(weight_vectors)), Decimal(rng.randint(10000, 5000000)).scaleb(-2))
+                for _ in range(expense_count)
+            ]
+            cycles.append((expenses, weight_vectors))
+        return cycles
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rules', '0003_alter_rule_type_servicerule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicerule',
+            name='rounding_mode',
+            field=models.CharField(choices=[('per_share', 'Redondeo por Porción'), ('largest_remainder', 'Resto Mayor (Suma Exacta)')], default='per_share', help_text='Cómo se redondean las porciones a centavos al repartir el gasto.', max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0007_cursor_pagination_indexes'),
+        ('rules', '0004_servicerule_rounding_mode'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rule',
+            index=models.Index(fields=['property', 'created_at', 'id'], name='rules_rule_propert_c4e1d3_idx'),
+        ),
+    ]
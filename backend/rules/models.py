@@ -25,6 +25,10 @@ class Rule(models.Model):
     class Meta:
         # Una propiedad no debería tener la misma regla dos veces.
         unique_together = ('property', 'type')
+        indexes = [
+            # Listado paginado por cursor (se recorre en sentido inverso).
+            models.Index(fields=['property', 'created_at', 'id']),
+        ]
 
     def __str__(self):
         return f'{self.get_type_display()} para {self.property.name}'
@@ -49,6 +53,10 @@ class ServiceRule(models.Model):
         CONSUMPTION_ADJUSTMENT = 'consumption_adjustment', 'Ajuste por Consumo (Medidores)'
         FIXED_FEE = 'fixed_fee', 'Cuota Fija'
 
+    class RoundingMode(models.TextChoices):
+        PER_SHARE = 'per_share', 'Redondeo por Porción'
+        LARGEST_REMAINDER = 'largest_remainder', 'Resto Mayor (Suma Exacta)'
+
     service_type = models.CharField(
         max_length=50,
         choices=ServiceType.choices,
@@ -59,6 +67,12 @@ class ServiceRule(models.Model):
         choices=RuleType.choices,
         help_text="El tipo de regla de asignación de gastos para este servicio."
     )
+    rounding_mode = models.CharField(
+        max_length=20,
+        choices=RoundingMode.choices,
+        default=RoundingMode.PER_SHARE,
+        help_text="Cómo se redondean las porciones a centavos al repartir el gasto."
+    )
     property = models.ForeignKey(
         Property, 
         on_delete=models.CASCADE, 
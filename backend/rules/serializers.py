@@ -13,11 +13,17 @@ class ServiceRuleSerializer(serializers.ModelSerializer):
     """
     Serializer para ServiceRule que maneja la configuración de servicios.
     Solo incluye service_type y rule_type en la respuesta API, ocultando detalles internos.
+    El modo de redondeo (rounding_mode) es opcional y solo se acepta al escribir.
     """
+    rounding_mode = serializers.ChoiceField(
+        choices=ServiceRule.RoundingMode.choices,
+        required=False,
+        write_only=True
+    )
     
     class Meta:
         model = ServiceRule
-        fields = ['service_type', 'rule_type']
+        fields = ['service_type', 'rule_type', 'rounding_mode']
         # No incluimos 'property', 'id', 'created_at', 'updated_at' en la API response
     
     def validate(self, attrs):
@@ -0,0 +1,127 @@
+# backend/rules/tests/test_allocation_engine.py
+import random
+from decimal import Decimal
+from django.test import SimpleTestCase
+from ..allocation import (
+    ROUND_LARGEST_REMAINDER, allocate_batch, allocate_cycle, allocate_cycles, cents_to_decimal, share_cents
+)
+
+
+def decimal_share(total_amount, weight, total_weight):
+    """Cálculo de referencia con Decimal, tal como lo hacía rules/logic.py."""
+    return (total_amount * Decimal(weight) / Decimal(total_weight)).quantize(Decimal('0.01'))
+
+
+class AllocationEngineTest(SimpleTestCase):
+    """Pruebas del motor de asignación por lotes en centavos enteros."""
+
+    def test_share_cents_matches_decimal_reference(self):
+        """Las porciones enteras coinciden con el cálculo Decimal original."""
+        rng = random.Random(42)
+        for _ in range(2000):
+            amount = Decimal(rng.randint(0, 10 ** 8)).scaleb(-2)
+            total_weight = rng.randint(1, 500)
+            weight = rng.randint(0, total_weight)
+            self.assertEqual(
+                cents_to_decimal(share_cents(amount, weight, total_weight)),
+                decimal_share(amount, weight, total_weight),
+            )
+
+    def test_half_even_ties(self):
+        """Los empates se redondean al par, igual que Decimal.quantize."""
+        self.assertEqual(share_cents(Decimal('0.01'), 1, 2), 0)
+        self.assertEqual(share_cents(Decimal('0.03'), 1, 2), 2)
+        self.assertEqual(share_cents(Decimal('0.05'), 1, 2), 2)
+        self.assertEqual(share_cents(Decimal('-0.03'), 1, 2), -2)
+
+    def test_amounts_with_more_than_two_decimals(self):
+        """Montos con más precisión se reparten exactamente antes de redondear."""
+        amount = Decimal('100.005')
+        self.assertEqual(
+            cents_to_decimal(share_cents(amount, 1, 1)),
+            decimal_share(amount, 1, 1),
+        )
+
+    def test_allocate_batch(self):
+        """Varios montos se reparten entre las mismas unidades en una sola llamada."""
+        weights = [1, 2, 2]
+        amounts = [Decimal('100.00'), Decimal('10.00')]
+        self.assertEqual(allocate_batch(amounts, weights), [[2000, 4000, 4000], [200, 400, 400]])
+
+    def test_allocate_batch_without_weight(self):
+        """Sin peso total no se asigna nada."""
+        self.assertEqual(allocate_batch([Decimal('50.00')], [0, 0]), [[0, 0]])
+
+    def test_allocate_cycle_preserves_expense_order(self):
+        """Los gastos se agrupan por vector de pesos pero el resultado respeta el orden."""
+        weight_vectors = {'equal': [1, 1, 1], 'occupants': [1, 2, 2]}
+        expenses = [
+            ('occupants', Decimal('100.00')),
+            ('equal', Decimal('100.00')),
+            ('occupants', Decimal('50.00')),
+        ]
+        self.assertEqual(
+            allocate_cycle(expenses, weight_vectors),
+            [[2000, 4000, 4000], [3333, 3333, 3333], [1000, 2000, 2000]],
+        )
+
+    def test_allocate_cycles(self):
+        """Se pueden repartir varios ciclos en una sola llamada."""
+        cycles = [
+            ([('equal', Decimal('10.00'))], {'equal': [1, 1]}),
+            ([('equal', Decimal('9.00'))], {'equal': [1, 1, 1]}),
+        ]
+        self.assertEqual(allocate_cycles(cycles), [[[500, 500]], [[300, 300, 300]]])
+
+
+class LargestRemainderRoundingTest(SimpleTestCase):
+    """Pruebas del redondeo por resto mayor (Hamilton)."""
+
+    def test_shares_sum_to_total(self):
+        """La suma de las porciones siempre coincide con el total en centavos."""
+        rng = random.Random(7)
+        for _ in range(500):
+            amount = Decimal(rng.randint(1, 10 ** 7)).scaleb(-2)
+            weights = [rng.randint(0, 6) for _ in range(rng.randint(1, 80))]
+            if not any(weights):
+                continue
+            [shares] = allocate_batch([amount], weights, ROUND_LARGEST_REMAINDER)
+            self.assertEqual(sum(shares), int(amount * 100))
+
+    def test_per_share_rounding_can_drift(self):
+        """El redondeo por porción puede no sumar el total; el resto mayor sí."""
+        amount = Decimal('100.00')
+        [per_share] = allocate_batch([amount], [1, 1, 1])
+        [hamilton] = allocate_batch([amount], [1, 1, 1], ROUND_LARGEST_REMAINDER)
+        self.assertEqual(sum(per_share), 9999)
+        self.assertEqual(hamilton, [3334, 3333, 3333])
+
+    def test_leftover_goes_to_largest_remainders(self):
+        """Los centavos sobrantes van a las unidades con mayor resto."""
+        # 10.00 entre pesos 1, 1, 4 -> 166.67, 166.67, 666.67 centavos.
+        [shares] = allocate_batch([Decimal('10.00')], [1, 1, 4], ROUND_LARGEST_REMAINDER)
+        self.assertEqual(shares, [167, 167, 666])
+
+    def test_each_share_within_one_cent_of_exact_quota(self):
+        """Cada porción difiere de su cuota exacta en menos de un centavo."""
+        weights = [3, 5, 7, 11]
+        [shares] = allocate_batch([Decimal('123.45')], weights, ROUND_LARGEST_REMAINDER)
+        for share, weight in zip(shares, weights):
+            self.assertLess(abs(share - Decimal(12345 * weight) / sum(weights)), 1)
+
+    def test_unknown_rounding_mode(self):
+        """Un modo de redondeo desconocido se rechaza."""
+        with self.assertRaises(ValueError):
+            allocate_batch([Decimal('1.00')], [1], 'banker')
+
+    def test_allocate_cycle_with_per_expense_rounding(self):
+        """Cada gasto del ciclo puede usar su propio modo de redondeo."""
+        weight_vectors = {'equal': [1, 1, 1]}
+        expenses = [
+            ('equal', Decimal('100.00')),
+            ('equal', Decimal('100.00'), ROUND_LARGEST_REMAINDER),
+        ]
+        self.assertEqual(
+            allocate_cycle(expenses, weight_vectors),
+            [[3333, 3333, 3333], [3334, 3333, 3333]],
+        )
@@ -0,0 +1,89 @@
+# backend/rules/tests/test_allocators.py
+from decimal import Decimal
+from django.test import SimpleTestCase
+from ..allocation import (
+    ROUND_LARGEST_REMAINDER, ROUND_PER_SHARE, AllocationContext,
+    WeightedAllocator, allocate_expenses, get_allocator
+)
+from ..allocation.allocators import ALLOCATORS, register
+from ..models import ServiceRule
+
+
+class AllocatorRegistryTest(SimpleTestCase):
+    """Pruebas del registro de repartidores por tipo de regla."""
+
+    def setUp(self):
+        self.context = AllocationContext(
+            [1, 2, 3],
+            occupant_days=[31, 62, 62],
+            areas=[Decimal('50.00'), Decimal('75.50'), None],
+            fixed_fees=[Decimal('30.00'), None, Decimal('12.50')],
+            consumption={'water': [Decimal('1.500'), Decimal('3.000'), None]},
+        )
+
+    def allocate(self, rule_type, amount='100.00', service_type='water', rounding=ROUND_PER_SHARE):
+        [shares] = get_allocator(rule_type).allocate(
+            [(service_type, Decimal(amount), rounding)], self.context
+        )
+        return shares
+
+    def test_every_rule_type_has_an_allocator(self):
+        """Todos los tipos de regla pasan por el mismo registro."""
+        for rule_type in ServiceRule.RuleType.values:
+            self.assertIsNotNone(get_allocator(rule_type), rule_type)
+
+    def test_equal_division(self):
+        self.assertEqual(self.allocate(ServiceRule.RuleType.EQUAL_DIVISION), [3333, 3333, 3333])
+
+    def test_occupant_proration(self):
+        self.assertEqual(self.allocate(ServiceRule.RuleType.OCCUPANT_PRORATION), [2000, 4000, 4000])
+
+    def test_proportional_area(self):
+        """Las unidades sin área no pagan."""
+        # 100.00 * 50.00 / 125.50 = 39.84; 100.00 * 75.50 / 125.50 = 60.16
+        self.assertEqual(self.allocate(ServiceRule.RuleType.PROPORTIONAL_AREA), [3984, 6016, 0])
+
+    def test_consumption_adjustment_uses_service_readings(self):
+        """Cada servicio usa sus propias lecturas; sin lecturas no se reparte."""
+        self.assertEqual(
+            self.allocate(ServiceRule.RuleType.CONSUMPTION_ADJUSTMENT, amount='90.00'),
+            [3000, 6000, 0]
+        )
+        self.assertEqual(
+            self.allocate(ServiceRule.RuleType.CONSUMPTION_ADJUSTMENT, service_type='gas'),
+            [0, 0, 0]
+        )
+
+    def test_fixed_fee_ignores_amount(self):
+        self.assertEqual(self.allocate(ServiceRule.RuleType.FIXED_FEE), [3000, 0, 1250])
+        self.assertEqual(self.allocate(ServiceRule.RuleType.FIXED_FEE, amount='5.00'), [3000, 0, 1250])
+
+    def test_rounding_mode_is_honoured(self):
+        self.assertEqual(
+            self.allocate(ServiceRule.RuleType.EQUAL_DIVISION, rounding=ROUND_LARGEST_REMAINDER),
+            [3334, 3333, 3333]
+        )
+
+    def test_allocate_expenses_mixed_rules(self):
+        """Un ciclo con reglas mixtas se reparte en una sola llamada y respeta el orden."""
+        expenses = [
+            (ServiceRule.RuleType.OCCUPANT_PRORATION, 'gas', Decimal('100.00'), ROUND_PER_SHARE),
+            (ServiceRule.RuleType.EQUAL_DIVISION, 'motor', Decimal('30.00'), ROUND_PER_SHARE),
+            ('unknown_rule', 'arbitrios', Decimal('10.00'), ROUND_PER_SHARE),
+            (ServiceRule.RuleType.OCCUPANT_PRORATION, 'water', Decimal('50.00'), ROUND_PER_SHARE),
+        ]
+        self.assertEqual(
+            allocate_expenses(expenses, self.context),
+            [[2000, 4000, 4000], [1000, 1000, 1000], None, [1000, 2000, 2000]]
+        )
+
+    def test_register_custom_allocator(self):
+        """Se pueden registrar nuevas estrategias con la misma interfaz."""
+        class FirstUnitAllocator(WeightedAllocator):
+            def weights(self, context, service_type):
+                return [1] + [0] * (len(context.unit_ids) - 1)
+
+        register('first_unit')(FirstUnitAllocator)
+        self.addCleanup(ALLOCATORS.pop, 'first_unit')
+
+        self.assertEqual(self.allocate('first_unit'), [10000, 0, 0])
@@ -13,31 +13,24 @@ class RuleLogicTest(TestCase):
     
     def test_calculate_occupant_proration(self):
         """Prueba la lógica de cálculo de prorrateo por ocupante."""
-        # Mock de unidades con ocupantes
-        units = [
-            {'occupants': 1},
-            {'occupants': 2},
-            {'occupants': 2},
-        ]
+        # Días-ocupante de un mes de 30 días: 1, 2 y 2 ocupantes todo el mes.
+        occupant_days = [30, 60, 60]
         total_amount = Decimal('100.00')
         
-        # Simular una lista de objetos simples para la prueba de lógica
-        class MockUnit:
-            def __init__(self, occupants):
-                self.tenant = None
-                if occupants > 0:
-                    class MockTenant:
-                        def __init__(self, occ):
-                            self.number_of_occupants = occ
-                    self.tenant = MockTenant(occupants)
-
-        mock_units = [MockUnit(u['occupants']) for u in units]
-        
-        result = calculate_occupant_proration(total_amount, mock_units)
+        result = calculate_occupant_proration(total_amount, occupant_days)
         
-        # Total Ocupantes = 5. Porción por ocupante = $20.
+        # Total = 150 días-ocupante. Porción por día-ocupante = $0.666...
         # Resultado esperado: [20.00, 40.00, 40.00]
         self.assertEqual(len(result), 3)
         self.assertEqual(result[0], Decimal('20.00'))
         self.assertEqual(result[1], Decimal('40.00'))
-        self.assertEqual(result[2], Decimal('40.00'))
\ No newline at end of file
+        self.assertEqual(result[2], Decimal('40.00'))
+
+    def test_calculate_occupant_proration_with_empty_units(self):
+        """Las unidades vacías no pagan y cada porción queda en la posición de su unidad."""
+        # Una unidad vacía todo el mes y otra ocupada la mitad del mes.
+        result = calculate_occupant_proration(Decimal('90.00'), [60, None, 30])
+        self.assertEqual(result, [Decimal('60.00'), Decimal('0.00'), Decimal('30.00')])
+
+        result = calculate_occupant_proration(Decimal('90.00'), [0, None])
+        self.assertEqual(result, [Decimal('0.00'), Decimal('0.00')])
\ No newline at end of file
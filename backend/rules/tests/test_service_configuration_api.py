@@ -185,6 +185,33 @@ class ServiceConfigurationAPITestCase(TestCase):
         # Verificar la nueva configuración
         self.assertCountEqual(response.data, new_config)
 
+    def test_put_guarda_modo_de_redondeo_opcional(self):
+        """
+        El modo de redondeo se acepta al escribir, no se expone en la respuesta
+        y toma el valor por defecto cuando se omite.
+        """
+        self.client.force_authenticate(user=self.user1)
+        new_config = [
+            {"service_type": "water", "rule_type": "equal_division", "rounding_mode": "largest_remainder"},
+            {"service_type": "gas", "rule_type": "equal_division"}
+        ]
+
+        response = self.client.put(self.url_property1, data=new_config, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(response.data, [
+            {"service_type": "water", "rule_type": "equal_division"},
+            {"service_type": "gas", "rule_type": "equal_division"}
+        ])
+        modes = dict(
+            ServiceRule.objects.filter(property=self.property1)
+            .values_list('service_type', 'rounding_mode')
+        )
+        self.assertEqual(modes, {
+            'water': ServiceRule.RoundingMode.LARGEST_REMAINDER,
+            'gas': ServiceRule.RoundingMode.PER_SHARE,
+        })
+
     def test_put_falla_si_unidades_no_cumplen_prerrequisito_de_ocupantes(self):
         """
         test_put_falla_si_unidades_no_cumplen_prerrequisito_de_ocupantes: 
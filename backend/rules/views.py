@@ -3,35 +3,43 @@ from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Count, Max
 from django.core.exceptions import ValidationError
 from django.http import Http404
 from properties.models import Property
+from properties.services.allocation_service import AllocationService
 from .models import Rule, ServiceRule
 from .serializers import RuleSerializer, ServiceRuleSerializer, ServiceRuleListSerializer
+from core.pagination import KeysetPagination
+from core.response_cache import CachedResponseMixin, ResponseCache
+from core.conditional import ConditionalGetMixin
+from core.ownership import OwnedObjectMixin
 
-class RuleListCreateAPIView(generics.ListCreateAPIView):
+class RuleListCreateAPIView(OwnedObjectMixin, generics.ListCreateAPIView):
     """
     Vista para listar y crear reglas para una propiedad específica.
     """
     serializer_class = RuleSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-pk')
+
+    def get_property(self):
+        """Obtiene la propiedad de la URL verificando que pertenece al usuario autenticado."""
+        # Seguridad: el usuario solo puede ver y crear reglas de sus propiedades (404 si no).
+        return self.get_owned_object(Property.objects.all(), pk=self.kwargs['property_pk'], user=self.request.user)
 
     def get_queryset(self):
         """Filtra las reglas para la propiedad especificada en la URL."""
-        property_pk = self.kwargs['property_pk']
-        # Seguridad: get_object_or_404 asegura que el usuario solo pueda ver reglas de sus propiedades.
-        prop = get_object_or_404(Property, pk=property_pk, user=self.request.user)
-        return Rule.objects.filter(property=prop)
+        return Rule.objects.filter(property=self.get_property())
 
     def create(self, request, *args, **kwargs):
         """Sobrescribe el método create para añadir validación de negocio personalizada."""
         rule_type = request.data.get('type')
         
         if rule_type == 'occupant_proration':
-            property_pk = self.kwargs['property_pk']
-            prop = get_object_or_404(Property, pk=property_pk, user=self.request.user)
+            prop = self.get_property()
             
             # Validar que todas las unidades tengan inquilino.
             units = prop.units.all()
@@ -45,12 +53,10 @@ class RuleListCreateAPIView(generics.ListCreateAPIView):
         
     def perform_create(self, serializer):
         """Asocia la nueva regla a la propiedad correcta, verificando la propiedad."""
-        property_pk = self.kwargs['property_pk']
-        prop = get_object_or_404(Property, pk=property_pk, user=self.request.user)
-        serializer.save(property=prop)
+        serializer.save(property=self.get_property())
 
 
-class ServiceConfigurationAPIView(APIView):
+class ServiceConfigurationAPIView(OwnedObjectMixin, ConditionalGetMixin, CachedResponseMixin, APIView):
     """
     Vista para gestionar la configuración completa de servicios de una propiedad.
     
@@ -59,13 +65,26 @@ class ServiceConfigurationAPIView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    def get_response_cache_scope(self):
+        return ('property', self.kwargs['property_id'])
+
+    def get_conditional_query(self):
+        """Las reglas de servicio de la propiedad."""
+        return (
+            Property.objects.filter(pk=self.kwargs['property_id'], user=self.request.user),
+            dict(
+                rule_count=Count('service_rules', distinct=True),
+                rules_updated_at=Max('service_rules__updated_at'),
+            ),
+        )
+
     def get_property(self, property_id):
         """
         Obtiene la propiedad verificando que pertenece al usuario autenticado.
         Retorna 404 si no existe o no pertenece al usuario.
         """
-        return get_object_or_404(
-            Property,
+        return self.get_owned_object(
+            Property.objects.all(),
             pk=property_id,
             user=self.request.user
         )
@@ -77,6 +96,12 @@ class ServiceConfigurationAPIView(APIView):
         Obtiene la configuración actual de servicios para la propiedad.
         Retorna un array de objetos con service_type y rule_type.
         """
+        return self.conditional_get(request, self.cached_get, self.get_configuration, property_id)
+
+    def get_configuration(self, request, property_id):
+        """
+        Lee la configuración de servicios de la base de datos.
+        """
         try:
             property_obj = self.get_property(property_id)
             
@@ -131,7 +156,10 @@ class ServiceConfigurationAPIView(APIView):
                 service_rule = ServiceRule(
                     property=property_obj,
                     service_type=rule_data['service_type'],
-                    rule_type=rule_data['rule_type']
+                    rule_type=rule_data['rule_type'],
+                    rounding_mode=rule_data.get(
+                        'rounding_mode', ServiceRule.RoundingMode.PER_SHARE
+                    )
                 )
                 # Validar cada regla individual (llamará a clean())
                 service_rule.full_clean()
@@ -140,6 +168,11 @@ class ServiceConfigurationAPIView(APIView):
             # 3. Guardar todas las nuevas reglas en batch
             ServiceRule.objects.bulk_create(new_service_rules)
 
+            # bulk_create no emite señales: recalcular el libro de asignaciones
+            # e invalidar las respuestas en caché de la propiedad.
+            AllocationService.recompute_property(property_obj.pk)
+            ResponseCache.bump_properties(property_obj.pk)
+
             # 4. Retornar la nueva configuración
             updated_service_rules = ServiceRule.objects.filter(property=property_obj)
             response_serializer = ServiceRuleSerializer(updated_service_rules, many=True)
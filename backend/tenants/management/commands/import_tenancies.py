@@ -0,0 +1,63 @@
+# backend/tenants/management/commands/import_tenancies.py
+import csv
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from tenants.services import TenancyImportService
+from tenants.services.tenancy_import_service import DEFAULT_BATCH_SIZE
+
+# Errores mostrados como máximo; el resto solo se cuenta.
+MAX_REPORTED_ERRORS = 50
+
+
+class Command(BaseCommand):
+    help = "Importa arrendamientos en masa desde un archivo CSV o JSON (JSON Lines o lista)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Ruta del archivo a importar.")
+        parser.add_argument(
+            '--format', choices=['csv', 'json'],
+            help="Formato del archivo; por defecto se deduce de la extensión."
+        )
+        parser.add_argument(
+            '--user',
+            help="Usuario propietario; si se indica, solo se aceptan unidades de sus propiedades."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help="Filas por lote."
+        )
+
+    def handle(self, *args, **options):
+        file_format = options['format']
+        if file_format is None:
+            extension = options['path'].rsplit('.', 1)[-1].lower()
+            file_format = 'csv' if extension == 'csv' else 'json'
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size debe ser mayor que cero.")
+
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"No existe el usuario '{options['user']}'.")
+
+        try:
+            with open(options['path'], 'rb') as stream:
+                result = TenancyImportService.import_rows(
+                    TenancyImportService.iter_rows(stream, file_format),
+                    user=user,
+                    batch_size=options['batch_size'],
+                )
+        except (OSError, ValueError, csv.Error) as e:
+            raise CommandError(f"No se pudo leer el archivo: {e}")
+
+        for error in result['errors'][:MAX_REPORTED_ERRORS]:
+            self.stderr.write(f"Fila {error['row']}: {error['errors']}")
+        if len(result['errors']) > MAX_REPORTED_ERRORS:
+            self.stderr.write(f"... y {len(result['errors']) - MAX_REPORTED_ERRORS} errores más.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['created']} arrendamientos y {result['tenants_created']} inquilinos creados "
+            f"de {result['rows']} filas ({len(result['errors'])} con errores)."
+        ))
@@ -0,0 +1,20 @@
+# backend/tenants/management/commands/refresh_occupancy.py
+from django.core.management.base import BaseCommand
+from tenants.services import OccupancyService
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye el calendario de ocupación y extiende los arrendamientos sin fin "
+        "hasta el horizonte. Conviene ejecutarlo una vez al mes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--unit', type=int, action='append', dest='unit_ids',
+            help="ID de unidad a reconstruir (puede repetirse). Por defecto, todas."
+        )
+
+    def handle(self, *args, **options):
+        count = OccupancyService.rebuild(options['unit_ids'])
+        self.stdout.write(self.style.SUCCESS(f"Calendario de ocupación reconstruido: {count} meses."))
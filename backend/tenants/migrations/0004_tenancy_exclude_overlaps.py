@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:20
+
+import django.contrib.postgres.constraints
+import tenants.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0007_cursor_pagination_indexes'),
+        ('tenants', '0003_tenancy'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='tenancy',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[(tenants.models.SingletonRange('unit'), '&&'), (tenants.models.TenancyPeriod('start_date', 'end_date'), '&&')], name='exclude_overlapping_tenancies'),
+        ),
+    ]
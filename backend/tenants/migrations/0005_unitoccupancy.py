@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0007_cursor_pagination_indexes'),
+        ('tenants', '0004_tenancy_exclude_overlaps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnitOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('occupant_days', models.PositiveIntegerField(default=0, help_text='Suma de ocupantes × días ocupados en el mes.')),
+                ('occupants_at_start', models.PositiveSmallIntegerField(default=0, help_text='Ocupantes el primer día del mes (0 si la unidad estaba vacía).')),
+                ('tenancy', models.ForeignKey(blank=True, help_text='El arrendamiento con más días en el mes.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='occupancy', to='tenants.tenancy')),
+                ('unit', models.ForeignKey(help_text='La unidad ocupada.', on_delete=django.db.models.deletion.CASCADE, related_name='occupancy', to='properties.unit')),
+            ],
+            options={
+                'verbose_name': 'Unit Occupancy',
+                'verbose_name_plural': 'Unit Occupancy',
+                'constraints': [models.UniqueConstraint(fields=('unit', 'year', 'month'), name='unique_unit_month_occupancy')],
+            },
+        ),
+    ]
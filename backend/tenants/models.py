@@ -1,8 +1,33 @@
 # backend/tenants/models.py
 from django.db import models
+from django.db.models import Func
 from django.core.validators import MinValueValidator
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import BigIntegerRangeField, DateRangeField, RangeOperators
 from properties.models import Unit
 
+
+class TenancyPeriod(Func):
+    """
+    Período de un arrendamiento como daterange cerrado [start_date, end_date].
+    Un end_date nulo deja el rango abierto (arrendamiento activo).
+    """
+    function = 'daterange'
+    template = "%(function)s(%(expressions)s, '[]')"
+    arity = 2
+    output_field = DateRangeField()
+
+
+class SingletonRange(Func):
+    """
+    Rango que contiene un único entero. Permite comparar claves por igualdad
+    dentro de un índice GiST sin depender de la extensión btree_gist.
+    """
+    function = 'int8range'
+    template = "%(function)s(%(expressions)s, %(expressions)s, '[]')"
+    arity = 1
+    output_field = BigIntegerRangeField()
+
 class Tenant(models.Model):
     """
     Representa a un inquilino asociado a una única unidad, incluyendo
@@ -67,6 +92,17 @@ class Tenancy(models.Model):
             models.Index(fields=['unit', 'start_date']),
             models.Index(fields=['unit', 'end_date']),
         ]
+        constraints = [
+            # Dos arrendamientos de la misma unidad no pueden superponerse; la base
+            # de datos lo garantiza incluso con peticiones concurrentes.
+            ExclusionConstraint(
+                name='exclude_overlapping_tenancies',
+                expressions=[
+                    (SingletonRange('unit'), RangeOperators.OVERLAPS),
+                    (TenancyPeriod('start_date', 'end_date'), RangeOperators.OVERLAPS),
+                ],
+            ),
+        ]
 
     def clean(self):
         """
@@ -84,4 +120,49 @@ class Tenancy(models.Model):
 
     def __str__(self):
         end_date_str = self.end_date.strftime('%Y-%m-%d') if self.end_date else 'Activo'
-        return f'{self.tenant.name} en {self.unit.name} ({self.start_date} - {end_date_str})'
\ No newline at end of file
+        return f'{self.tenant.name} en {self.unit.name} ({self.start_date} - {end_date_str})'
+
+class UnitOccupancy(models.Model):
+    """
+    Calendario de ocupación: cuánto estuvo ocupada una unidad en un mes.
+
+    Se deriva de los arrendamientos y se mantiene al día cada vez que uno se
+    crea, modifica o elimina. Solo hay filas para los meses con ocupación.
+    """
+    unit = models.ForeignKey(
+        Unit,
+        on_delete=models.CASCADE,
+        related_name='occupancy',
+        help_text="La unidad ocupada."
+    )
+    year = models.PositiveIntegerField()
+    month = models.PositiveSmallIntegerField()
+    occupant_days = models.PositiveIntegerField(
+        default=0,
+        help_text="Suma de ocupantes × días ocupados en el mes."
+    )
+    occupants_at_start = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Ocupantes el primer día del mes (0 si la unidad estaba vacía)."
+    )
+    tenancy = models.ForeignKey(
+        Tenancy,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='occupancy',
+        help_text="El arrendamiento con más días en el mes."
+    )
+
+    class Meta:
+        verbose_name = "Unit Occupancy"
+        verbose_name_plural = "Unit Occupancy"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['unit', 'year', 'month'],
+                name='unique_unit_month_occupancy'
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.unit_id} {self.month}/{self.year}: {self.occupant_days} días-ocupante'
@@ -75,6 +75,50 @@ class TenancyUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class TenancyImportRowSerializer(serializers.Serializer):
+    """
+    Serializer de cada fila de una importación masiva de arrendamientos.
+    """
+    unit = serializers.IntegerField()
+    tenant_email = serializers.EmailField()
+    tenant_name = serializers.CharField(max_length=255, required=False)
+    number_of_occupants = serializers.IntegerField(min_value=1, max_value=32767)
+    start_date = serializers.DateField()
+    end_date = serializers.DateField(required=False, allow_null=True)
+    
+    def validate(self, attrs):
+        from .services import TenancyValidationService
+        
+        TenancyValidationService.validate_dates(attrs['start_date'], attrs.get('end_date'))
+        return attrs
+
+
+class TenancyImportSerializer(serializers.Serializer):
+    """
+    Serializer del archivo de una importación masiva de arrendamientos.
+    """
+    FORMAT_CHOICES = ['csv', 'json']
+    
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=FORMAT_CHOICES, required=False)
+    
+    def validate(self, attrs):
+        """
+        Deduce el formato de la extensión del archivo si no se indica.
+        """
+        if 'format' not in attrs:
+            extension = attrs['file'].name.rsplit('.', 1)[-1].lower()
+            if extension in ('json', 'jsonl', 'ndjson'):
+                attrs['format'] = 'json'
+            elif extension == 'csv':
+                attrs['format'] = 'csv'
+            else:
+                raise serializers.ValidationError(
+                    {"format": "Indica el formato (csv o json) o usa la extensión del archivo."}
+                )
+        return attrs
+
+
 class TenancyEndSerializer(serializers.Serializer):
     """
     Serializer específico para finalizar un arrendamiento.
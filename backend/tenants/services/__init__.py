@@ -2,5 +2,7 @@
 
 from .tenancy_service import TenancyService
 from .tenancy_validation_service import TenancyValidationService
+from .occupancy_service import OccupancyService
+from .tenancy_import_service import TenancyImportService
 
-__all__ = ['TenancyService', 'TenancyValidationService']
\ No newline at end of file
+__all__ = ['TenancyService', 'TenancyValidationService', 'OccupancyService', 'TenancyImportService']
\ No newline at end of file
@@ -0,0 +1,189 @@
+# backend/tenants/services/occupancy_service.py
+
+from calendar import monthrange
+from datetime import date
+from django.db import transaction
+from django.db.models import Exists, Max, Min, OuterRef, Q, Subquery
+from django.utils import timezone
+from .tenancy_service import TenancyService
+
+# Meses por delante del actual que se materializan para arrendamientos sin fin.
+# El comando refresh_occupancy desplaza este horizonte cada mes.
+OCCUPANCY_HORIZON_MONTHS = 12
+
+
+def _month_index(year, month):
+    return year * 12 + month - 1
+
+
+def _month_bounds(index):
+    year, month = divmod(index, 12)
+    month += 1
+    return date(year, month, 1), date(year, month, monthrange(year, month)[1])
+
+
+class OccupancyService:
+    """
+    Servicio que mantiene el calendario de ocupación (UnitOccupancy).
+    """
+
+    @staticmethod
+    def horizon_index(today=None):
+        today = today or timezone.now().date()
+        return _month_index(today.year, today.month) + OCCUPANCY_HORIZON_MONTHS
+
+    @staticmethod
+    def refresh_unit(unit_id, start_date, end_date=None):
+        """
+        Recalcula el calendario de una unidad para los meses entre start_date y
+        end_date (sin fin, hasta el horizonte).
+
+        Returns:
+            int: Número de filas escritas.
+        """
+        return OccupancyService.refresh_units([unit_id], start_date, end_date)
+
+    @staticmethod
+    @transaction.atomic
+    def refresh_units(unit_ids, start_date, end_date=None):
+        """
+        Recalcula el calendario de varias unidades para los meses entre
+        start_date y end_date con un borrado, una consulta y un bulk_create.
+
+        Returns:
+            int: Número de filas escritas.
+        """
+        from ..models import Tenancy, UnitOccupancy
+
+        first = _month_index(start_date.year, start_date.month)
+        if end_date is None:
+            last = max(first, OccupancyService.horizon_index())
+        else:
+            last = _month_index(end_date.year, end_date.month)
+        first_day, _ = _month_bounds(first)
+        _, last_day = _month_bounds(last)
+
+        UnitOccupancy.objects.filter(unit_id__in=unit_ids).filter(
+            Q(year__gt=first_day.year) | Q(year=first_day.year, month__gte=first_day.month)
+        ).filter(
+            Q(year__lt=last_day.year) | Q(year=last_day.year, month__lte=last_day.month)
+        ).delete()
+
+        tenancies_by_unit = {unit_id: [] for unit_id in unit_ids}
+        for unit_id, *tenancy in Tenancy.objects.filter(
+            unit_id__in=unit_ids, start_date__lte=last_day
+        ).filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=first_day)
+        ).values_list('unit_id', 'pk', 'start_date', 'end_date', 'number_of_occupants'):
+            tenancies_by_unit[unit_id].append(tenancy)
+
+        rows = []
+        for unit_id, tenancies in tenancies_by_unit.items():
+            if not tenancies:
+                continue
+            for index in range(first, last + 1):
+                month_start, month_end = _month_bounds(index)
+                row = OccupancyService.build_month(unit_id, tenancies, month_start, month_end)
+                if row is not None:
+                    rows.append(row)
+        UnitOccupancy.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    @staticmethod
+    def build_month(unit_id, tenancies, month_start, month_end):
+        """
+        Construye la fila de un mes a partir de los arrendamientos de la unidad
+        (tuplas id, inicio, fin, ocupantes), o None si el mes quedó vacío.
+        """
+        from ..models import UnitOccupancy
+
+        occupant_days = 0
+        occupants_at_start = 0
+        main_tenancy = None
+        for tenancy_id, start_date, end_date, number_of_occupants in tenancies:
+            start = max(start_date, month_start)
+            end = min(end_date or month_end, month_end)
+            if end < start:
+                continue
+            days = (end - start).days + 1
+            occupant_days += days * number_of_occupants
+            if start == month_start:
+                occupants_at_start = number_of_occupants
+            # Ante empate de días, el arrendamiento más reciente.
+            if main_tenancy is None or (days, start_date) > main_tenancy[:2]:
+                main_tenancy = (days, start_date, tenancy_id)
+
+        if main_tenancy is None:
+            return None
+        return UnitOccupancy(
+            unit_id=unit_id,
+            year=month_start.year,
+            month=month_start.month,
+            occupant_days=occupant_days,
+            occupants_at_start=occupants_at_start,
+            tenancy_id=main_tenancy[2],
+        )
+
+    @staticmethod
+    def rebuild(unit_ids=None):
+        """
+        Reconstruye el calendario completo de las unidades indicadas (o de todas)
+        y extiende los arrendamientos sin fin hasta el horizonte actual.
+
+        Returns:
+            int: Número de filas escritas.
+        """
+        from ..models import Tenancy
+
+        tenancies = Tenancy.objects.all()
+        if unit_ids is not None:
+            tenancies = tenancies.filter(unit_id__in=unit_ids)
+
+        _, horizon_end = _month_bounds(OccupancyService.horizon_index())
+        periods = tenancies.order_by('unit_id').values('unit_id').annotate(
+            first_start=Min('start_date'), last_end=Max('end_date')
+        ).values_list('unit_id', 'first_start', 'last_end')
+
+        count = 0
+        for unit_id, first_start, last_end in periods:
+            # Llega al horizonte por si algún arrendamiento no tiene fin.
+            end_date = max(last_end, horizon_end) if last_end else None
+            count += OccupancyService.refresh_unit(unit_id, first_start, end_date)
+        return count
+
+    @staticmethod
+    def get_occupant_days(property_ids, year, month):
+        """
+        Obtiene los días-ocupante de cada unidad en un mes desde el calendario.
+
+        Los arrendamientos sin fin solo están materializados hasta el horizonte
+        de la última actualización: los meses posteriores (ciclos abiertos por
+        adelantado, o si refresh_occupancy deja de ejecutarse) no tienen fila.
+        Si alguna unidad con un arrendamiento sin fin que empezó antes de que
+        acabara el mes no tiene fila, el mes se calcula desde los arrendamientos
+        (TenancyService.get_occupant_days).
+
+        Returns:
+            dict: {unit_id: días-ocupante}; las unidades vacías no aparecen.
+        """
+        from properties.models import Unit
+        from ..models import Tenancy, UnitOccupancy
+
+        _, last_day = _month_bounds(_month_index(year, month))
+        units = Unit.objects.filter(property_id__in=property_ids).annotate(
+            occupant_days=Subquery(
+                UnitOccupancy.objects.filter(
+                    unit_id=OuterRef('pk'), year=year, month=month
+                ).values('occupant_days')
+            ),
+            open_tenancy=Exists(
+                Tenancy.objects.filter(unit_id=OuterRef('pk'), end_date__isnull=True, start_date__lte=last_day)
+            ),
+        ).filter(
+            Q(occupant_days__isnull=False) | Q(open_tenancy=True)
+        ).values_list('pk', 'occupant_days')
+
+        occupant_days = dict(units)
+        if None in occupant_days.values():
+            return TenancyService.get_occupant_days(property_ids, year, month)
+        return occupant_days
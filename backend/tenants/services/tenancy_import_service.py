@@ -0,0 +1,341 @@
+# backend/tenants/services/tenancy_import_service.py
+
+import csv
+import io
+import json
+from itertools import chain, islice
+from django.db import IntegrityError, transaction
+from core.response_cache import ResponseCache
+from .tenancy_validation_service import TenancyValidationService
+from .occupancy_service import OccupancyService, _month_bounds
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Columnas reconocidas en cada fila del archivo.
+IMPORT_FIELDS = (
+    'unit', 'tenant_email', 'tenant_name', 'number_of_occupants', 'start_date', 'end_date'
+)
+
+
+def _clean_row(row):
+    """Descarta columnas desconocidas y valores vacíos (celdas CSV en blanco)."""
+    return {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in row.items()
+        if key in IMPORT_FIELDS and value not in ('', None)
+    }
+
+
+class TenancyImportService:
+    """
+    Servicio de importación masiva de arrendamientos desde CSV o JSON.
+
+    Las filas se leen de forma incremental y se procesan por lotes: cada lote
+    resuelve sus unidades, inquilinos y arrendamientos existentes con una
+    consulta por tipo, valida las superposiciones en memoria y escribe con
+    bulk_create. bulk_create no emite señales, así que al terminar se
+    actualizan explícitamente el calendario de ocupación y las asignaciones.
+    """
+
+    @staticmethod
+    def iter_rows(stream, file_format):
+        """
+        Recorre las filas de un archivo binario sin cargarlo entero en memoria.
+
+        Args:
+            file_format: 'csv' (con cabecera) o 'json'. En JSON se acepta un
+                objeto por línea (JSON Lines) o, para archivos pequeños, una lista.
+
+        Yields:
+            dict: Cada fila, ya limpia.
+        """
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        if file_format == 'csv':
+            for row in csv.DictReader(text):
+                yield _clean_row(row)
+            return
+
+        first_line = text.readline()
+        if first_line.lstrip().startswith('['):
+            rows = json.loads(first_line + text.read())
+            if not isinstance(rows, list):
+                raise ValueError("El JSON debe ser una lista de filas.")
+        else:
+            rows = (json.loads(line) for line in chain([first_line], text) if line.strip())
+
+        for row in rows:
+            # Las filas que no son objetos las rechaza el serializer de la fila.
+            yield _clean_row(row) if isinstance(row, dict) else row
+
+    @staticmethod
+    def import_rows(rows, user=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Importa arrendamientos a partir de un iterable de filas.
+
+        Args:
+            rows: Iterable de dicts con las columnas de IMPORT_FIELDS.
+            user: Si se indica, solo se aceptan unidades de sus propiedades.
+            batch_size: Filas por lote.
+
+        Returns:
+            dict: Filas leídas, arrendamientos e inquilinos creados y errores
+                por fila ({'row': número de fila empezando en 1, 'errors': ...}).
+
+        Raises:
+            ValueError, csv.Error: Si el archivo deja de poder leerse. Los lotes
+                anteriores quedan guardados y con sus datos derivados al día.
+        """
+        importer = _TenancyImport(user)
+        rows = iter(rows)
+        row_number = 0
+        try:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                importer.import_batch(batch, first_row=row_number + 1)
+                row_number += len(batch)
+        finally:
+            importer.refresh_derived()
+
+        return {
+            'rows': row_number,
+            'created': importer.created,
+            'tenants_created': importer.tenants_created,
+            'errors': importer.errors,
+        }
+
+
+class _TenancyImport:
+    """
+    Estado de una importación: lo ya cargado de la base de datos se conserva
+    entre lotes para no volver a consultarlo.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.units = {}            # unit_id -> property_id (None si no existe o es ajena)
+        self.periods = {}          # unit_id -> [(inicio, fin, nombre del inquilino)]
+        self.tenants = {}          # email -> Tenant
+        self.free_units = {}       # property_id -> [unit_id sin inquilino]
+        self.touched = {}          # unit_id -> (inicio, fin) importados
+        self.created = 0
+        self.tenants_created = 0
+        self.errors = []
+
+    def import_batch(self, batch, first_row):
+        from ..serializers import TenancyImportRowSerializer
+
+        valid = []
+        for row_number, row in enumerate(batch, start=first_row):
+            serializer = TenancyImportRowSerializer(data=row)
+            if serializer.is_valid():
+                valid.append((row_number, serializer.validated_data))
+            else:
+                self.errors.append({'row': row_number, 'errors': serializer.errors})
+
+        self.load_units({data['unit'] for _, data in valid})
+        valid = [
+            (row_number, data) for row_number, data in valid
+            if self.check_unit(row_number, data['unit'])
+        ]
+        unit_ids = {data['unit'] for _, data in valid}
+        self.load_periods(unit_ids)
+        self.load_tenants({data['tenant_email'] for _, data in valid})
+        self.load_free_units({self.units[unit_id] for unit_id in unit_ids})
+
+        from ..models import Tenant, Tenancy
+
+        accepted = []
+        row_numbers = []
+        new_tenants = {}
+        for row_number, data in valid:
+            if not self.check_overlap(row_number, data):
+                continue
+            tenant = self.resolve_tenant(row_number, data, new_tenants)
+            if tenant is None:
+                continue
+            self.periods[data['unit']].append((data['start_date'], data.get('end_date'), tenant.name))
+            row_numbers.append(row_number)
+            accepted.append(Tenancy(
+                unit_id=data['unit'],
+                tenant=tenant,
+                number_of_occupants=data['number_of_occupants'],
+                start_date=data['start_date'],
+                end_date=data.get('end_date'),
+            ))
+
+        try:
+            with transaction.atomic():
+                Tenant.objects.bulk_create(new_tenants.values())
+                Tenancy.objects.bulk_create(accepted)
+        except IntegrityError:
+            # Otra petición escribió en paralelo; ninguna fila del lote se guardó.
+            self.forget_batch(accepted, new_tenants)
+            for row_number in row_numbers:
+                self.errors.append({
+                    'row': row_number,
+                    'errors': {'non_field_errors': [
+                        "El lote no pudo guardarse por un cambio concurrente; vuelve a importar esta fila."
+                    ]},
+                })
+            return
+
+        self.created += len(accepted)
+        self.tenants_created += len(new_tenants)
+        for tenancy in accepted:
+            start, end = self.touched.get(tenancy.unit_id, (tenancy.start_date, tenancy.end_date))
+            start = min(start, tenancy.start_date)
+            end = None if end is None or tenancy.end_date is None else max(end, tenancy.end_date)
+            self.touched[tenancy.unit_id] = (start, end)
+
+    def load_units(self, unit_ids):
+        from properties.models import Unit
+
+        missing = unit_ids - self.units.keys()
+        if not missing:
+            return
+        units = Unit.objects.filter(pk__in=missing)
+        if self.user is not None:
+            units = units.filter(property__user=self.user)
+        self.units.update(dict.fromkeys(missing))
+        self.units.update(units.values_list('pk', 'property_id'))
+
+    def check_unit(self, row_number, unit_id):
+        if self.units[unit_id] is None:
+            self.errors.append({'row': row_number, 'errors': {'unit': ["Unidad no encontrada."]}})
+            return False
+        return True
+
+    def load_periods(self, unit_ids):
+        from ..models import Tenancy
+
+        missing = unit_ids - self.periods.keys()
+        if not missing:
+            return
+        for unit_id in missing:
+            self.periods[unit_id] = []
+        for unit_id, start_date, end_date, tenant_name in Tenancy.objects.filter(
+            unit_id__in=missing
+        ).values_list('unit_id', 'start_date', 'end_date', 'tenant__name'):
+            self.periods[unit_id].append((start_date, end_date, tenant_name))
+
+    def load_tenants(self, emails):
+        from ..models import Tenant
+
+        missing = emails - self.tenants.keys()
+        if missing:
+            self.tenants.update(
+                (tenant.email, tenant) for tenant in Tenant.objects.filter(email__in=missing)
+            )
+
+    def load_free_units(self, property_ids):
+        from properties.models import Unit
+
+        missing = property_ids - self.free_units.keys()
+        if not missing:
+            return
+        for property_id in missing:
+            self.free_units[property_id] = []
+        for unit_id, property_id in Unit.objects.filter(
+            property_id__in=missing, tenant__isnull=True
+        ).order_by('pk').values_list('pk', 'property_id'):
+            self.free_units[property_id].append(unit_id)
+
+    def resolve_tenant(self, row_number, data, new_tenants):
+        """
+        Devuelve el inquilino de la fila por su correo. Si no existe se crea,
+        como en el alta individual, sobre una unidad libre de la propiedad
+        (preferiblemente la del arrendamiento).
+        """
+        from ..models import Tenant
+
+        email = data['tenant_email']
+        tenant = self.tenants.get(email)
+        if tenant is not None:
+            return tenant
+
+        if not data.get('tenant_name'):
+            self.errors.append({'row': row_number, 'errors': {
+                'tenant_name': ["Es obligatorio para inquilinos nuevos."]
+            }})
+            return None
+
+        free_units = self.free_units[self.units[data['unit']]]
+        if not free_units:
+            self.errors.append({'row': row_number, 'errors': {
+                'tenant_email': ["No hay unidades libres en la propiedad para registrar al inquilino."]
+            }})
+            return None
+        unit_id = data['unit'] if data['unit'] in free_units else free_units[0]
+        free_units.remove(unit_id)
+
+        tenant = Tenant(
+            name=data['tenant_name'],
+            email=email,
+            number_of_occupants=data['number_of_occupants'],
+            unit_id=unit_id,
+        )
+        self.tenants[email] = new_tenants[email] = tenant
+        return tenant
+
+    def check_overlap(self, row_number, data):
+        """Valida la fila contra los arrendamientos de la unidad ya conocidos."""
+        start_date, end_date = data['start_date'], data.get('end_date')
+        for other_start, other_end, other_tenant in self.periods[data['unit']]:
+            if TenancyValidationService._periods_overlap(start_date, end_date, other_start, other_end):
+                self.errors.append({'row': row_number, 'errors': {'non_field_errors': [
+                    f"Este arrendamiento se superpone con un arrendamiento existente "
+                    f"({other_tenant}: {other_start} - {other_end or 'Activo'})."
+                ]}})
+                return False
+        return True
+
+    def forget_batch(self, accepted, new_tenants):
+        """Deshace en memoria lo que el lote fallido había reservado."""
+        for tenancy in accepted:
+            self.periods.pop(tenancy.unit_id, None)
+        for email, tenant in new_tenants.items():
+            self.tenants.pop(email, None)
+            self.free_units.pop(self.units[tenant.unit_id], None)
+
+    def refresh_derived(self):
+        """
+        Actualiza el calendario de ocupación y las asignaciones por ocupantes
+        de los meses importados, como harían las señales de Tenancy.
+        """
+        from properties.services.allocation_service import AllocationService
+        from rules.models import ServiceRule
+
+        if not self.touched:
+            return
+
+        start_date = min(start for start, _ in self.touched.values())
+        ends = [end for _, end in self.touched.values() if end is not None]
+        end_date = max(ends) if ends else None
+        if len(ends) < len(self.touched):
+            # Hay arrendamientos sin fin: como mínimo hasta el horizonte.
+            _, horizon_end = _month_bounds(OccupancyService.horizon_index())
+            end_date = None if end_date is None or end_date <= horizon_end else end_date
+        OccupancyService.refresh_units(list(self.touched), start_date, end_date)
+
+        by_property = {}
+        for unit_id, (start, end) in self.touched.items():
+            property_id = self.units[unit_id]
+            if property_id in by_property:
+                previous_start, previous_end = by_property[property_id]
+                start = min(start, previous_start)
+                end = None if end is None or previous_end is None else max(end, previous_end)
+            by_property[property_id] = (start, end)
+
+        # Los inquilinos nuevos cambian el detalle de sus propiedades.
+        ResponseCache.bump_properties(*by_property)
+
+        for property_id, (start, end) in by_property.items():
+            service_types = AllocationService.service_types_for_rules(
+                property_id, [ServiceRule.RuleType.OCCUPANT_PRORATION]
+            )
+            if service_types:
+                AllocationService.recompute_property(
+                    property_id, service_types=service_types, start_date=start, end_date=end
+                )
@@ -1,6 +1,10 @@
 # backend/tenants/services/tenancy_service.py
 
+from calendar import monthrange
+from datetime import date
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils import timezone
 from typing import Optional
 from .tenancy_validation_service import TenancyValidationService
@@ -65,24 +69,38 @@ class TenancyService:
         )
         
         if overlapping:
-            overlapping_desc = overlapping[0]
-            raise ValidationError(
-                f"Este arrendamiento se superpone con un arrendamiento existente "
-                f"({overlapping_desc.tenant.name}: {overlapping_desc.start_date} - "
-                f"{overlapping_desc.end_date or 'Activo'})."
-            )
+            TenancyService._raise_overlap(overlapping[0])
         
         # Crear el arrendamiento
-        tenancy = Tenancy.objects.create(
-            unit=unit,
-            tenant=tenant,
-            start_date=start_date,
-            end_date=end_date,
-            number_of_occupants=number_of_occupants
-        )
+        try:
+            with transaction.atomic():
+                tenancy = Tenancy.objects.create(
+                    unit=unit,
+                    tenant=tenant,
+                    start_date=start_date,
+                    end_date=end_date,
+                    number_of_occupants=number_of_occupants
+                )
+        except IntegrityError:
+            # Otra petición creó un arrendamiento superpuesto después de la
+            # verificación; la restricción de exclusión lo rechazó.
+            overlapping = TenancyValidationService.check_overlapping_tenancies(
+                unit, start_date, end_date
+            )
+            if not overlapping:
+                raise
+            TenancyService._raise_overlap(overlapping[0])
         
         return tenancy
     
+    @staticmethod
+    def _raise_overlap(overlapping_desc):
+        raise ValidationError(
+            f"Este arrendamiento se superpone con un arrendamiento existente "
+            f"({overlapping_desc.tenant.name}: {overlapping_desc.start_date} - "
+            f"{overlapping_desc.end_date or 'Activo'})."
+        )
+    
     @staticmethod
     def end_tenancy(tenancy, end_date):
         """
@@ -94,11 +112,54 @@ class TenancyService:
         # Validar contra arrendamientos futuros
         TenancyValidationService.validate_end_date_against_future_tenancies(tenancy, end_date)
         
+        previous_end_date = tenancy.end_date
         tenancy.end_date = end_date
-        tenancy.save()
+        try:
+            with transaction.atomic():
+                tenancy.save()
+        except IntegrityError:
+            # Un arrendamiento posterior se creó de forma concurrente.
+            tenancy.end_date = previous_end_date
+            TenancyValidationService.validate_end_date_against_future_tenancies(tenancy, end_date)
+            raise
         
         return tenancy
     
+    @staticmethod
+    def get_occupant_days(property_ids, year, month):
+        """
+        Calcula los días-ocupante de cada unidad en un mes a partir del historial
+        de arrendamientos (ocupantes × días cubiertos, fechas inclusivas).
+        
+        Usa una sola consulta por rango para todas las propiedades indicadas,
+        en lugar de consultar el arrendamiento vigente unidad por unidad.
+        OccupancyService.get_occupant_days la usa para los meses que el
+        calendario de ocupación no cubre.
+        
+        Returns:
+            dict: {unit_id: días-ocupante}; las unidades sin arrendamiento no aparecen.
+        """
+        from ..models import Tenancy
+        
+        first_day = date(year, month, 1)
+        last_day = date(year, month, monthrange(year, month)[1])
+        
+        tenancies = Tenancy.objects.filter(
+            unit__property_id__in=property_ids,
+            start_date__lte=last_day
+        ).filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=first_day)
+        ).values_list('unit_id', 'start_date', 'end_date', 'number_of_occupants')
+        
+        occupant_days = {}
+        for unit_id, start_date, end_date, number_of_occupants in tenancies:
+            start = max(start_date, first_day)
+            end = min(end_date or last_day, last_day)
+            days = (end - start).days + 1
+            occupant_days[unit_id] = occupant_days.get(unit_id, 0) + days * number_of_occupants
+        
+        return occupant_days
+    
     @staticmethod
     def get_tenancy_history(unit):
         """
@@ -1,6 +1,7 @@
 # backend/tenants/services/tenancy_validation_service.py
 
 from django.core.exceptions import ValidationError
+from django.db.backends.postgresql.psycopg_any import DateRange
 from typing import List
 
 
@@ -22,26 +23,27 @@ class TenancyValidationService:
         """
         Verifica si un período de arrendamiento se superpone con arrendamientos existentes.
         
+        La comparación se hace en PostgreSQL con una sola consulta sobre el
+        daterange de cada arrendamiento (la misma expresión que usa la
+        restricción exclude_overlapping_tenancies).
+        
         Returns:
             List[Tenancy]: Lista de arrendamientos que se superponen
         """
-        from ..models import Tenancy
+        from ..models import Tenancy, TenancyPeriod
         
         existing_tenancies = Tenancy.objects.filter(unit=unit)
         
         if exclude_tenancy_id:
             existing_tenancies = existing_tenancies.exclude(pk=exclude_tenancy_id)
         
-        overlapping = []
-        
-        for existing in existing_tenancies:
-            if TenancyValidationService._periods_overlap(
-                start_date, end_date, 
-                existing.start_date, existing.end_date
-            ):
-                overlapping.append(existing)
-        
-        return overlapping
+        return list(
+            existing_tenancies
+            .annotate(period=TenancyPeriod('start_date', 'end_date'))
+            .filter(period__overlap=DateRange(start_date, end_date, '[]'))
+            .select_related('tenant')
+            .order_by('start_date')
+        )
     
     @staticmethod
     def _periods_overlap(start1, end1, start2, end2):
@@ -66,14 +68,15 @@ class TenancyValidationService:
         """
         from ..models import Tenancy
         
-        future_tenancies = Tenancy.objects.filter(
-            unit=tenancy.unit,
-            start_date__gt=tenancy.start_date
-        ).exclude(pk=tenancy.pk)
+        # Basta con un arrendamiento posterior que empiece antes del nuevo fin.
+        future = Tenancy.objects.filter(
+            unit_id=tenancy.unit_id,
+            start_date__gt=tenancy.start_date,
+            start_date__lte=end_date
+        ).exclude(pk=tenancy.pk).order_by('-start_date').first()
         
-        for future in future_tenancies:
-            if future.start_date <= end_date:
-                raise ValidationError(
-                    f"No se puede finalizar el arrendamiento en {end_date} porque hay "
-                    f"un arrendamiento posterior que inicia el {future.start_date}."
-                )
\ No newline at end of file
+        if future is not None:
+            raise ValidationError(
+                f"No se puede finalizar el arrendamiento en {end_date} porque hay "
+                f"un arrendamiento posterior que inicia el {future.start_date}."
+            )
\ No newline at end of file
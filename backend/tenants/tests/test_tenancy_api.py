@@ -3,6 +3,8 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
 from datetime import date, timedelta
@@ -252,12 +254,12 @@ class TenancyAPITestCase(TestCase):
         
         # Verificar respuesta exitosa
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIsInstance(response.data, list)
-        self.assertEqual(len(response.data), 2)
+        self.assertIsInstance(response.data['results'], list)
+        self.assertEqual(len(response.data['results']), 2)
         
         # Verificar orden (más reciente primero)
-        self.assertEqual(response.data[0]['id'], tenancy2.id)
-        self.assertEqual(response.data[1]['id'], tenancy1.id)
+        self.assertEqual(response.data['results'][0]['id'], tenancy2.id)
+        self.assertEqual(response.data['results'][1]['id'], tenancy1.id)
 
     def test_list_tenancies_empty_unit(self):
         """
@@ -269,7 +271,7 @@ class TenancyAPITestCase(TestCase):
         
         # Verificar respuesta exitosa con lista vacía
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data['results'], [])
 
     def test_list_tenancies_unauthorized_unit_returns_404(self):
         """
@@ -406,6 +408,30 @@ class TenancyAPITestCase(TestCase):
         self.assertEqual(tenancy.end_date, self.today)
         self.assertFalse(tenancy.is_active)
 
+    def test_end_tenancy_resolves_tenancy_once(self):
+        """
+        El arrendamiento se busca una sola vez aunque lo usen el contexto del
+        serializador y la finalización.
+        """
+        self.authenticate_user1()
+        tenancy = Tenancy.objects.create(
+            unit=self.unit1,
+            tenant=self.tenant1,
+            number_of_occupants=2,
+            start_date=self.yesterday
+        )
+        url_end = reverse('tenancy-end', kwargs={'pk': tenancy.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(url_end, data={"end_date": self.today.isoformat()}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lookups = [
+            query['sql'] for query in queries.captured_queries
+            if 'FROM "tenants_tenancy"' in query['sql'] and '"properties_property"."user_id"' in query['sql']
+        ]
+        self.assertEqual(len(lookups), 1)
+
     def test_end_tenancy_already_ended_returns_409(self):
         """
         Prueba que finalizar un arrendamiento ya finalizado retorna 409.
@@ -0,0 +1,185 @@
+# backend/tenants/tests/test_tenancy_import.py
+
+import json
+from datetime import date
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework import status
+from properties.models import Property, Unit, BillingCycle, Expense, ExpenseAllocation
+from rules.models import ServiceRule
+from tenants.models import Tenant, Tenancy, UnitOccupancy
+from tenants.services import TenancyImportService
+
+
+class TenancyImportTestCase(TestCase):
+    """
+    Pruebas de la importación masiva de arrendamientos.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='propietario',
+            email='propietario@test.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otro',
+            email='otro@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.foreign_property = Property.objects.create(
+            name="Edificio Ajeno",
+            address="Calle Ajena 456",
+            user=self.other_user
+        )
+        self.units = [
+            Unit.objects.create(name=f"Apto {number}", property=self.property)
+            for number in (101, 102, 103)
+        ]
+        self.foreign_unit = Unit.objects.create(name="Apto 1", property=self.foreign_property)
+        self.tenant = Tenant.objects.create(
+            name="Juan Pérez",
+            email="juan@test.com",
+            number_of_occupants=2,
+            unit=self.units[0]
+        )
+        Tenancy.objects.create(
+            unit=self.units[0],
+            tenant=self.tenant,
+            number_of_occupants=2,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31)
+        )
+        self.url = reverse('tenancy-import')
+        self.client.force_authenticate(user=self.user)
+
+    def upload(self, name, content, **extra):
+        return self.client.post(
+            self.url,
+            {'file': SimpleUploadedFile(name, content.encode()), **extra},
+            format='multipart'
+        )
+
+    def test_csv_import_creates_tenancies_and_reports_row_errors(self):
+        """Las filas válidas se guardan y los errores se informan por número de fila."""
+        content = (
+            "unit,tenant_email,tenant_name,number_of_occupants,start_date,end_date\n"
+            f"{self.units[0].pk},juan@test.com,,2,2024-01-01,\n"
+            f"{self.units[1].pk},ana@test.com,Ana Gómez,3,2024-02-01,2024-06-30\n"
+            f"{self.units[0].pk},juan@test.com,,2,2023-06-01,2023-08-31\n"
+            f"{self.units[1].pk},luis@test.com,Luis Ruiz,1,2024-06-15,\n"
+            f"{self.foreign_unit.pk},juan@test.com,,1,2024-01-01,\n"
+            f"{self.units[2].pk},nuevo@test.com,,1,2024-01-01,\n"
+            f"{self.units[2].pk},juan@test.com,,1,2024-05-01,2024-04-01\n"
+        )
+
+        response = self.upload('arrendamientos.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['rows'], 7)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['tenants_created'], 1)
+        self.assertEqual(
+            {error['row']: list(error['errors']) for error in response.data['errors']},
+            {
+                3: ['non_field_errors'],   # Superpone un arrendamiento existente.
+                4: ['non_field_errors'],   # Superpone una fila anterior del archivo.
+                5: ['unit'],               # Unidad de otro usuario.
+                6: ['tenant_name'],        # Inquilino nuevo sin nombre.
+                7: ['non_field_errors'],   # Fin anterior al inicio.
+            }
+        )
+        ana = Tenant.objects.get(email='ana@test.com')
+        # El inquilino nuevo ocupa la unidad del arrendamiento si está libre.
+        self.assertEqual(ana.unit_id, self.units[1].pk)
+        self.assertEqual(
+            list(Tenancy.objects.filter(unit=self.units[1]).values_list('tenant__email', 'end_date')),
+            [('ana@test.com', date(2024, 6, 30))]
+        )
+        self.assertTrue(Tenancy.objects.filter(
+            unit=self.units[0], tenant=self.tenant, start_date=date(2024, 1, 1)
+        ).exists())
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """Cada lote usa un número fijo de consultas, sin importar cuántas filas tenga."""
+        def rows(count):
+            return [
+                {
+                    'unit': self.units[index % 3].pk,
+                    'tenant_email': f"inquilino{index % 2}@test.com",
+                    'tenant_name': f"Inquilino {index % 2}",
+                    'number_of_occupants': 1,
+                    'start_date': f"{2030 + index // 3}-01-01",
+                    'end_date': f"{2030 + index // 3}-06-30",
+                }
+                for index in range(count)
+            ]
+
+        with CaptureQueriesContext(connection) as small:
+            TenancyImportService.import_rows(rows(3), user=self.user)
+        Tenancy.objects.filter(start_date__year__gte=2030).delete()
+        Tenant.objects.filter(email__startswith='inquilino').delete()
+        UnitOccupancy.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as large:
+            result = TenancyImportService.import_rows(rows(60), user=self.user)
+
+        self.assertEqual(result['created'], 60)
+        self.assertEqual(len(large), len(small))
+
+    def test_json_lines_import_refreshes_occupancy_and_allocations(self):
+        """La importación actualiza el calendario y las asignaciones por ocupantes."""
+        for unit, email in zip(self.units[1:], ('ana@test.com', 'luis@test.com')):
+            Tenant.objects.create(name=email, email=email, number_of_occupants=1, unit=unit)
+        ServiceRule.objects.create(
+            property=self.property,
+            service_type=ServiceRule.ServiceType.GAS,
+            rule_type=ServiceRule.RuleType.OCCUPANT_PRORATION
+        )
+        billing_cycle = BillingCycle.objects.create(property=self.property, month=7, year=2024)
+        gas = Expense.objects.create(
+            billing_cycle=billing_cycle,
+            service_type=ServiceRule.ServiceType.GAS,
+            total_amount=Decimal('90.00'),
+            invoice_pdf='invoices/test_invoice.pdf'
+        )
+        lines = [
+            {'unit': self.units[0].pk, 'tenant_email': 'juan@test.com',
+             'number_of_occupants': 1, 'start_date': '2024-01-01'},
+            {'unit': self.units[1].pk, 'tenant_email': 'ana@test.com',
+             'number_of_occupants': 2, 'start_date': '2024-07-01', 'end_date': '2024-07-31'},
+        ]
+
+        response = self.upload('arrendamientos.jsonl', "\n".join(json.dumps(line) for line in lines))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            UnitOccupancy.objects.get(unit=self.units[1], year=2024, month=7).occupant_days,
+            31 * 2
+        )
+        self.assertEqual(
+            list(ExpenseAllocation.objects.filter(expense=gas).order_by('unit_id').values_list('amount', flat=True)),
+            [Decimal('30.00'), Decimal('60.00'), Decimal('0.00')]
+        )
+
+    def test_unreadable_file_returns_400(self):
+        """Un archivo que no se puede interpretar se rechaza."""
+        response = self.upload('arrendamientos.json', '{"unit": 1,')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.upload('arrendamientos.txt', 'unit\n1\n')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('format', response.data)
@@ -1,12 +1,14 @@
 # backend/tenants/tests/test_tenancy_services.py
 
+from calendar import monthrange
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from datetime import date, timedelta
 from properties.models import Property, Unit
-from tenants.models import Tenant, Tenancy
-from tenants.services import TenancyService, TenancyValidationService
+from tenants.models import Tenant, Tenancy, UnitOccupancy
+from tenants.services import OccupancyService, TenancyService, TenancyValidationService
 
 
 class TenancyValidationServiceTestCase(TestCase):
@@ -178,6 +180,67 @@ class TenancyValidationServiceTestCase(TestCase):
         
         self.assertEqual(len(overlapping), 0)
 
+    def test_check_overlapping_tenancies_single_query(self):
+        """
+        Prueba que la verificación se resuelve con una consulta, sin importar el historial.
+        """
+        for month in range(1, 13):
+            Tenancy.objects.create(
+                unit=self.unit,
+                tenant=self.tenant,
+                number_of_occupants=2,
+                start_date=date(2023, month, 1),
+                end_date=date(2023, month, 20)
+            )
+        
+        with self.assertNumQueries(1):
+            overlapping = TenancyValidationService.check_overlapping_tenancies(
+                unit=self.unit,
+                start_date=date(2023, 3, 20),
+                end_date=date(2023, 5, 1)
+            )
+        
+        # Los límites son inclusivos: el 20 de marzo y el 1 de mayo cuentan.
+        self.assertEqual(
+            [tenancy.start_date for tenancy in overlapping],
+            [date(2023, 3, 1), date(2023, 4, 1), date(2023, 5, 1)]
+        )
+        with self.assertNumQueries(1):
+            TenancyValidationService.check_overlapping_tenancies(
+                unit=self.unit, start_date=date(2024, 1, 1)
+            )
+
+    def test_database_rejects_overlapping_tenancies(self):
+        """
+        Prueba que la restricción de exclusión rechaza superposiciones que
+        saltan la validación del servicio.
+        """
+        Tenancy.objects.create(
+            unit=self.unit,
+            tenant=self.tenant,
+            number_of_occupants=2,
+            start_date=self.last_month
+        )
+        other_unit = Unit.objects.create(name="Apto 102", property=self.property)
+        
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Tenancy.objects.create(
+                    unit=self.unit,
+                    tenant=self.tenant,
+                    number_of_occupants=1,
+                    start_date=self.next_week,
+                    end_date=self.next_week
+                )
+        
+        # El mismo período en otra unidad sí se permite.
+        Tenancy.objects.create(
+            unit=other_unit,
+            tenant=self.tenant,
+            number_of_occupants=1,
+            start_date=self.next_week
+        )
+
 
 class TenancyServiceTestCase(TestCase):
     """
@@ -375,4 +438,196 @@ class TenancyServiceTestCase(TestCase):
         self.assertEqual(len(history_list), 2)
         # Debería estar ordenado por start_date descendente
         self.assertEqual(history_list[0], tenancy2)  # Más reciente
-        self.assertEqual(history_list[1], tenancy1)  # Más antiguo
\ No newline at end of file
+        self.assertEqual(history_list[1], tenancy1)  # Más antiguo
+
+class OccupantDaysTestCase(TestCase):
+    """
+    Suite de pruebas para el cálculo de días-ocupante por mes.
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.other_property = Property.objects.create(
+            name="Edificio Norte",
+            address="Calle Norte 456",
+            user=self.user
+        )
+        self.unit1 = Unit.objects.create(name="Apto 101", property=self.property)
+        self.unit2 = Unit.objects.create(name="Apto 102", property=self.property)
+        self.unit3 = Unit.objects.create(name="Apto 201", property=self.other_property)
+        self.tenant = Tenant.objects.create(
+            name="Juan Pérez",
+            email="juan@test.com",
+            number_of_occupants=2,
+            unit=self.unit1
+        )
+
+    def create_tenancy(self, unit, start_date, end_date=None, occupants=2):
+        return Tenancy.objects.create(
+            unit=unit,
+            tenant=self.tenant,
+            number_of_occupants=occupants,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def test_occupant_days_weighs_every_overlapping_tenancy(self):
+        """Los arrendamientos se ponderan por los días que cubren dentro del mes."""
+        # Unidad 1: 2 ocupantes del 1 al 10 (10 días) y 3 ocupantes del 11 en adelante (21 días).
+        self.create_tenancy(self.unit1, date(2024, 5, 1), date(2024, 7, 10), occupants=2)
+        self.create_tenancy(self.unit1, date(2024, 7, 11), occupants=3)
+        # Unidad 2: arrendamiento que termina antes del mes, no cuenta.
+        self.create_tenancy(self.unit2, date(2024, 1, 1), date(2024, 6, 30))
+
+        occupant_days = TenancyService.get_occupant_days([self.property.pk], 2024, 7)
+
+        self.assertEqual(occupant_days, {self.unit1.pk: 10 * 2 + 21 * 3})
+
+    def test_occupant_days_uses_a_single_query_for_many_properties(self):
+        """Todas las propiedades se resuelven con una sola consulta por rango."""
+        self.create_tenancy(self.unit1, date(2024, 2, 1))
+        self.create_tenancy(self.unit2, date(2024, 2, 15), date(2024, 2, 20), occupants=1)
+        self.create_tenancy(self.unit3, date(2023, 12, 1), occupants=4)
+
+        with self.assertNumQueries(1):
+            occupant_days = TenancyService.get_occupant_days(
+                [self.property.pk, self.other_property.pk], 2024, 2
+            )
+
+        # Febrero de 2024 tiene 29 días.
+        self.assertEqual(occupant_days, {
+            self.unit1.pk: 29 * 2,
+            self.unit2.pk: 6,
+            self.unit3.pk: 29 * 4,
+        })
+
+
+class UnitOccupancyTestCase(TestCase):
+    """
+    Suite de pruebas para el calendario de ocupación (UnitOccupancy).
+    """
+
+    def setUp(self):
+        """Configuración inicial para todas las pruebas."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@test.com',
+            password='testpass123'
+        )
+        self.property = Property.objects.create(
+            name="Edificio Central",
+            address="Calle Principal 123",
+            user=self.user
+        )
+        self.other_property = Property.objects.create(
+            name="Edificio Norte",
+            address="Calle Norte 456",
+            user=self.user
+        )
+        self.unit1 = Unit.objects.create(name="Apto 101", property=self.property)
+        self.unit2 = Unit.objects.create(name="Apto 201", property=self.other_property)
+        self.tenant = Tenant.objects.create(
+            name="Juan Pérez",
+            email="juan@test.com",
+            number_of_occupants=2,
+            unit=self.unit1
+        )
+
+    def create_tenancy(self, unit, start_date, end_date=None, occupants=2):
+        return Tenancy.objects.create(
+            unit=unit,
+            tenant=self.tenant,
+            number_of_occupants=occupants,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def months(self, unit):
+        return list(
+            UnitOccupancy.objects.filter(unit=unit).order_by('year', 'month').values_list(
+                'year', 'month', 'occupant_days', 'occupants_at_start', 'tenancy_id'
+            )
+        )
+
+    def test_saving_a_tenancy_fills_its_months(self):
+        """Crear un arrendamiento escribe una fila por mes con los días-ocupante del mes."""
+        first = self.create_tenancy(self.unit1, date(2024, 5, 20), date(2024, 7, 10), occupants=2)
+        second = self.create_tenancy(self.unit1, date(2024, 7, 11), date(2024, 8, 31), occupants=3)
+
+        self.assertEqual(self.months(self.unit1), [
+            (2024, 5, 12 * 2, 0, first.pk),
+            (2024, 6, 30 * 2, 2, first.pk),
+            # En julio el segundo cubre más días y es el arrendamiento principal.
+            (2024, 7, 10 * 2 + 21 * 3, 2, second.pk),
+            (2024, 8, 31 * 3, 3, second.pk),
+        ])
+
+    def test_ending_a_tenancy_removes_the_months_it_no_longer_covers(self):
+        """Acortar un arrendamiento borra los meses que deja de cubrir."""
+        tenancy = self.create_tenancy(self.unit1, date(2024, 1, 1))
+
+        tenancy.end_date = date(2024, 2, 15)
+        tenancy.save()
+
+        self.assertEqual(self.months(self.unit1), [
+            (2024, 1, 31 * 2, 2, tenancy.pk),
+            (2024, 2, 15 * 2, 2, tenancy.pk),
+        ])
+
+    def test_open_tenancy_is_materialized_up_to_the_horizon(self):
+        """Un arrendamiento sin fin se materializa hasta el horizonte y rebuild lo reproduce."""
+        self.create_tenancy(self.unit1, date(2024, 1, 1))
+        expected = self.months(self.unit1)
+        year, month = expected[-1][:2]
+        self.assertEqual(year * 12 + month - 1, OccupancyService.horizon_index())
+
+        UnitOccupancy.objects.all().delete()
+        OccupancyService.rebuild()
+
+        self.assertEqual(self.months(self.unit1), expected)
+
+    def test_occupant_days_reads_the_calendar_in_a_single_query(self):
+        """Los días-ocupante de varias propiedades salen de una sola consulta al calendario."""
+        self.create_tenancy(self.unit1, date(2024, 2, 1), date(2024, 3, 31))
+        self.create_tenancy(self.unit2, date(2024, 2, 15), date(2024, 2, 20), occupants=1)
+
+        with self.assertNumQueries(1):
+            occupant_days = OccupancyService.get_occupant_days(
+                [self.property.pk, self.other_property.pk], 2024, 2
+            )
+
+        self.assertEqual(occupant_days, {self.unit1.pk: 29 * 2, self.unit2.pk: 6})
+        self.assertEqual(
+            occupant_days,
+            TenancyService.get_occupant_days([self.property.pk, self.other_property.pk], 2024, 2)
+        )
+
+    def test_months_past_the_calendar_come_from_the_tenancies(self):
+        """Pasado el horizonte, o sin las filas del último mes, se calcula desde los arrendamientos."""
+        self.create_tenancy(self.unit1, date(2024, 1, 1), occupants=3)
+        self.create_tenancy(self.unit2, date(2024, 1, 1), date(2024, 1, 31))
+        last = UnitOccupancy.objects.filter(unit=self.unit1).order_by('-year', '-month').first()
+        property_ids = [self.property.pk, self.other_property.pk]
+
+        # Dos años después del horizonte no hay filas.
+        self.assertEqual(
+            OccupancyService.get_occupant_days(property_ids, last.year + 2, last.month),
+            {self.unit1.pk: monthrange(last.year + 2, last.month)[1] * 3}
+        )
+
+        # Como si refresh_occupancy no hubiera llegado a ese mes.
+        last.delete()
+        self.assertEqual(
+            OccupancyService.get_occupant_days(property_ids, last.year, last.month),
+            {self.unit1.pk: monthrange(last.year, last.month)[1] * 3}
+        )
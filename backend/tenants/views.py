@@ -3,26 +3,43 @@ from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
+import csv
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
 from properties.models import Unit
 from .models import Tenant, Tenancy
 from .serializers import (
     TenantSerializer, TenancySerializer, TenancyCreateSerializer, 
-    TenancyUpdateSerializer, TenancyEndSerializer
+    TenancyUpdateSerializer, TenancyEndSerializer, TenancyImportSerializer
 )
-from .services import TenancyService, TenancyValidationService
+from .services import TenancyService, TenancyValidationService, TenancyImportService
+from core.pagination import KeysetPagination
+from core.conditional import ConditionalGetMixin
+from core.ownership import OwnedObjectMixin
+from core.async_views import AsyncReadView
 
-class TenantAssignAPIView(generics.CreateAPIView):
+class TenantAssignAPIView(OwnedObjectMixin, generics.CreateAPIView):
     """Asigna un nuevo inquilino a una unidad específica."""
     serializer_class = TenantSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_unit(self):
+        """
+        Obtiene la unidad verificando que pertenece al usuario autenticado.
+        """
+        return self.get_owned_object(
+            Unit.objects.select_related('property'),
+            pk=self.kwargs['unit_pk'],
+            property__user=self.request.user
+        )
+
     def create(self, request, *args, **kwargs):
-        unit_pk = self.kwargs['unit_pk']
         # Seguridad: Verifica que la unidad existe y pertenece al usuario.
-        unit = get_object_or_404(Unit, pk=unit_pk, property__user=request.user)
+        unit = self.get_unit()
         
         # Regla de Negocio: Verifica que la unidad está vacante.
         if hasattr(unit, 'tenant'):
@@ -34,11 +51,10 @@ class TenantAssignAPIView(generics.CreateAPIView):
         return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        unit = Unit.objects.get(pk=self.kwargs['unit_pk'])
-        serializer.save(unit=unit)
+        serializer.save(unit=self.get_unit())
 
 
-class TenancyListCreateAPIView(generics.ListCreateAPIView):
+class TenancyListCreateAPIView(OwnedObjectMixin, ConditionalGetMixin, generics.ListCreateAPIView):
     """
     Vista para listar (GET) y crear (POST) arrendamientos para una unidad específica.
     
@@ -46,14 +62,28 @@ class TenancyListCreateAPIView(generics.ListCreateAPIView):
     POST /api/units/{unit_id}/tenancies/ - Crea nuevo arrendamiento
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-start_date', '-pk')
+
+    def get_conditional_query(self):
+        """La unidad, sus arrendamientos y los inquilinos de esos arrendamientos."""
+        return (
+            Unit.objects.filter(pk=self.kwargs['unit_id'], property__user=self.request.user),
+            dict(
+                updated_at=Max('updated_at'),
+                tenancy_count=Count('tenancies', distinct=True),
+                tenancies_updated_at=Max('tenancies__updated_at'),
+                tenants_updated_at=Max('tenancies__tenant__updated_at'),
+            ),
+        )
 
     def get_unit(self):
         """
         Obtiene la unidad verificando que pertenece al usuario autenticado.
         """
         unit_id = self.kwargs['unit_id']
-        return get_object_or_404(
-            Unit,
+        return self.get_owned_object(
+            Unit.objects.select_related('property'),
             pk=unit_id,
             property__user=self.request.user
         )
@@ -63,7 +93,7 @@ class TenancyListCreateAPIView(generics.ListCreateAPIView):
         Filtra los arrendamientos para la unidad especificada.
         """
         unit = self.get_unit()
-        return Tenancy.objects.filter(unit=unit).order_by('-start_date')
+        return Tenancy.objects.filter(unit=unit).select_related('unit', 'tenant').order_by('-start_date')
 
     def get_serializer_class(self):
         """
@@ -155,6 +185,44 @@ class TenancyListCreateAPIView(generics.ListCreateAPIView):
             )
 
 
+class TenancyImportAPIView(APIView):
+    """
+    Vista para importar arrendamientos en masa desde un archivo CSV o JSON.
+    
+    POST /api/tenancies/import/ - Importa el archivo `file` (multipart)
+    
+    Columnas: unit, tenant_email, tenant_name (solo para inquilinos nuevos),
+    number_of_occupants, start_date y end_date (opcional). Las filas válidas se
+    guardan aunque otras fallen; los errores se devuelven por número de fila.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        serializer = TenancyImportSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = TenancyImportService.iter_rows(
+            serializer.validated_data['file'], serializer.validated_data['format']
+        )
+        try:
+            result = TenancyImportService.import_rows(rows, user=request.user)
+        except (ValueError, csv.Error) as e:
+            return Response(
+                {"error": f"No se pudo leer el archivo: {e}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if result['created']:
+            response_status = status.HTTP_201_CREATED
+        elif result['errors']:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_200_OK
+        return Response(result, status=response_status)
+
+
 class TenancyRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
     """
     Vista para obtener (GET) y actualizar (PUT/PATCH) un arrendamiento específico.
@@ -197,12 +265,27 @@ class TenancyRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
         try:
             # Verificar superposiciones excluyendo el arrendamiento actual
             overlapping = TenancyValidationService.check_overlapping_tenancies(
-                unit=tenancy.unit,
+                unit=tenancy.unit_id,
                 start_date=start_date,
                 end_date=end_date,
                 exclude_tenancy_id=tenancy.pk
             )
             
+            if not overlapping:
+                try:
+                    with transaction.atomic():
+                        serializer.save()
+                except IntegrityError:
+                    # La restricción de exclusión rechazó un cambio concurrente.
+                    overlapping = TenancyValidationService.check_overlapping_tenancies(
+                        unit=tenancy.unit_id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        exclude_tenancy_id=tenancy.pk
+                    )
+                    if not overlapping:
+                        raise
+
             if overlapping:
                 overlapping_desc = overlapping[0]
                 return Response(
@@ -213,8 +296,6 @@ class TenancyRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
                     },
                     status=status.HTTP_409_CONFLICT
                 )
-
-            serializer.save()
             
             # Responder con el serializer de lectura
             response_serializer = TenancySerializer(tenancy)
@@ -232,7 +313,7 @@ class TenancyRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
             )
 
 
-class TenancyEndAPIView(generics.UpdateAPIView):
+class TenancyEndAPIView(OwnedObjectMixin, generics.UpdateAPIView):
     """
     Vista específica para finalizar un arrendamiento.
     
@@ -294,7 +375,7 @@ class TenancyEndAPIView(generics.UpdateAPIView):
             )
 
 
-class PropertyTenantsAPIView(generics.ListCreateAPIView):
+class PropertyTenantsAPIView(OwnedObjectMixin, generics.ListCreateAPIView):
     """
     Vista para gestionar inquilinos independientes por propiedad.
     
@@ -310,8 +391,8 @@ class PropertyTenantsAPIView(generics.ListCreateAPIView):
         """
         property_id = self.kwargs['property_id']
         from properties.models import Property
-        return get_object_or_404(
-            Property,
+        return self.get_owned_object(
+            Property.objects.all(),
             pk=property_id,
             user=self.request.user
         )
@@ -374,4 +455,22 @@ class AvailableTenantsAPIView(APIView):
             return Response(
                 {"error": "Error al obtener inquilinos disponibles."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+            )
+
+
+# ----------------------------------------------------------------------
+# Camino de lectura asíncrono (core/async_views.py, rutas en core/asgi_urls.py)
+# ----------------------------------------------------------------------
+
+class TenancyListCreateAsyncView(AsyncReadView):
+    """GET /api/units/{unit_id}/tenancies/ bajo ASGI; POST lo atiende TenancyListCreateAPIView."""
+    sync_view = TenancyListCreateAPIView
+
+    async def get_data(self):
+        unit = await self.aget_owned_object(
+            Unit.objects.select_related('property'),
+            pk=self.kwargs['unit_id'],
+            property__user=self.request.user
+        )
+        queryset = Tenancy.objects.filter(unit=unit).select_related('unit', 'tenant').order_by('-start_date')
+        return await self.list_data(queryset, self.view.get_serializer_class())
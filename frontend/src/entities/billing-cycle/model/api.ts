@@ -3,7 +3,7 @@ import { IBillingCycle, ICreateBillingCycle } from './types';
 
 // Obtener lista de ciclos de facturación para una propiedad
 export const getBillingCycles = (propertyId: string): Promise<IBillingCycle[]> => {
-  return httpClient.get<IBillingCycle[]>(`/api/properties/${propertyId}/billing-cycles/`);
+  return httpClient.getAll<IBillingCycle>(`/api/properties/${propertyId}/billing-cycles/`);
 };
 
 // Crear un nuevo ciclo de facturación
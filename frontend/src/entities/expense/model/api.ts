@@ -5,7 +5,7 @@ import { Expense, ExpenseCreateData } from './types';
 
 export const expenseApi = {
   getExpenses: async (cycleId: string): Promise<Expense[]> => {
-    return httpClient.get(`/api/billing-cycles/${cycleId}/expenses/`);
+    return httpClient.getAll<Expense>(`/api/billing-cycles/${cycleId}/expenses/`);
   },
 
   createExpense: async (cycleId: string, data: ExpenseCreateData): Promise<Expense> => {
@@ -14,10 +14,9 @@ export const tenancyApi = {
   getByUnit: async (unitId: number): Promise<Tenancy[]> => {
     console.log('Fetching tenancies for unit:', unitId);
     try {
-      const response = await httpClient.get(`/api/units/${unitId}/tenancies/`);
-      console.log('Tenancies response:', response);
-      // Asegurar que siempre retornamos un array
-      return response.data || [];
+      const tenancies = await httpClient.getAll<Tenancy>(`/api/units/${unitId}/tenancies/`);
+      console.log('Tenancies response:', tenancies);
+      return tenancies;
     } catch (error) {
       console.error('Error fetching tenancies:', error);
       throw error;
@@ -2,5 +2,5 @@ import { IPropertyListItem } from '@/entities/property/model/types';
 import { httpClient } from '@/shared/lib/http-client';
 
 export const getPropertiesList = async (): Promise<IPropertyListItem[]> => {
-  return httpClient.get<IPropertyListItem[]>('/api/properties/');
+  return httpClient.getAll<IPropertyListItem>('/api/properties/');
 };
\ No newline at end of file
@@ -3,5 +3,5 @@ import { IRule } from '@/entities/rule/model/types';
 
 export const getRulesForProperty = (propertyId: string): Promise<IRule[]> => {
   // El httpClient se encarga de añadir el token y manejar los errores.
-  return httpClient.get<IRule[]>(`/api/properties/${propertyId}/rules/`);
+  return httpClient.getAll<IRule>(`/api/properties/${propertyId}/rules/`);
 };
\ No newline at end of file
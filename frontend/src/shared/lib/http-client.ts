@@ -25,6 +25,13 @@ export const isTokenExpiredError = (error: unknown): error is TokenExpiredError
   );
 };
 
+// Cursor-paginated list page returned by the API list endpoints
+export interface IPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
 export class ApiError extends Error {
   constructor(
     message: string,
@@ -133,7 +140,20 @@ export const createHttpClient = () => {
   const del = <T = unknown>(url: string, options?: RequestInit): Promise<T> => 
     request<T>(url, { ...options, method: 'DELETE' });
 
-  return { request, get, post, put, delete: del };
+  // Fetch every page of a paginated list by following the `next` links
+  const getAll = async <T = unknown>(url: string, options?: RequestInit): Promise<T[]> => {
+    const items: T[] = [];
+    let next: string | null = url;
+    while (next) {
+      const page: IPage<T> = await get<IPage<T>>(next, options);
+      items.push(...page.results);
+      // The API returns absolute links; keep path and query so requests stay on this origin
+      next = page.next ? (({ pathname, search }) => pathname + search)(new URL(page.next)) : null;
+    }
+    return items;
+  };
+
+  return { request, get, getAll, post, put, delete: del };
 };
 
 // Global HTTP client instance